@@ -4,12 +4,13 @@ import logging
 import os
 import random
 import time
-import threading
 import uuid
 from enum import Enum, auto
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+from src.feature_core.app.background_executor import get_background_executor
+
 if TYPE_CHECKING:
     from src.ai.behavior_manager import BehaviorManager
 
@@ -140,7 +141,7 @@ class GameRecommendationSubState(AISubState):
         manager._active_game_recommendation_request_id = request_id
 
         # Start async task
-        threading.Thread(target=self._run_async_task, args=(manager, request_id), daemon=True).start()
+        get_background_executor().submit("llm", self._run_async_task, manager, request_id, name="game_recommendation")
 
     def _run_async_task(self, manager: 'BehaviorManager', request_id: str):
         try:
@@ -155,13 +156,13 @@ class GameRecommendationSubState(AISubState):
             playtime_forever = game.get("playtime_forever", 0) / 60.0 # hours
             playtime_2weeks = game.get("playtime_2weeks", 0) / 60.0 # hours
             
-            # 3. Get Description (using SteamClient via a temporary instance or helper)
+            # 3. Get Description（经由共享元数据缓存，命中时不发起任何请求）
             from src.feature_core.adapters.http.steam_client import SteamClient
             api_key = manager.steam_manager.config.get("steam_api_key")
             if not api_key:
                 return
-                
-            client = SteamClient(api_key)
+
+            client = SteamClient(api_key, app_metadata=getattr(manager.steam_manager, "app_metadata", None))
             app_info_map = client.get_apps_info([appid])
             app_info = app_info_map.get(str(appid), {})
             short_description = app_info.get("short_description", "")
@@ -282,7 +283,7 @@ class NewsPushSubState(AISubState):
         request_id = uuid.uuid4().hex
         manager._active_news_push_request_id = request_id
 
-        threading.Thread(target=self._run_async_task, args=(manager, request_id, items), daemon=True).start()
+        get_background_executor().submit("llm", self._run_async_task, manager, request_id, items, name="news_push")
 
     def _run_async_task(self, manager: 'BehaviorManager', request_id: str, items: list[dict]):
         try:
@@ -369,7 +370,7 @@ class FreeGamePushSubState(AISubState):
         request_id = uuid.uuid4().hex
         manager._active_free_game_push_request_id = request_id
 
-        threading.Thread(target=self._run_async_task, args=(manager, request_id, items), daemon=True).start()
+        get_background_executor().submit("llm", self._run_async_task, manager, request_id, items, name="free_game_push")
 
     def _run_async_task(self, manager: 'BehaviorManager', request_id: str, items: list[dict]):
         try:
@@ -460,7 +461,7 @@ class DiscountPushSubState(AISubState):
         request_id = uuid.uuid4().hex
         manager._active_discount_push_request_id = request_id
 
-        threading.Thread(target=self._run_async_task, args=(manager, request_id, items), daemon=True).start()
+        get_background_executor().submit("llm", self._run_async_task, manager, request_id, items, name="discount_push")
 
     def _run_async_task(self, manager: 'BehaviorManager', request_id: str, items: list[dict]):
         try:
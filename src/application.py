@@ -1,5 +1,6 @@
 import logging
 
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QApplication, QSystemTrayIcon
 from src.ui.pet.pet import DesktopPet
 from src.ui.widgets.timer_overlay import TimerOverlay
@@ -11,9 +12,19 @@ from src.feature_core.adapters.qt.steam_facade_qt import SteamFacadeQt
 from src.feature_core.adapters.qt.timer_facade_qt import TimerFacadeQt
 from src.feature_core.adapters.qt.game_news_facade_qt import GameNewsFacadeQt
 from src.feature_core.adapters.qt.epic_free_games_facade_qt import EpicFreeGamesFacadeQt
+from src.feature_core.adapters.qt.write_behind_repository_qt import DEFAULT_SAVE_DEBOUNCE_MS, WriteBehindRepositoryQt
 from src.storage.steam_repository import SteamRepository
+from src.storage.sqlite_steam_repository import SqliteSteamRepository
+from src.storage.app_metadata_repository import AppMetadataRepository
+from src.storage.app_catalog_repository import AppCatalogRepository
+from src.feature_core.services.steam.app_catalog_service import SteamAppCatalogService
+from src.feature_core.services.steam.app_metadata_service import SteamAppMetadataService
 from src.feature_core.adapters.qt.steam_task_service_qt import SteamTaskServiceQt
+from src.feature_core.adapters.qt.steam_task_service_async_qt import SteamTaskServiceAsyncQt
+from src.feature_core.adapters.http.rate_limiter import get_rate_limiter_registry
+from src.feature_core.adapters.http.resilience import get_circuit_breaker_registry
 from src.feature_core.app.action_bus import ActionBus
+from src.feature_core.app.background_executor import get_background_executor
 from src.feature_core.app.actions import Action
 from src.feature_core.app.ui_intents_qt import UiIntentsQt
 from src.storage.resource_manager import ResourceManager
@@ -36,7 +47,7 @@ from src.feature_core.services.llm_service import LLMService
 from src.storage.prompt_manager import PromptManager
 from src.feature_core.adapters.qt.say_hello_facade_qt import SayHelloFacadeQt
 from src.feature_core.services.steam.launcher_service import SteamLauncherService
-import threading
+from src.feature_core.services.steam.task_priority import PRIORITY_BACKGROUND
 
 
 logger = logging.getLogger(__name__)
@@ -50,13 +61,53 @@ class SteaMissApp:
         self.behavior_manager = BehaviorManager()
         self.resource_manager = ResourceManager()
         self.timer_handler = TimerFacadeQt(config_manager=self.config_manager)
+        # 应用级后台执行器：新闻/Epic/LLM 等非 Steam 任务按通道限流（Steam 任务有自己的调度服务）
+        self.background_executor = get_background_executor()
+        self.background_executor.configure(self.config_manager.get("background_lanes"))
+        rate_limiter = get_rate_limiter_registry()
+        rate_limiter.configure(self.config_manager.get("steam_rate_limits"))
+        app_metadata = SteamAppMetadataService(AppMetadataRepository())
+        self.app_metadata = app_metadata
+        app_catalog = SteamAppCatalogService(AppCatalogRepository())
+        circuit_breakers = get_circuit_breaker_registry()
+        steam_task_options = dict(
+            rate_limiter=rate_limiter,
+            achievement_concurrency=self.config_manager.get("steam_achievement_concurrency", 4),
+            app_metadata=app_metadata,
+            app_catalog=app_catalog,
+            circuit_breakers=circuit_breakers,
+        )
+        if self.config_manager.get("steam_task_backend") == "asyncio":
+            self.steam_task_service = SteamTaskServiceAsyncQt(**steam_task_options)
+        else:
+            self.steam_task_service = SteamTaskServiceQt(
+                pool_size=self.config_manager.get("steam_task_pool_size", 4), **steam_task_options
+            )
+        # game_data.json 延迟写：去抖合并多次保存，后台原子写盘，退出时 flush
+        # "sqlite" 后端按表增量写入（首次启动从 game_data.json 导入），默认仍为单个 JSON 文档
+        if self.config_manager.get("steam_storage_backend") == "sqlite":
+            storage = SqliteSteamRepository()
+        else:
+            storage = SteamRepository()
+        self.steam_repository = WriteBehindRepositoryQt(
+            storage,
+            executor=self.background_executor,
+            debounce_ms=self.config_manager.get("game_data_save_debounce_ms", DEFAULT_SAVE_DEBOUNCE_MS),
+        )
         self.steam_manager = SteamFacadeQt(
             self.config_manager,
-            repository=SteamRepository(),
-            task_service=SteamTaskServiceQt(),
+            repository=self.steam_repository,
+            task_service=self.steam_task_service,
+            app_metadata=app_metadata,
+            app_catalog=app_catalog,
+            circuit_breakers=circuit_breakers,
+        )
+        self.news_manager = GameNewsFacadeQt(
+            executor=self.background_executor, refresh_scheduler=self.steam_manager.refresh_scheduler
+        )
+        self.epic_manager = EpicFreeGamesFacadeQt(
+            steam_manager=self.steam_manager, cache_key="free_game", executor=self.background_executor
         )
-        self.news_manager = GameNewsFacadeQt()
-        self.epic_manager = EpicFreeGamesFacadeQt(steam_manager=self.steam_manager, cache_key="free_game")
         self.llm_service = LLMService(self.config_manager)
         self.prompt_manager = PromptManager()
 
@@ -78,6 +129,7 @@ class SteaMissApp:
             llm_service=self.llm_service,
             prompt_manager=self.prompt_manager,
             steam_manager=self.steam_manager,
+            executor=self.background_executor,
         )
 
         def _emit_error(e: Exception, action: Action, kwargs: dict) -> None:
@@ -198,6 +250,16 @@ class SteaMissApp:
         self.timer_handler.set_notifier(self.tray_handler.show_message)
         # 退出时关闭计时器内部 Qt 定时器
         self.app.aboutToQuit.connect(self.timer_handler.shutdown)
+        # 退出时排空 Steam 后台任务（丢弃排队任务，短暂等待运行中的任务）
+        self.app.aboutToQuit.connect(self.steam_task_service.shutdown)
+        # 退出时撤销排队的后台任务，短暂等待运行中的任务
+        self.app.aboutToQuit.connect(self.background_executor.shutdown)
+        # 退出时补存批量作业的最后一批进度，下次启动从断点续传
+        self.app.aboutToQuit.connect(lambda: self.steam_manager.save_checkpoint(force=True))
+        # 最后同步写出尚未落盘的缓存（须在上面所有可能保存的退出回调之后）
+        self.app.aboutToQuit.connect(self.steam_repository.flush)
+        # 应用元数据按间隔批量落盘：退出时补写最后一批
+        self.app.aboutToQuit.connect(self.app_metadata.flush)
 
         # 初始化 TimerOverlay (View Helper)
         self.timer_overlay = TimerOverlay(self.timer_handler)
@@ -249,8 +311,27 @@ class SteaMissApp:
             lambda t, m: self.tray_handler.show_message(t, m, QSystemTrayIcon.MessageIcon.Warning, 3000)
         )
 
+        # 后台定时检查数据是否过期：只刷新超过 TTL 的数据
+        self.refresh_timer = QTimer()
+        self.refresh_timer.setInterval(max(60, int(self.config_manager.get("refresh_check_interval_seconds", 900))) * 1000)
+        self.refresh_timer.timeout.connect(self._refresh_stale_data)
+        self.refresh_timer.start()
+        self.app.aboutToQuit.connect(self.refresh_timer.stop)
+
         # 启动时异步检查 LLM 可用性
-        threading.Thread(target=self._check_llm_startup, daemon=True).start()
+        self.background_executor.submit("llm", self._check_llm_startup, name="llm_startup_check")
+
+    def _refresh_stale_data(self):
+        """定时器回调：Steam（愿望单仅在已有缓存时）、Epic、新闻各自按 TTL 判断是否需要刷新。"""
+        kinds = ["summary", "games"]
+        if "wishlist" in self.steam_manager.cache:
+            kinds.append("wishlist")
+        try:
+            self.steam_manager.refresh_stale(kinds, priority=PRIORITY_BACKGROUND)
+            self.epic_manager.refresh_if_stale()
+            self.news_manager.refresh_if_stale()
+        except Exception:
+            logger.exception("Background refresh failed")
 
     def _check_llm_startup(self):
         """启动时检查 LLM 服务，如果配置了但不可用，则通知用户"""
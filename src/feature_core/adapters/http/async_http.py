@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import ssl
+import zlib
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlencode, urljoin, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from src.feature_core.adapters.http.base_urls import BaseUrlOverrides, get_base_url_overrides
+
+
+logger = logging.getLogger(__name__)
+
+
+_DEFAULT_USER_AGENT = "SteaMiss/1.0 (+asyncio)"
+# 单个请求最多跟随的重定向次数（超过时抛出 TooManyRedirects）
+DEFAULT_MAX_REDIRECTS = 5
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+
+class AsyncResponse:
+    """与 requests.Response 常用属性保持一致的最小响应对象。"""
+
+    def __init__(self, url: str, status_code: int, reason: str, headers: CaseInsensitiveDict, content: bytes) -> None:
+        self.url = url
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", "replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content.decode("utf-8"))
+
+    def raise_for_status(self) -> None:
+        if 400 <= self.status_code:
+            raise requests.exceptions.HTTPError(f"{self.status_code} {self.reason} for url: {self.url}", response=self)
+
+
+_ConnKey = Tuple[str, int, bool]
+_Conn = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class AsyncHttpClient:
+    """
+    基于 asyncio streams 的 HTTP/1.1 客户端（仅标准库）：
+    - 按 (host, port, tls) 复用 keep-alive 连接，并限制每个 host 的并发连接数
+    - 支持 Content-Length / chunked / 读到 EOF 三种响应体，gzip/deflate 解压
+    - 网络异常映射为 requests 的异常类型，便于复用重试/熔断策略
+    - 跟随 301/302/303/307/308 重定向（最多 max_redirects 次，超过时抛出 requests 的 TooManyRedirects）；
+      301/302/303 之后按 GET 重新请求
+    - 必须在同一个事件循环中使用；不处理代理
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections_per_host: int = 8,
+        user_agent: str = _DEFAULT_USER_AGENT,
+        base_urls: Optional[BaseUrlOverrides] = None,
+        max_redirects: int = DEFAULT_MAX_REDIRECTS,
+    ) -> None:
+        self._max_per_host = max(1, int(max_connections_per_host))
+        self._max_redirects = max(0, int(max_redirects))
+        self._base_urls = base_urls or get_base_url_overrides()
+        self._user_agent = user_agent
+        self._idle: Dict[_ConnKey, List[_Conn]] = {}
+        self._slots: Dict[_ConnKey, asyncio.Semaphore] = {}
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        self._stats = {"requests": 0, "new_connections": 0, "reused_connections": 0}
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._stats)
+
+    async def get(
+        self,
+        url: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: float = 10.0,
+    ) -> AsyncResponse:
+        return await self.request("GET", url, params=params, headers=headers, timeout=timeout)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: float = 10.0,
+    ) -> AsyncResponse:
+        response = await self._request_once(method, url, params, headers, timeout)
+        redirects = 0
+        while response.status_code in _REDIRECT_STATUSES and response.headers.get("Location"):
+            if redirects >= self._max_redirects:
+                raise requests.exceptions.TooManyRedirects(
+                    f"Exceeded {self._max_redirects} redirects: {url}", response=response
+                )
+            redirects += 1
+            if response.status_code in (301, 302, 303) and method.upper() != "HEAD":
+                method = "GET"
+            # Location 已包含完整查询串，不再追加 params
+            url, params = urljoin(response.url, response.headers["Location"]), None
+            response = await self._request_once(method, url, params, headers, timeout)
+        return response
+
+    async def _request_once(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        headers: Optional[Mapping[str, str]],
+        timeout: float,
+    ) -> AsyncResponse:
+        parts = urlsplit(self._base_urls.rewrite(url))
+        tls = parts.scheme == "https"
+        host = parts.hostname or ""
+        port = parts.port or (443 if tls else 80)
+        key: _ConnKey = (host, port, tls)
+
+        target = parts.path or "/"
+        query = "&".join(q for q in (parts.query, _encode_params(params)) if q)
+        if query:
+            target = f"{target}?{query}"
+        full_url = f"{parts.scheme}://{parts.netloc}{target}"
+
+        head = [
+            f"{method.upper()} {target} HTTP/1.1",
+            f"Host: {parts.netloc}",
+            f"User-Agent: {self._user_agent}",
+            "Accept: */*",
+            "Accept-Encoding: gzip, deflate",
+            "Connection: keep-alive",
+        ]
+        for name, value in (headers or {}).items():
+            if name.lower() in ("host", "connection", "accept-encoding"):
+                continue
+            head.append(f"{name}: {value}")
+        payload = ("\r\n".join(head) + "\r\n\r\n").encode("latin-1")
+
+        slot = self._slots.setdefault(key, asyncio.Semaphore(self._max_per_host))
+        async with slot:
+            self._stats["requests"] += 1
+            try:
+                return await asyncio.wait_for(self._exchange(key, payload, method, full_url), timeout)
+            except asyncio.TimeoutError as e:
+                raise requests.exceptions.ReadTimeout(f"Read timed out ({timeout}s): {full_url}") from e
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for _, writer in conns:
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except Exception:
+                    logger.debug("AsyncHttpClient failed to close connection", exc_info=True)
+
+    # ---- internals ----
+
+    async def _exchange(self, key: _ConnKey, payload: bytes, method: str, url: str) -> AsyncResponse:
+        # 复用的空闲连接可能已被服务端关闭：在尚未读到任何字节时换新连接重试一次
+        conn, reused = await self._checkout(key)
+        try:
+            return await self._send(key, conn, payload, method, url)
+        except (ConnectionError, asyncio.IncompleteReadError, _EmptyResponse) as e:
+            self._discard(conn)
+            if not reused:
+                raise requests.exceptions.ConnectionError(f"Connection aborted: {url}: {e!r}") from e
+        except BaseException:
+            self._discard(conn)
+            raise
+
+        conn = await self._open(key)
+        try:
+            return await self._send(key, conn, payload, method, url)
+        except (ConnectionError, asyncio.IncompleteReadError, _EmptyResponse) as e:
+            self._discard(conn)
+            raise requests.exceptions.ConnectionError(f"Connection aborted: {url}: {e!r}") from e
+        except BaseException:
+            self._discard(conn)
+            raise
+
+    async def _send(self, key: _ConnKey, conn: _Conn, payload: bytes, method: str, url: str) -> AsyncResponse:
+        reader, writer = conn
+        writer.write(payload)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise _EmptyResponse()
+        version, status_code, reason = _parse_status_line(status_line)
+
+        headers: CaseInsensitiveDict = CaseInsensitiveDict()
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip()] = value.strip()
+
+        keep_alive = version != "HTTP/1.0" and headers.get("Connection", "").lower() != "close"
+        if method.upper() == "HEAD" or status_code in (204, 304) or 100 <= status_code < 200:
+            body = b""
+        elif "chunked" in headers.get("Transfer-Encoding", "").lower():
+            body = await _read_chunked(reader)
+        elif "Content-Length" in headers:
+            body = await reader.readexactly(int(headers["Content-Length"]))
+        else:
+            body = await reader.read()
+            keep_alive = False
+
+        body = _decode_body(body, headers.get("Content-Encoding", ""))
+        if keep_alive:
+            self._idle.setdefault(key, []).append(conn)
+        else:
+            self._discard(conn)
+        return AsyncResponse(url, status_code, reason, headers, body)
+
+    async def _checkout(self, key: _ConnKey) -> Tuple[_Conn, bool]:
+        idle = self._idle.get(key)
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                self._stats["reused_connections"] += 1
+                return (reader, writer), True
+            self._discard((reader, writer))
+        return await self._open(key), False
+
+    async def _open(self, key: _ConnKey) -> _Conn:
+        host, port, tls = key
+        try:
+            conn = await asyncio.open_connection(host, port, ssl=self._ssl() if tls else None)
+        except OSError as e:
+            raise requests.exceptions.ConnectionError(f"Failed to establish a new connection: {host}:{port}: {e!r}") from e
+        self._stats["new_connections"] += 1
+        return conn
+
+    def _ssl(self) -> ssl.SSLContext:
+        if self._ssl_context is None:
+            self._ssl_context = ssl.create_default_context()
+        return self._ssl_context
+
+    @staticmethod
+    def _discard(conn: _Conn) -> None:
+        try:
+            conn[1].close()
+        except Exception:
+            logger.debug("AsyncHttpClient failed to close connection", exc_info=True)
+
+
+class _EmptyResponse(Exception):
+    """服务端在返回任何字节前关闭了连接（常见于复用过期的 keep-alive 连接）。"""
+
+
+def _encode_params(params: Optional[Mapping[str, Any]]) -> str:
+    if not params:
+        return ""
+    items = []
+    for name, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            value = str(value).lower()
+        if isinstance(value, (list, tuple)):
+            items.extend((name, v) for v in value)
+        else:
+            items.append((name, value))
+    return urlencode(items)
+
+
+def _parse_status_line(line: bytes) -> Tuple[str, int, str]:
+    text = line.decode("latin-1").strip()
+    parts = text.split(" ", 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+        raise requests.exceptions.ConnectionError(f"Invalid HTTP status line: {text!r}")
+    return parts[0], int(parts[1]), parts[2] if len(parts) > 2 else ""
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    chunks = []
+    while True:
+        size_line = await reader.readline()
+        size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+        if size == 0:
+            # 丢弃 trailer 直到空行
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
+
+
+def _decode_body(body: bytes, encoding: str) -> bytes:
+    encoding = (encoding or "").lower()
+    if not body:
+        return body
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+__all__ = ["DEFAULT_MAX_REDIRECTS", "AsyncHttpClient", "AsyncResponse"]
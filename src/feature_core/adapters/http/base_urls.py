@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from typing import Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+
+logger = logging.getLogger(__name__)
+
+
+# 环境变量：JSON 映射 {"https://api.steampowered.com": "http://127.0.0.1:8765/api.steampowered.com", ...}
+ENV_BASE_URL_OVERRIDES = "STEAMISS_BASE_URL_OVERRIDES"
+# 环境变量：本地替身服务地址；设置后所有已知上游都改写为 {stand_in}/{host}
+ENV_STAND_IN = "STEAMISS_STAND_IN"
+
+# 各网络客户端会访问的上游（替身服务按首段路径的 host 分发）
+KNOWN_ORIGINS = (
+    "https://api.steampowered.com",
+    "https://store.steampowered.com",
+    "https://steamcommunity.com",
+    "https://store-site-backend-static-ipv4.ak.epicgames.com",
+)
+
+
+class BaseUrlOverrides:
+    """
+    上游地址改写表（线程安全）：origin（scheme://host[:port]）-> 替换前缀。
+    只改写请求实际发往的地址；限速/熔断等仍按原始 URL 的 host 统计。
+    """
+
+    def __init__(self, mapping: Optional[Mapping[str, str]] = None) -> None:
+        self._lock = threading.Lock()
+        self._mapping: Dict[str, str] = {}
+        self.update(mapping or {})
+
+    def update(self, mapping: Mapping[str, str]) -> None:
+        with self._lock:
+            for origin, base in mapping.items():
+                if origin and base:
+                    self._mapping[_origin_of(origin)] = str(base).rstrip("/")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._mapping.clear()
+
+    def snapshot(self) -> Dict[str, str]:
+        with self._lock:
+            return dict(self._mapping)
+
+    def rewrite(self, url: str) -> str:
+        with self._lock:
+            if not self._mapping:
+                return url
+            base = self._mapping.get(_origin_of(url))
+        if base is None:
+            return url
+        parts = urlsplit(url)
+        rest = parts.path or "/"
+        if parts.query:
+            rest = f"{rest}?{parts.query}"
+        return f"{base}{rest}"
+
+
+def stand_in_overrides(stand_in_base: str, origins=KNOWN_ORIGINS) -> Dict[str, str]:
+    """把给定上游全部指向同一个替身服务：{origin: f"{stand_in}/{host}"}。"""
+    base = stand_in_base.rstrip("/")
+    return {origin: f"{base}/{urlsplit(origin).netloc}" for origin in origins}
+
+
+def host_of(url_or_host: str) -> str:
+    """URL 或裸 host -> 小写的 host[:port]（连接池、熔断器等按此分组）。"""
+    value = (url_or_host or "").strip()
+    if "://" in value:
+        return (urlsplit(value).netloc or "").lower()
+    return value.lower()
+
+
+def _origin_of(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+def _from_environment() -> Dict[str, str]:
+    mapping: Dict[str, str] = {}
+    stand_in = os.environ.get(ENV_STAND_IN, "").strip()
+    if stand_in:
+        mapping.update(stand_in_overrides(stand_in))
+    raw = os.environ.get(ENV_BASE_URL_OVERRIDES, "").strip()
+    if raw:
+        try:
+            mapping.update({str(k): str(v) for k, v in json.loads(raw).items()})
+        except Exception:
+            logger.exception("Invalid %s (expected JSON object)", ENV_BASE_URL_OVERRIDES)
+    if mapping:
+        logger.warning("HTTP base URL overrides active: %s", mapping)
+    return mapping
+
+
+_shared_overrides: Optional[BaseUrlOverrides] = None
+_shared_lock = threading.Lock()
+
+
+def get_base_url_overrides() -> BaseUrlOverrides:
+    """获取进程级共享的地址改写表（懒加载，初始值来自环境变量）。"""
+    global _shared_overrides
+    with _shared_lock:
+        if _shared_overrides is None:
+            _shared_overrides = BaseUrlOverrides(_from_environment())
+        return _shared_overrides
+
+
+__all__ = [
+    "BaseUrlOverrides",
+    "ENV_BASE_URL_OVERRIDES",
+    "ENV_STAND_IN",
+    "KNOWN_ORIGINS",
+    "get_base_url_overrides",
+    "host_of",
+    "stand_in_overrides",
+]
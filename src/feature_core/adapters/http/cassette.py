@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl
+
+
+logger = logging.getLogger(__name__)
+
+
+CASSETTE_VERSION = 1
+# 录制时脱敏、匹配时忽略的查询参数
+REDACTED_PARAMS = frozenset({"key", "access_token", "webapi_key"})
+REDACTED_VALUE = "REDACTED"
+# 回放时保留的响应头（其余如 Content-Length/Encoding 由替身服务重新生成）
+KEPT_RESPONSE_HEADERS = ("Content-Type", "Retry-After", "Cache-Control", "Last-Modified", "ETag")
+
+
+class Interaction:
+    """一次录制的请求/响应。"""
+
+    __slots__ = ("method", "host", "path", "query", "body_sha1", "status", "headers", "body")
+
+    def __init__(
+        self,
+        method: str,
+        host: str,
+        path: str,
+        query: Sequence[Tuple[str, str]],
+        status: int,
+        headers: Mapping[str, str],
+        body: bytes,
+        body_sha1: Optional[str] = None,
+    ) -> None:
+        self.method = method.upper()
+        self.host = host.lower()
+        self.path = path or "/"
+        self.query = [(k, REDACTED_VALUE if k in REDACTED_PARAMS else v) for k, v in query]
+        self.body_sha1 = body_sha1
+        self.status = int(status)
+        self.headers = {k: v for k, v in headers.items() if k in KEPT_RESPONSE_HEADERS}
+        self.body = body
+
+    def key(self, *, with_body: bool = True) -> Tuple[Any, ...]:
+        query = tuple(sorted((k, v) for k, v in self.query if k not in REDACTED_PARAMS))
+        return (self.method, self.host, self.path, query, self.body_sha1 if with_body else None)
+
+    def to_json(self) -> Dict[str, Any]:
+        try:
+            body, encoding = self.body.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(self.body).decode("ascii"), "base64"
+        return {
+            "request": {
+                "method": self.method,
+                "host": self.host,
+                "path": self.path,
+                "query": [list(item) for item in self.query],
+                "body_sha1": self.body_sha1,
+            },
+            "response": {"status": self.status, "headers": self.headers, "body": body, "encoding": encoding},
+        }
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> "Interaction":
+        req = data.get("request") or {}
+        resp = data.get("response") or {}
+        raw = resp.get("body") or ""
+        body = base64.b64decode(raw) if resp.get("encoding") == "base64" else raw.encode("utf-8")
+        return cls(
+            req.get("method", "GET"),
+            req.get("host", ""),
+            req.get("path", "/"),
+            [tuple(item) for item in req.get("query") or []],
+            resp.get("status", 200),
+            resp.get("headers") or {},
+            body,
+            body_sha1=req.get("body_sha1"),
+        )
+
+
+class Cassette:
+    """
+    录制文件（JSON）：按 (method, host, path, query, body 摘要) 匹配。
+    - 同一请求录到多次时按顺序依次回放，用完后重复最后一条
+    - 带请求体的请求（如 LLM）找不到完全匹配时退回忽略请求体的匹配
+    """
+
+    def __init__(self, path: Optional[str] = None, interactions: Optional[List[Interaction]] = None) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._interactions: List[Interaction] = list(interactions or [])
+        self._cursors: Dict[Tuple[Any, ...], int] = {}
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        if not os.path.exists(path):
+            return cls(path)
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version: {data.get('version')!r}")
+        return cls(path, [Interaction.from_json(item) for item in data.get("interactions") or []])
+
+    def save(self, path: Optional[str] = None) -> None:
+        target = path or self.path
+        if not target:
+            raise ValueError("Cassette has no path")
+        with self._lock:
+            payload = {"version": CASSETTE_VERSION, "interactions": [i.to_json() for i in self._interactions]}
+        directory = os.path.dirname(target)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = f"{target}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, target)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._interactions)
+
+    def record(self, interaction: Interaction) -> None:
+        with self._lock:
+            self._interactions.append(interaction)
+
+    def match(self, method: str, host: str, path: str, query_string: str, body: bytes = b"") -> Optional[Interaction]:
+        probe = Interaction(method, host, path, parse_qsl(query_string, keep_blank_values=True), 0, {}, b"", body_sha1(body))
+        with self._lock:
+            for with_body in (True, False):
+                key = probe.key(with_body=with_body)
+                candidates = [i for i in self._interactions if i.key(with_body=with_body) == key]
+                if candidates:
+                    index = self._cursors.get(key, 0)
+                    self._cursors[key] = index + 1
+                    return candidates[min(index, len(candidates) - 1)]
+                if probe.body_sha1 is None:
+                    break
+        return None
+
+
+def body_sha1(body: bytes) -> Optional[str]:
+    return hashlib.sha1(body).hexdigest() if body else None
+
+
+__all__ = ["CASSETTE_VERSION", "Cassette", "Interaction", "REDACTED_PARAMS", "body_sha1"]
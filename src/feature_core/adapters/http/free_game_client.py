@@ -9,6 +9,8 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Optional
 
+from src.feature_core.adapters.http.base_urls import BaseUrlOverrides, get_base_url_overrides
+
 
 @dataclass(frozen=True)
 class EpicPromotionWindow:
@@ -54,10 +56,12 @@ class EpicFreeGamesClient:
 		user_agent: str = "SteaMiss/1.0 (+https://example.invalid)",
 		timeout_s: float = 10.0,
 		max_bytes: int = 4_000_000,
+		base_urls: Optional[BaseUrlOverrides] = None,
 	) -> None:
 		self._user_agent = user_agent
 		self._timeout_s = timeout_s
 		self._max_bytes = max_bytes
+		self._base_urls = base_urls or get_base_url_overrides()
 
 	def fetch_promotions_raw(
 		self,
@@ -115,7 +119,7 @@ class EpicFreeGamesClient:
 			"Accept-Encoding": "gzip",
 		}
 
-		req = urllib.request.Request(url, headers=headers, method="GET")
+		req = urllib.request.Request(self._base_urls.rewrite(url), headers=headers, method="GET")
 		try:
 			with urllib.request.urlopen(req, timeout=self._timeout_s) as resp:
 				raw = resp.read(self._max_bytes + 1)
@@ -354,7 +358,7 @@ def _demo_print_offers(title: str, offers: list[EpicFreeGameOffer], *, limit: in
 if __name__ == "__main__":
 	# 小 demo：直接运行本文件即可看到当前/即将免费游戏概览。
 	# 运行方式（Windows 示例）：
-	#   python src/feature_core/adapters/http/free_game_client.py
+	#   python -m src.feature_core.adapters.http.free_game_client
 	client = EpicFreeGamesClient()
 	try:
 		current = client.get_current_free_games(locale="zh-CN", country="CN", allow_countries="CN")
@@ -11,6 +11,8 @@ from email.utils import parsedate_to_datetime
 from typing import Iterable, Optional
 from xml.etree import ElementTree as ET
 
+from src.feature_core.adapters.http.base_urls import BaseUrlOverrides, get_base_url_overrides
+
 
 logger = logging.getLogger(__name__)
 
@@ -48,10 +50,12 @@ class GameNewsClient:
         user_agent: str = "SteaMiss/1.0 (+https://example.invalid)",
         timeout_s: float = 10.0,
         max_bytes: int = 2_000_000,
+        base_urls: Optional[BaseUrlOverrides] = None,
     ) -> None:
         self._user_agent = user_agent
         self._timeout_s = timeout_s
         self._max_bytes = max_bytes
+        self._base_urls = base_urls or get_base_url_overrides()
 
     def fetch_feed(self, feed_url: str, *, source: str = "", limit: int = 30) -> list[NewsItem]:
         """抓取并解析 RSS/Atom。"""
@@ -91,7 +95,7 @@ class GameNewsClient:
             "Accept-Encoding": "gzip",
         }
 
-        req = urllib.request.Request(url, headers=headers, method="GET")
+        req = urllib.request.Request(self._base_urls.rewrite(url), headers=headers, method="GET")
         try:
             with urllib.request.urlopen(req, timeout=self._timeout_s) as resp:
                 raw = resp.read(self._max_bytes + 1)
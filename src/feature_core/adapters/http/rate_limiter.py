@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+# 端点族 -> 默认限速参数
+# - rate: 每秒补充的令牌数；burst: 桶容量；penalty: 429 未带 Retry-After 时的冷却秒数
+# store appdetails 官方口径约 200 次 / 5 分钟，这里略低于该值留出余量
+DEFAULT_RATE_LIMITS: Dict[str, Dict[str, float]] = {
+    "store_appdetails": {"rate": 0.6, "burst": 10, "penalty": 60.0},
+    "store": {"rate": 1.0, "burst": 5, "penalty": 30.0},
+    "webapi": {"rate": 10.0, "burst": 20, "penalty": 10.0},
+    "community": {"rate": 0.5, "burst": 3, "penalty": 60.0},
+}
+
+# 被限流后速率下调的下限（相对配置速率）
+_MIN_RATE_FACTOR = 0.125
+# 每次成功请求后速率恢复的步长（相对配置速率）
+_RECOVERY_STEP = 0.05
+
+
+class TokenBucket:
+    """
+    线程安全的令牌桶：
+    - `try_acquire()` 非阻塞：拿到令牌返回 0，否则返回建议等待秒数（便于 asyncio 侧复用）
+    - `acquire()` 阻塞直到拿到令牌
+    - `throttle()` 在收到 429 时进入冷却并下调速率；`on_success()` 逐步恢复
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        *,
+        penalty: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._configured_rate = max(1e-6, float(rate))
+        self._rate = self._configured_rate
+        self._burst = max(1.0, float(burst))
+        self._tokens = self._burst
+        self._penalty = max(0.0, float(penalty))
+        self._last = clock()
+        self._blocked_until = 0.0
+
+    @property
+    def rate(self) -> float:
+        with self._lock:
+            return self._rate
+
+    def configure(self, *, rate: Optional[float] = None, burst: Optional[float] = None, penalty: Optional[float] = None) -> None:
+        with self._lock:
+            self._refill_locked(self._clock())
+            if rate is not None:
+                self._configured_rate = max(1e-6, float(rate))
+                self._rate = self._configured_rate
+            if burst is not None:
+                self._burst = max(1.0, float(burst))
+                self._tokens = min(self._tokens, self._burst)
+            if penalty is not None:
+                self._penalty = max(0.0, float(penalty))
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        with self._lock:
+            now = self._clock()
+            self._refill_locked(now)
+            if self._blocked_until > now:
+                return self._blocked_until - now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self._rate
+
+    def acquire(self, tokens: float = 1.0, *, sleep: Callable[[float], None] = time.sleep) -> float:
+        """阻塞获取令牌，返回实际等待的总秒数。"""
+        waited = 0.0
+        while True:
+            delay = self.try_acquire(tokens)
+            if delay <= 0:
+                return waited
+            sleep(delay)
+            waited += delay
+
+    def throttle(self, retry_after: Optional[float] = None) -> float:
+        """进入冷却（Retry-After 优先，否则用 penalty），并将速率减半；返回冷却秒数。"""
+        with self._lock:
+            now = self._clock()
+            self._refill_locked(now)
+            cooldown = self._penalty if retry_after is None else max(0.0, float(retry_after))
+            self._blocked_until = max(self._blocked_until, now + cooldown)
+            self._rate = max(self._configured_rate * _MIN_RATE_FACTOR, self._rate / 2.0)
+            self._tokens = 0.0
+            return cooldown
+
+    def on_success(self) -> None:
+        with self._lock:
+            if self._rate < self._configured_rate:
+                self._rate = min(self._configured_rate, self._rate + self._configured_rate * _RECOVERY_STEP)
+
+    def _refill_locked(self, now: float) -> None:
+        # 冷却期间不补充令牌：冷却结束后从 0 开始按（降低后的）速率恢复
+        start = max(self._last, min(now, self._blocked_until))
+        elapsed = max(0.0, now - start)
+        self._last = now
+        self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+
+
+class RateLimiterRegistry:
+    """
+    按端点族（store_appdetails / store / webapi / community）管理令牌桶。
+    进程内共享：多个 Worker 并发时共同消耗同一份额度。
+    """
+
+    def __init__(self, limits: Optional[Mapping[str, Mapping[str, float]]] = None) -> None:
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._limits: Dict[str, Dict[str, float]] = {k: dict(v) for k, v in DEFAULT_RATE_LIMITS.items()}
+        if limits:
+            self.configure(limits)
+
+    def configure(self, limits: Optional[Mapping[str, Mapping[str, float]]]) -> None:
+        """合并覆盖配置（如 settings.json 的 steam_rate_limits）；已存在的桶即时生效。"""
+        if not isinstance(limits, Mapping):
+            return
+        with self._lock:
+            for family, params in limits.items():
+                if not isinstance(params, Mapping):
+                    continue
+                merged = dict(self._limits.get(family) or DEFAULT_RATE_LIMITS["store"])
+                for name in ("rate", "burst", "penalty"):
+                    if name in params:
+                        try:
+                            merged[name] = float(params[name])
+                        except (TypeError, ValueError):
+                            logger.warning("Invalid rate limit value: %s.%s=%r", family, name, params[name])
+                self._limits[family] = merged
+                bucket = self._buckets.get(family)
+                if bucket is not None:
+                    bucket.configure(rate=merged["rate"], burst=merged["burst"], penalty=merged["penalty"])
+
+    def bucket(self, family: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(family)
+            if bucket is None:
+                params = self._limits.get(family) or DEFAULT_RATE_LIMITS["store"]
+                bucket = TokenBucket(params["rate"], params["burst"], penalty=params.get("penalty", 30.0))
+                self._buckets[family] = bucket
+            return bucket
+
+    def acquire(self, family: str, *, sleep: Callable[[float], None] = time.sleep) -> float:
+        return self.bucket(family).acquire(sleep=sleep)
+
+    def observe(self, family: str, response: Any) -> None:
+        """根据响应调整节奏：429 进入冷却并降速，其余成功响应逐步恢复。"""
+        status = getattr(response, "status_code", None)
+        if status == 429:
+            retry_after = parse_retry_after(getattr(response, "headers", None) or {})
+            cooldown = self.bucket(family).throttle(retry_after)
+            logger.warning("Rate limited by Steam (%s): cooling down %.1fs", family, cooldown)
+        elif isinstance(status, int) and status < 400:
+            self.bucket(family).on_success()
+
+    def call(self, family: str, send: Callable[[], Any], *, sleep: Callable[[float], None] = time.sleep) -> Any:
+        """限速包装：先取令牌，再发送请求，最后根据响应调整节奏；sleep 可替换为可取消的等待。"""
+        self.acquire(family, sleep=sleep)
+        response = send()
+        self.observe(family, response)
+        return response
+
+    async def acall(self, family: str, send: Callable[[], Awaitable[Any]]) -> Any:
+        """call 的协程版本：等待令牌时让出事件循环而不是阻塞线程。"""
+        bucket = self.bucket(family)
+        while True:
+            wait = bucket.try_acquire()
+            if wait <= 0:
+                break
+            await asyncio.sleep(wait)
+        response = await send()
+        self.observe(family, response)
+        return response
+
+
+class RateLimitedSession:
+    """把任意“类 Session”对象包装为按端点族限速的版本（用于注入 WebAPI.session）。"""
+
+    def __init__(
+        self,
+        session: Any,
+        registry: RateLimiterRegistry,
+        family: str,
+        *,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._session = session
+        self._registry = registry
+        self._family = family
+        self._sleep = sleep
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        return self._registry.call(self._family, lambda: self._session.request(method, url, **kwargs), sleep=self._sleep)
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> Any:
+        return self.request("POST", url, **kwargs)
+
+
+def parse_retry_after(headers: Mapping[str, Any]) -> Optional[float]:
+    """解析 Retry-After（秒数或 HTTP 日期）；无法解析时返回 None。"""
+    value = None
+    try:
+        value = headers.get("Retry-After")
+    except Exception:
+        return None
+    if value is None:
+        return None
+    text = str(value).strip()
+    try:
+        return max(0.0, float(text))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(text).timestamp() - time.time())
+    except Exception:
+        return None
+
+
+_shared_registry: Optional[RateLimiterRegistry] = None
+_shared_lock = threading.Lock()
+
+
+def get_rate_limiter_registry() -> RateLimiterRegistry:
+    """获取进程级共享的限速器注册表（懒加载）。"""
+    global _shared_registry
+    with _shared_lock:
+        if _shared_registry is None:
+            _shared_registry = RateLimiterRegistry()
+        return _shared_registry
+
+
+__all__ = [
+    "DEFAULT_RATE_LIMITS",
+    "RateLimitedSession",
+    "RateLimiterRegistry",
+    "TokenBucket",
+    "get_rate_limiter_registry",
+    "parse_retry_after",
+]
@@ -0,0 +1,373 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional
+
+import requests
+
+from src.feature_core.adapters.http.base_urls import host_of
+
+
+logger = logging.getLogger(__name__)
+
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """host 熔断中：请求未发出即失败。"""
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        super().__init__(f"Circuit open for {host}, retry in {retry_in:.1f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    重试策略：指数退避 + full jitter。
+    - idempotent=True：连接/读取超时与 5xx 均可重试
+    - idempotent=False：只在“请求确定未发出”（建连失败）时重试，避免重复提交
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    idempotent: bool = True
+    retry_statuses: FrozenSet[int] = field(default_factory=lambda: frozenset({500, 502, 503, 504}))
+
+    def delay_for(self, attempt: int, rng: Callable[[float, float], float] = random.uniform) -> float:
+        """第 attempt 次失败（从 1 开始）后的等待时间。"""
+        cap = min(self.max_delay, self.base_delay * (2 ** max(0, attempt - 1)))
+        return rng(0.0, cap)
+
+    def should_retry_exception(self, exc: BaseException) -> bool:
+        if isinstance(exc, CircuitOpenError):
+            return False
+        if self.idempotent:
+            return isinstance(exc, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+        # ConnectTimeout 同时是 ConnectionError 与 Timeout 的子类，但请求确定未发出
+        return isinstance(exc, requests.exceptions.ConnectTimeout) or (
+            isinstance(exc, requests.exceptions.ConnectionError)
+            and not isinstance(exc, requests.exceptions.ReadTimeout)
+            and _is_connect_failure(exc)
+        )
+
+    def should_retry_status(self, status_code: int) -> bool:
+        return self.idempotent and status_code in self.retry_statuses
+
+
+IDEMPOTENT_POLICY = RetryPolicy()
+NON_IDEMPOTENT_POLICY = RetryPolicy(max_attempts=2, idempotent=False)
+
+
+def policy_for_method(method: str) -> RetryPolicy:
+    return IDEMPOTENT_POLICY if (method or "").upper() in ("GET", "HEAD", "OPTIONS") else NON_IDEMPOTENT_POLICY
+
+
+class CircuitBreaker:
+    """
+    单个 host 的熔断器：
+    - closed：连续失败达到阈值后 open
+    - open：在 reset_timeout 内直接拒绝；到期后进入 half_open
+    - half_open：只放行一个探测请求，成功则 closed，失败则重新 open
+    """
+
+    def __init__(
+        self,
+        host: str,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        on_change: Optional[Callable[[str, str], None]] = None,
+    ) -> None:
+        self.host = host
+        self._failure_threshold = max(1, int(failure_threshold))
+        self._reset_timeout = float(reset_timeout)
+        self._clock = clock
+        self._on_change = on_change
+        self._lock = threading.Lock()
+        self._state = CIRCUIT_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def before_request(self) -> None:
+        """请求前调用：熔断中则抛出 CircuitOpenError。"""
+        changed = None
+        error: Optional[CircuitOpenError] = None
+        with self._lock:
+            if self._state == CIRCUIT_OPEN:
+                remaining = self._opened_at + self._reset_timeout - self._clock()
+                if remaining > 0:
+                    error = CircuitOpenError(self.host, remaining)
+                else:
+                    self._state = CIRCUIT_HALF_OPEN
+                    self._probe_in_flight = False
+                    changed = CIRCUIT_HALF_OPEN
+            if error is None and self._state == CIRCUIT_HALF_OPEN:
+                if self._probe_in_flight:
+                    error = CircuitOpenError(self.host, 0.0)
+                else:
+                    self._probe_in_flight = True
+        # listener 在锁外回调，避免其再次读取状态时死锁
+        self._notify(changed)
+        if error is not None:
+            raise error
+
+    def release(self) -> None:
+        """请求因非网络原因失败：不计入健康度，仅释放半开探测名额。"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        changed = None
+        with self._lock:
+            self._failures = 0
+            self._probe_in_flight = False
+            if self._state != CIRCUIT_CLOSED:
+                self._state = CIRCUIT_CLOSED
+                changed = CIRCUIT_CLOSED
+        self._notify(changed)
+
+    def record_failure(self) -> None:
+        changed = None
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == CIRCUIT_HALF_OPEN or self._failures >= self._failure_threshold:
+                if self._state != CIRCUIT_OPEN:
+                    changed = CIRCUIT_OPEN
+                self._state = CIRCUIT_OPEN
+                self._opened_at = self._clock()
+        self._notify(changed)
+
+    def _notify(self, state: Optional[str]) -> None:
+        if state is None or self._on_change is None:
+            return
+        try:
+            self._on_change(self.host, state)
+        except Exception:
+            logger.exception("Circuit breaker listener failed: host=%s", self.host)
+
+
+class CircuitBreakerRegistry:
+    """按 host 管理熔断器；状态变化通过 listener 通知（可能在 worker 线程中回调）。"""
+
+    def __init__(self, *, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._listeners: List[Callable[[str, str], None]] = []
+
+    def breaker(self, url_or_host: str) -> CircuitBreaker:
+        host = host_of(url_or_host)
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    host,
+                    failure_threshold=self._failure_threshold,
+                    reset_timeout=self._reset_timeout,
+                    on_change=self._dispatch,
+                )
+                self._breakers[host] = breaker
+            return breaker
+
+    def states(self) -> Dict[str, str]:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {b.host: b.state for b in breakers}
+
+    def add_listener(self, fn: Callable[[str, str], None]) -> None:
+        with self._lock:
+            self._listeners.append(fn)
+
+    def remove_listener(self, fn: Callable[[str, str], None]) -> None:
+        with self._lock:
+            if fn in self._listeners:
+                self._listeners.remove(fn)
+
+    def _dispatch(self, host: str, state: str) -> None:
+        logger.warning("Circuit breaker state changed: host=%s state=%s", host, state)
+        with self._lock:
+            listeners = list(self._listeners)
+        for fn in listeners:
+            try:
+                fn(host, state)
+            except Exception:
+                logger.exception("Circuit breaker listener failed: host=%s", host)
+
+
+class ResilientCaller:
+    """重试 + 熔断的组合执行器：`call(method, url, send)` 中 send 负责真正发送一次请求。"""
+
+    def __init__(
+        self,
+        breakers: CircuitBreakerRegistry,
+        *,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._breakers = breakers
+        self._sleep = sleep
+
+    def call(self, method: str, url: str, send: Callable[[], Any], policy: Optional[RetryPolicy] = None) -> Any:
+        policy = policy or policy_for_method(method)
+        breaker = self._breakers.breaker(url)
+        attempt = 0
+        while True:
+            attempt += 1
+            breaker.before_request()
+            try:
+                response = send()
+            except Exception as exc:
+                delay = self._on_exception(breaker, policy, attempt, method, url, exc)
+                if delay is None:
+                    raise
+                self._sleep(delay)
+                continue
+
+            delay = self._on_response(breaker, policy, attempt, method, url, response)
+            if delay is None:
+                return response
+            self._sleep(delay)
+
+    async def acall(
+        self,
+        method: str,
+        url: str,
+        send: Callable[[], Awaitable[Any]],
+        policy: Optional[RetryPolicy] = None,
+    ) -> Any:
+        """call 的协程版本：退避期间 await asyncio.sleep，不占用事件循环线程。"""
+        policy = policy or policy_for_method(method)
+        breaker = self._breakers.breaker(url)
+        attempt = 0
+        while True:
+            attempt += 1
+            breaker.before_request()
+            try:
+                response = await send()
+            except asyncio.CancelledError:
+                breaker.release()
+                raise
+            except Exception as exc:
+                delay = self._on_exception(breaker, policy, attempt, method, url, exc)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+
+            delay = self._on_response(breaker, policy, attempt, method, url, response)
+            if delay is None:
+                return response
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _on_exception(
+        breaker: CircuitBreaker,
+        policy: RetryPolicy,
+        attempt: int,
+        method: str,
+        url: str,
+        exc: BaseException,
+    ) -> Optional[float]:
+        """记录失败并返回重试前的等待时间；不应重试时返回 None。"""
+        if isinstance(exc, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            breaker.record_failure()
+        else:
+            # 非网络异常（参数错误等）不应计入 host 健康度，也不应让半开探测卡住
+            breaker.release()
+        if attempt < policy.max_attempts and policy.should_retry_exception(exc):
+            delay = policy.delay_for(attempt)
+            logger.info("Retrying %s %s after %s (attempt %s, %.2fs)", method, url, type(exc).__name__, attempt, delay)
+            return delay
+        return None
+
+    @staticmethod
+    def _on_response(
+        breaker: CircuitBreaker,
+        policy: RetryPolicy,
+        attempt: int,
+        method: str,
+        url: str,
+        response: Any,
+    ) -> Optional[float]:
+        status = getattr(response, "status_code", 200)
+        if isinstance(status, int) and status >= 500:
+            breaker.record_failure()
+            if attempt < policy.max_attempts and policy.should_retry_status(status):
+                delay = policy.delay_for(attempt)
+                logger.info("Retrying %s %s after HTTP %s (attempt %s, %.2fs)", method, url, status, attempt, delay)
+                return delay
+        else:
+            breaker.record_success()
+        return None
+
+
+class ResilientSession:
+    """把“类 Session”对象包装为带重试/熔断的版本（用于注入 WebAPI.session）。"""
+
+    def __init__(self, session: Any, caller: ResilientCaller) -> None:
+        self._session = session
+        self._caller = caller
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        return self._caller.call(method, url, lambda: self._session.request(method, url, **kwargs))
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> Any:
+        return self.request("POST", url, **kwargs)
+
+
+def _is_connect_failure(exc: BaseException) -> bool:
+    # requests 把 urllib3 的 NewConnectionError/建连失败包装为 ConnectionError；读阶段断开通常是 ProtocolError
+    text = repr(exc)
+    return "NewConnectionError" in text or "Failed to establish a new connection" in text or "NameResolutionError" in text
+
+
+_shared_registry: Optional[CircuitBreakerRegistry] = None
+_shared_lock = threading.Lock()
+
+
+def get_circuit_breaker_registry() -> CircuitBreakerRegistry:
+    """获取进程级共享的熔断器注册表（懒加载）。"""
+    global _shared_registry
+    with _shared_lock:
+        if _shared_registry is None:
+            _shared_registry = CircuitBreakerRegistry()
+        return _shared_registry
+
+
+__all__ = [
+    "CIRCUIT_CLOSED",
+    "CIRCUIT_HALF_OPEN",
+    "CIRCUIT_OPEN",
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "CircuitOpenError",
+    "IDEMPOTENT_POLICY",
+    "NON_IDEMPOTENT_POLICY",
+    "ResilientCaller",
+    "ResilientSession",
+    "RetryPolicy",
+    "get_circuit_breaker_registry",
+    "policy_for_method",
+]
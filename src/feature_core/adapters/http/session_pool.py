@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.feature_core.adapters.http.base_urls import BaseUrlOverrides, get_base_url_overrides, host_of
+
+
+logger = logging.getLogger(__name__)
+
+
+class _HostStats:
+    """单个 host 的连接计数（由 SessionPool 的锁保护）。"""
+
+    __slots__ = ("requests", "new_connections", "reused_connections", "sessions_created", "waits")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.new_connections = 0
+        self.reused_connections = 0
+        self.sessions_created = 0
+        self.waits = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "requests": self.requests,
+            "new_connections": self.new_connections,
+            "reused_connections": self.reused_connections,
+            "sessions_created": self.sessions_created,
+            "waits": self.waits,
+        }
+
+
+class _CountingAdapter(HTTPAdapter):
+    """在 send 前后比较 urllib3 连接池的建连次数，以区分“新建连接/复用连接”。"""
+
+    def __init__(self, on_sent, **kwargs: Any) -> None:
+        self._on_sent = on_sent
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        before = self._total_connections()
+        response = super().send(request, **kwargs)
+        after = self._total_connections()
+        if before is not None and after is not None:
+            try:
+                self._on_sent(request.url, after > before)
+            except Exception:
+                logger.debug("SessionPool stats callback failed", exc_info=True)
+        return response
+
+    def _total_connections(self) -> Optional[int]:
+        # requests 会按 TLS 参数选择不同的 pool key，这里对该 adapter 下所有连接池求和
+        try:
+            pools = self.poolmanager.pools
+            return sum(pools[key].num_connections for key in pools.keys())
+        except Exception:
+            return None
+
+
+class _HostPool:
+    def __init__(self) -> None:
+        self.idle: List[requests.Session] = []
+        self.created = 0
+
+
+class SessionPool:
+    """
+    进程级、线程安全的 requests.Session 池（按 host 划分）：
+    - 每个 host 最多 `max_sessions_per_host` 个 Session；取不到时阻塞等待归还
+    - Session 只在借出期间被单个线程使用，因此无需额外加锁
+    - keep-alive 由 requests/urllib3 默认开启，复用同一 Session 即复用 TCP+TLS 连接
+
+    对外既可用 `session_for(url)` 借出 Session，也可直接当作“类 Session”对象调用
+    `get/post/request`（每次调用自动借还），便于注入给 steam.webapi.WebAPI.session。
+    """
+
+    def __init__(
+        self,
+        *,
+        max_sessions_per_host: int = 4,
+        user_agent: Optional[str] = None,
+        base_urls: Optional[BaseUrlOverrides] = None,
+    ) -> None:
+        self._max_sessions_per_host = max(1, int(max_sessions_per_host))
+        self._base_urls = base_urls or get_base_url_overrides()
+        self._user_agent = user_agent
+        self._cond = threading.Condition()
+        self._pools: Dict[str, _HostPool] = {}
+        self._stats: Dict[str, _HostStats] = {}
+        self._closed = False
+
+    @property
+    def max_sessions_per_host(self) -> int:
+        return self._max_sessions_per_host
+
+    # ---- session checkout ----
+
+    @contextmanager
+    def session_for(self, url_or_host: str) -> Iterator[requests.Session]:
+        host = host_of(url_or_host)
+        session = self._acquire(host)
+        try:
+            yield session
+        finally:
+            self._release(host, session)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        # 地址改写（本地替身服务等）只影响实际发往的地址
+        target = self._base_urls.rewrite(url)
+        with self.session_for(target) as session:
+            return session.request(method, target, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    # ---- stats / lifecycle ----
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """返回各 host 的连接计数快照：requests/new_connections/reused_connections/..."""
+        with self._cond:
+            return {host: s.as_dict() for host, s in self._stats.items()}
+
+    def close(self) -> None:
+        """关闭所有空闲 Session；借出中的 Session 在归还时关闭。"""
+        with self._cond:
+            self._closed = True
+            sessions = [s for pool in self._pools.values() for s in pool.idle]
+            for pool in self._pools.values():
+                pool.idle.clear()
+            self._cond.notify_all()
+        for s in sessions:
+            try:
+                s.close()
+            except Exception:
+                logger.debug("SessionPool failed to close session", exc_info=True)
+
+    # ---- internals ----
+
+    def _acquire(self, host: str) -> requests.Session:
+        with self._cond:
+            pool = self._pools.setdefault(host, _HostPool())
+            waited = False
+            while True:
+                if pool.idle:
+                    return pool.idle.pop()
+                if pool.created < self._max_sessions_per_host or self._closed:
+                    pool.created += 1
+                    self._stats_for(host).sessions_created += 1
+                    break
+                if not waited:
+                    self._stats_for(host).waits += 1
+                    waited = True
+                self._cond.wait()
+        # 在锁外构造 Session（HTTPAdapter 初始化有少量开销）
+        return self._new_session(host)
+
+    def _release(self, host: str, session: requests.Session) -> None:
+        with self._cond:
+            pool = self._pools.setdefault(host, _HostPool())
+            if self._closed:
+                pool.created = max(0, pool.created - 1)
+                close_now = True
+            else:
+                pool.idle.append(session)
+                close_now = False
+            self._cond.notify()
+        if close_now:
+            try:
+                session.close()
+            except Exception:
+                logger.debug("SessionPool failed to close session", exc_info=True)
+
+    def _new_session(self, host: str) -> requests.Session:
+        session = requests.Session()
+        # 每个 Session 同一时刻只被一个线程使用：保留少量连接即可
+        adapter = _CountingAdapter(self._on_sent, pool_connections=1, pool_maxsize=2)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if self._user_agent:
+            session.headers["User-Agent"] = self._user_agent
+        return session
+
+    def _on_sent(self, url: str, is_new_connection: bool) -> None:
+        host = host_of(url)
+        with self._cond:
+            stats = self._stats_for(host)
+            stats.requests += 1
+            if is_new_connection:
+                stats.new_connections += 1
+            else:
+                stats.reused_connections += 1
+
+    def _stats_for(self, host: str) -> _HostStats:
+        stats = self._stats.get(host)
+        if stats is None:
+            stats = _HostStats()
+            self._stats[host] = stats
+        return stats
+
+
+_shared_pool: Optional[SessionPool] = None
+_shared_lock = threading.Lock()
+
+
+def get_session_pool() -> SessionPool:
+    """获取进程级共享 SessionPool（懒加载）。"""
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = SessionPool()
+        return _shared_pool
+
+
+__all__ = ["SessionPool", "get_session_pool"]
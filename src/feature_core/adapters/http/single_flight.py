@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+from src.feature_core.services.steam.task_cancellation import TaskCancelled, checkpoint
+
+
+logger = logging.getLogger(__name__)
+
+
+def request_key(method: str, url: str, params: Optional[Mapping[str, Any]] = None) -> Tuple[str, str, str]:
+    """(endpoint, params) 的规范化键：参数顺序无关，值可为列表。"""
+    canonical = json.dumps(params or {}, sort_keys=True, default=str, ensure_ascii=False)
+    return (method.upper(), url, canonical)
+
+
+class _Stats:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.executed = 0
+        self.shared = 0
+        self.shared_by_endpoint: Dict[str, int] = {}
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "executed": self.executed,
+            "shared": self.shared,
+            "shared_by_endpoint": dict(self.shared_by_endpoint),
+        }
+
+    def record(self, key: Hashable, leader: bool) -> None:
+        self.calls += 1
+        if leader:
+            self.executed += 1
+            return
+        self.shared += 1
+        endpoint = key[1] if isinstance(key, tuple) and len(key) > 1 else str(key)
+        self.shared_by_endpoint[endpoint] = self.shared_by_endpoint.get(endpoint, 0) + 1
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    线程版 single-flight：同一 key 的并发调用只执行一次 fn，其余调用等待并共享结果（或异常）。
+    只合并“正在进行中”的调用，不缓存已完成的结果；发起方因任务取消失败时，未取消的跟随方重试。
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._stats = _Stats()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        first = True
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = _Call()
+                    self._calls[key] = call
+                if first:
+                    self._stats.record(key, leader)
+                elif leader:
+                    self._stats.executed += 1
+            first = False
+
+            if leader:
+                break
+            call.done.wait()
+            if isinstance(call.error, TaskCancelled):
+                # 发起方的任务被取消不代表本调用被取消：自身未取消时重新竞争，由其中一个跟随方接任发起方
+                checkpoint()
+                continue
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return self._stats.as_dict()
+
+
+class AsyncSingleFlight:
+    """协程版 single-flight（只能在同一个事件循环中使用）。"""
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self._stats = _Stats()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        future = self._calls.get(key)
+        self._stats.record(key, future is None)
+        while future is not None:
+            try:
+                # shield：某个等待方被取消时不影响领头请求与其他等待方
+                return await asyncio.shield(future)
+            except (asyncio.CancelledError, TaskCancelled):
+                if not future.done():
+                    # 等待方自身被取消
+                    raise
+                if not future.cancelled() and not isinstance(future.exception(), (asyncio.CancelledError, TaskCancelled)):
+                    raise
+            # 发起方被取消：重新竞争，由其中一个等待方接任发起方
+            future = self._calls.get(key)
+            if future is None:
+                self._stats.executed += 1
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except BaseException as e:
+            if not future.cancelled():
+                future.set_exception(e)
+                # 无其他等待方时避免 "exception was never retrieved" 警告
+                future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._calls.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return self._stats.as_dict()
+
+
+class SingleFlightSession:
+    """把“类 Session”对象包装为 GET 请求合并的版本（用于注入 WebAPI.session）；POST 不合并。"""
+
+    def __init__(self, session: Any, flight: SingleFlight) -> None:
+        self._session = session
+        self._flight = flight
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        return self._flight.do(request_key("GET", url, kwargs.get("params")), lambda: self._session.get(url, **kwargs))
+
+    def post(self, url: str, **kwargs: Any) -> Any:
+        return self._session.post(url, **kwargs)
+
+
+_shared_flight: Optional[SingleFlight] = None
+_shared_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """获取进程级共享的 single-flight 分组（懒加载），使不同 worker 的相同请求也能合并。"""
+    global _shared_flight
+    with _shared_lock:
+        if _shared_flight is None:
+            _shared_flight = SingleFlight()
+        return _shared_flight
+
+
+__all__ = ["AsyncSingleFlight", "SingleFlight", "SingleFlightSession", "get_single_flight", "request_key"]
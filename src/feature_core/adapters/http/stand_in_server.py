@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Sequence
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+
+from src.feature_core.adapters.http.base_urls import KNOWN_ORIGINS, BaseUrlOverrides, stand_in_overrides
+from src.feature_core.adapters.http.cassette import Cassette, Interaction, body_sha1
+
+
+logger = logging.getLogger(__name__)
+
+
+MODE_REPLAY = "replay"
+MODE_RECORD = "record"
+
+ERROR_STATUS = "status"
+ERROR_RESET = "reset"
+
+# 转发给上游时保留的请求头
+_FORWARDED_HEADERS = ("User-Agent", "Accept", "Content-Type", "Authorization")
+_WRITE_CHUNK = 16 * 1024
+
+
+class StandInServer:
+    """
+    本地 HTTP 替身服务（仅标准库 + requests）：
+    - 请求路径形如 /{上游 host}/{原路径}?{原查询}，配合 base URL 改写使用
+    - replay：从 Cassette 回放；未录制的请求返回 404 并计入 misses
+    - record：转发到真实上游（https://{host}/...），录制响应后原样返回
+    - 可注入固定延迟、限速带宽与随机错误（状态码或直接断开连接），随机数可设种子以便复现
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        *,
+        mode: str = MODE_REPLAY,
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        error_kind: str = ERROR_STATUS,
+        seed: Optional[int] = None,
+        upstream: Optional[BaseUrlOverrides] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        if mode not in (MODE_REPLAY, MODE_RECORD):
+            raise ValueError(f"Unknown stand-in mode: {mode!r}")
+        if error_kind not in (ERROR_STATUS, ERROR_RESET):
+            raise ValueError(f"Unknown error kind: {error_kind!r}")
+        self.cassette = cassette
+        self.mode = mode
+        self.latency = max(0.0, float(latency))
+        self.bandwidth = float(bandwidth) if bandwidth else None
+        self.error_rate = max(0.0, min(1.0, float(error_rate)))
+        self.error_status = int(error_status)
+        self.error_kind = error_kind
+        # 录制模式的上游改写（测试中可再指向另一个替身）；默认直连真实上游
+        self._upstream = upstream or BaseUrlOverrides()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "hits": 0, "misses": 0, "recorded": 0, "injected_errors": 0}
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def overrides(self, origins: Sequence[str] = KNOWN_ORIGINS) -> BaseUrlOverrides:
+        """返回把给定上游全部指向本服务的改写表，可直接传给各客户端的 base_urls。"""
+        return BaseUrlOverrides(stand_in_overrides(self.base_url, origins))
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def start(self) -> "StandInServer":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name="http-stand-in", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+        if self.mode == MODE_RECORD and self.cassette.path:
+            self.cassette.save()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    # ---- request handling (handler threads) ----
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _should_inject_error(self) -> bool:
+        if self.error_rate <= 0:
+            return False
+        with self._lock:
+            return self._rng.random() < self.error_rate
+
+    def _resolve(self, method: str, raw_path: str, headers: Any, body: bytes) -> Optional[Interaction]:
+        parts = urlsplit(raw_path)
+        upstream_host, _, rest = parts.path.lstrip("/").partition("/")
+        path = "/" + rest
+
+        if self.mode == MODE_REPLAY:
+            interaction = self.cassette.match(method, upstream_host, path, parts.query, body)
+            self._count("hits" if interaction is not None else "misses")
+            return interaction
+
+        url = self._upstream.rewrite(f"https://{upstream_host}{path}" + (f"?{parts.query}" if parts.query else ""))
+        forwarded = {k: headers[k] for k in _FORWARDED_HEADERS if headers.get(k)}
+        response = requests.request(method, url, headers=forwarded, data=body or None, timeout=30)
+        interaction = Interaction(
+            method,
+            upstream_host,
+            path,
+            parse_qsl(parts.query, keep_blank_values=True),
+            response.status_code,
+            response.headers,
+            response.content,
+            body_sha1=body_sha1(body),
+        )
+        self.cassette.record(interaction)
+        self._count("recorded")
+        return interaction
+
+
+def _make_handler(server: StandInServer):
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            self._serve()
+
+        def do_POST(self) -> None:
+            self._serve()
+
+        def log_message(self, fmt: str, *args: Any) -> None:
+            logger.debug("stand-in: " + fmt, *args)
+
+        def _serve(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else b""
+            server._count("requests")
+
+            if server.latency:
+                time.sleep(server.latency)
+
+            if server._should_inject_error():
+                server._count("injected_errors")
+                if server.error_kind == ERROR_RESET:
+                    self.close_connection = True
+                    self.connection.close()
+                    return
+                self._write(server.error_status, {"Content-Type": "application/json"}, b'{"error": "injected"}')
+                return
+
+            try:
+                interaction = server._resolve(self.command, self.path, self.headers, body)
+            except Exception as e:
+                logger.exception("Stand-in upstream request failed: %s", self.path)
+                self._write(502, {"Content-Type": "application/json"}, json.dumps({"error": str(e)}).encode("utf-8"))
+                return
+
+            if interaction is None:
+                payload = json.dumps({"error": "no recorded interaction", "path": self.path}).encode("utf-8")
+                self._write(404, {"Content-Type": "application/json"}, payload)
+                return
+            self._write(interaction.status, interaction.headers, interaction.body)
+
+        def _write(self, status: int, headers: Dict[str, str], body: bytes) -> None:
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if not server.bandwidth:
+                self.wfile.write(body)
+                return
+            # 按带宽分块写出，模拟慢速链路
+            for start in range(0, len(body), _WRITE_CHUNK):
+                chunk = body[start : start + _WRITE_CHUNK]
+                self.wfile.write(chunk)
+                self.wfile.flush()
+                time.sleep(len(chunk) / server.bandwidth)
+
+    return _Handler
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Local record/replay stand-in for SteaMiss network clients.")
+    parser.add_argument("--cassette", required=True, help="Cassette JSON path.")
+    parser.add_argument("--mode", choices=(MODE_REPLAY, MODE_RECORD), default=MODE_REPLAY)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response.")
+    parser.add_argument("--bandwidth", type=float, default=None, help="Response bytes per second.")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--error-kind", choices=(ERROR_STATUS, ERROR_RESET), default=ERROR_STATUS)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    server = StandInServer(
+        Cassette.load(args.cassette),
+        mode=args.mode,
+        latency=args.latency,
+        bandwidth=args.bandwidth,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        error_kind=args.error_kind,
+        seed=args.seed,
+        port=args.port,
+    ).start()
+    print(f"Stand-in ({args.mode}) listening on {server.base_url}")
+    print(f"Point the app at it with: STEAMISS_STAND_IN={server.base_url}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(f"Stats: {server.stats()}")
+    return 0
+
+
+__all__ = ["ERROR_RESET", "ERROR_STATUS", "MODE_RECORD", "MODE_REPLAY", "StandInServer", "main"]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+
+from src.feature_core.adapters.http.async_http import AsyncHttpClient, AsyncResponse
+from src.feature_core.adapters.http.rate_limiter import RateLimiterRegistry, get_rate_limiter_registry
+from src.feature_core.adapters.http.resilience import (
+    CircuitBreakerRegistry,
+    ResilientCaller,
+    get_circuit_breaker_registry,
+)
+from src.feature_core.adapters.http.single_flight import AsyncSingleFlight, request_key
+from src.feature_core.adapters.http.steam_client import MAX_SUMMARY_STEAMIDS, WISHLIST_PRICE_CHUNK
+from src.feature_core.services.steam.app_metadata_service import SteamAppMetadataService, normalize_app_details
+from src.feature_core.services.steam.wishlist_discount_service import (
+    apply_app_info,
+    best_discount,
+    wishlist_entries_from_prices,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+_WEBAPI_BASE = "https://api.steampowered.com"
+_STORE_APPDETAILS_URL = "https://store.steampowered.com/api/appdetails"
+
+
+class AsyncSteamClient:
+    """
+    Steam 网络客户端的 asyncio 版本（与 SteamClient 返回结构保持一致）：
+    - 直接请求 WebAPI 的 HTTP 端点，不依赖 steam.webapi 的同步绑定
+    - 与同步客户端共享限速器与熔断器：两种后台实现混用时额度仍是全局的
+    - 所有方法都必须在 http 所属的事件循环中 await
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        http: AsyncHttpClient,
+        *,
+        rate_limiter: Optional[RateLimiterRegistry] = None,
+        app_metadata: Optional[SteamAppMetadataService] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+        single_flight: Optional[AsyncSingleFlight] = None,
+    ) -> None:
+        self.api_key = api_key
+        self._http = http
+        self._limiter = rate_limiter or get_rate_limiter_registry()
+        self._app_metadata = app_metadata
+        self._resilience = ResilientCaller(circuit_breakers or get_circuit_breaker_registry())
+        # 需与 http 同属一个事件循环；未提供时仅在本客户端内合并
+        self._flight = single_flight or AsyncSingleFlight()
+
+    async def _get(self, family: str, url: str, **kwargs: Any) -> AsyncResponse:
+        """与 SteamClient._http_get 相同的分层：合并 -> 重试/熔断 -> 限速 -> 连接池。"""
+
+        async def send() -> AsyncResponse:
+            return await self._limiter.acall(family, lambda: self._http.get(url, **kwargs))
+
+        return await self._flight.do(
+            request_key("GET", url, kwargs.get("params")),
+            lambda: self._resilience.acall("GET", url, send),
+        )
+
+    async def _webapi(self, interface: str, method: str, version: int, **params: Any) -> Dict[str, Any]:
+        url = f"{_WEBAPI_BASE}/{interface}/{method}/v{version}/"
+        query = {"key": self.api_key, "format": "json"}
+        query.update(params)
+        response = await self._get("webapi", url, params=query, timeout=10)
+        response.raise_for_status()
+        return response.json() or {}
+
+    async def get_player_summaries(self, steam_ids: Any) -> List[Dict[str, Any]]:
+        try:
+            response = await self._webapi("ISteamUser", "GetPlayerSummaries", 2, steamids=steam_ids)
+            return response.get("response", {}).get("players", [])
+        except Exception:
+            logger.exception("Steam API Error (GetPlayerSummaries): steam_ids=%s", steam_ids)
+            return []
+
+    async def get_player_summaries_batched(self, steam_ids: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+        """同 SteamClient.get_player_summaries_batched；多个批次并发请求。"""
+        ids = [str(sid) for sid in steam_ids if sid]
+        batches = [",".join(ids[i : i + MAX_SUMMARY_STEAMIDS]) for i in range(0, len(ids), MAX_SUMMARY_STEAMIDS)]
+        players: Dict[str, Dict[str, Any]] = {}
+        for batch in await asyncio.gather(*(self.get_player_summaries(b) for b in batches)):
+            for player in batch:
+                if isinstance(player, dict) and player.get("steamid"):
+                    players[str(player["steamid"])] = player
+        return players
+
+    async def get_owned_games(self, steam_id: Any) -> Optional[Dict[str, Any]]:
+        try:
+            response = await self._webapi(
+                "IPlayerService",
+                "GetOwnedGames",
+                1,
+                steamid=steam_id,
+                include_appinfo=1,
+                include_played_free_games=0,
+                include_free_sub=0,
+                language="schinese",
+                include_extended_appinfo=0,
+            )
+            return response.get("response", {})
+        except Exception:
+            logger.exception("Steam API Error (GetOwnedGames): steam_id=%s", steam_id)
+            return None
+
+    async def get_steam_level(self, steam_id: Any) -> int:
+        try:
+            response = await self._webapi("IPlayerService", "GetSteamLevel", 1, steamid=steam_id)
+            return response.get("response", {}).get("player_level", 0)
+        except Exception:
+            logger.exception("Steam API Error (GetSteamLevel): steam_id=%s", steam_id)
+            return 0
+
+    async def get_player_achievements(self, steam_id: Any, app_id: Any) -> Optional[Dict[str, Any]]:
+        try:
+            response = await self._webapi("ISteamUserStats", "GetPlayerAchievements", 1, steamid=steam_id, appid=app_id, l="schinese")
+            return response.get("playerstats", {})
+        except Exception:
+            logger.exception("Steam API Error (GetPlayerAchievements): steam_id=%s app_id=%s", steam_id, app_id)
+            return None
+
+    async def get_app_price(self, app_ids: List[Any]) -> Dict[str, Any]:
+        if not app_ids:
+            return {}
+        params = {"appids": ",".join(map(str, app_ids)), "filters": "price_overview", "cc": "cn", "l": "schinese"}
+        try:
+            response = await self._get("store_appdetails", _STORE_APPDETAILS_URL, params=params, timeout=10)
+            if response.status_code == 200:
+                return response.json() or {}
+        except Exception:
+            logger.exception("Steam Store API Error: app_ids=%s", app_ids)
+        return {}
+
+    async def get_apps_info(self, app_ids: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        与 SteamClient.get_apps_info 相同：配置了 app_metadata 时只为未命中/过期的 appid 发请求。
+        元数据缓存的读写（可能触发磁盘 I/O）放到默认线程池，不阻塞事件循环。
+        """
+        ids = [str(a) for a in app_ids or [] if a is not None]
+        if not ids:
+            return {}
+
+        loop = asyncio.get_running_loop()
+        if self._app_metadata is None:
+            fetched = await self._fetch_apps_info(ids)
+            result = {}
+            for appid_str, data in fetched.items():
+                record = normalize_app_details(data)
+                if record:
+                    result[appid_str] = record
+            return result
+
+        to_fetch = await loop.run_in_executor(None, self._app_metadata.missing, ids)
+        fetched = await self._fetch_apps_info(to_fetch) if to_fetch else {}
+        # get_many 只会为 to_fetch 调用 fetch：这里直接回填已并发拉取到的结果
+        return await loop.run_in_executor(None, self._app_metadata.get_many, ids, lambda _missing: fetched)
+
+    async def _fetch_apps_info(self, app_ids: List[str]) -> Dict[str, Any]:
+        """并发请求 appdetails（节奏由限速器控制）；失败的 appid 不出现在结果中。"""
+
+        async def fetch_one(appid: str) -> Optional[Any]:
+            params = {"appids": appid, "filters": "basic,release_date", "cc": "cn", "l": "schinese"}
+            response = await self._get("store_appdetails", _STORE_APPDETAILS_URL, params=params, timeout=5)
+            if response.status_code != 200:
+                raise ValueError(f"appdetails HTTP {response.status_code}")
+            entry = (response.json() or {}).get(appid) or {}
+            return entry.get("data", {}) if entry.get("success") else None
+
+        outcomes = await asyncio.gather(*(fetch_one(aid) for aid in app_ids), return_exceptions=True)
+        result: Dict[str, Any] = {}
+        for appid, outcome in zip(app_ids, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error("Steam API Error (get_apps_info): appid=%s: %r", appid, outcome)
+                continue
+            result[appid] = outcome
+        return result
+
+    async def get_wishlist_app(self, steam_id: Any) -> List[Any]:
+        try:
+            response = await self._webapi("IWishlistService", "GetWishlist", 1, steamid=steam_id)
+            return [item["appid"] for item in response.get("response", {}).get("items", [])]
+        except Exception:
+            logger.exception("Steam API Error (GetWishlistApp): steam_id=%s", steam_id)
+            return []
+
+    async def get_game_followed(self, steam_id: Any) -> List[Any]:
+        try:
+            response = await self._webapi("IStoreService", "GetGamesFollowed", 1, steamid=steam_id)
+            return response.get("response", {}).get("appids", [])
+        except Exception:
+            logger.exception("Steam API Error (GetGamesFollowedApp): steam_id=%s", steam_id)
+            return []
+
+    async def get_wishlist(self, steam_id: Any) -> Dict[str, Any]:
+        wishlist_dict: Dict[str, Any] = {}
+        async for entries in self.iter_wishlist(steam_id, resolve_all_names=True):
+            wishlist_dict.update(entries)
+        return wishlist_dict
+
+    async def iter_wishlist(self, steam_id: Any, resolve_all_names: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """同 SteamClient.iter_wishlist：价格块与名称查询并发进行，每完成一批就 yield。"""
+        wishlist_ids, followed_ids = await asyncio.gather(self.get_wishlist_app(steam_id), self.get_game_followed(steam_id))
+        app_ids = list(set(wishlist_ids + followed_ids))
+
+        if not app_ids:
+            fallback = await self._get_wishlist_page(steam_id)
+            if fallback:
+                yield fallback
+            return
+
+        chunks = [app_ids[i : i + WISHLIST_PRICE_CHUNK] for i in range(0, len(app_ids), WISHLIST_PRICE_CHUNK)]
+        # task -> None（价格块）或 待补全名称的条目
+        pending: Dict[asyncio.Task, Optional[Dict[str, Any]]] = {
+            asyncio.ensure_future(self.get_app_price(chunk)): None for chunk in chunks
+        }
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    entries = pending.pop(task)
+                    if entries is not None:
+                        yield apply_app_info(entries, task.result() or {})
+                        continue
+
+                    ready, named = {}, {}
+                    for appid_str, entry in wishlist_entries_from_prices(task.result()).items():
+                        if resolve_all_names or best_discount(entry) > 0:
+                            named[appid_str] = entry
+                        else:
+                            ready[appid_str] = entry
+                    if named:
+                        pending[asyncio.ensure_future(self.get_apps_info(list(named)))] = named
+                    if ready:
+                        yield ready
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _get_wishlist_page(self, steam_id: Any) -> Dict[str, Any]:
+        if str(steam_id).isdigit():
+            url = f"https://store.steampowered.com/wishlist/profiles/{steam_id}/wishlistdata/"
+        else:
+            url = f"https://store.steampowered.com/wishlist/id/{steam_id}/wishlistdata/"
+        params = {"p": 0, "cc": "cn", "l": "schinese"}
+        headers = {"User-Agent": "Mozilla/5.0"}
+        try:
+            response = await self._get("store", url, params=params, headers=headers, timeout=10)
+            if response.status_code == 200:
+                return response.json()
+        except Exception:
+            logger.exception("Steam Wishlist Fallback Error: steam_id=%s", steam_id)
+        return {}
+
+    async def iter_inventory_pages(
+        self, steam_id: Any, appid: Any, contextid: Any, page_size: int = 2000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """同 SteamClient.iter_inventory_pages：按 last_assetid / more_items 逐页 yield。"""
+        url = f"https://steamcommunity.com/inventory/{steam_id}/{appid}/{contextid}"
+        start_assetid = None
+        while True:
+            params: Dict[str, Any] = {"l": "schinese", "count": page_size}
+            if start_assetid:
+                params["start_assetid"] = start_assetid
+
+            response = await self._get("community", url, params=params, timeout=15)
+            response.raise_for_status()
+            page = response.json() or {}
+            yield page
+
+            start_assetid = page.get("last_assetid")
+            if not page.get("more_items") or not start_assetid or not page.get("assets"):
+                return
+
+__all__ = ["AsyncSteamClient"]
@@ -1,6 +1,25 @@
 import logging
-
-import requests
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Optional
+
+from src.feature_core.adapters.http.resilience import (
+    CircuitBreakerRegistry,
+    ResilientCaller,
+    ResilientSession,
+    get_circuit_breaker_registry,
+)
+from src.feature_core.adapters.http.rate_limiter import RateLimitedSession, RateLimiterRegistry, get_rate_limiter_registry
+from src.feature_core.adapters.http.session_pool import SessionPool, get_session_pool
+from src.feature_core.adapters.http.single_flight import SingleFlight, SingleFlightSession, get_single_flight, request_key
+from src.feature_core.services.steam.app_metadata_service import SteamAppMetadataService, normalize_app_details
+from src.feature_core.services.steam.task_cancellation import cancellable_sleep, checkpoint, propagate_token
+from src.feature_core.services.steam.wishlist_discount_service import (
+    apply_app_info,
+    best_discount,
+    wishlist_entries_from_prices,
+)
+from src.storage.webapi_manifest_repository import WebApiManifestRepository, get_webapi_manifest_repository
 
 logger = logging.getLogger(__name__)
 
@@ -10,29 +29,107 @@ except ImportError:
     WebAPI = None
     logger.warning("'steam' library not found. Install via 'pip install steam'.")
 
+# ISteamUser.GetPlayerSummaries 单次请求最多接受的 steamid 数量
+MAX_SUMMARY_STEAMIDS = 100
+# 愿望单价格查询每块的 appid 数量（多 ID 查询仅对 price_overview 稳定）
+WISHLIST_PRICE_CHUNK = 50
+
+
+class _CancellableSession:
+    """每次实际发送前检查当前任务是否已取消（注入 WebAPI.session 的最内层，重试的每次尝试都会检查）。"""
+
+    def __init__(self, session):
+        self._session = session
+
+    def request(self, method, url, **kwargs):
+        checkpoint()
+        return self._session.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
 
 class SteamClient:
     """
     Steam 网络客户端（HTTP/WebAPI 适配）。
     - 不依赖 Qt
     - 提供 Steam WebAPI 与部分 Store/Community 非官方接口的封装
+    - 所有 HTTP 请求（含 WebAPI）都经由进程级共享的 SessionPool，复用 keep-alive 连接
+    - 请求节奏由共享的 RateLimiterRegistry 按端点族控制（不再使用固定 sleep）
+    - 网络失败按幂等性重试（指数退避 + 抖动），并经由按 host 的熔断器快速失败
+    - 并发中的相同 GET（端点 + 参数）经由共享的 SingleFlight 合并为一次网络请求
+    - 当前上下文绑定了取消令牌时，每次发送前与限速等待中检查取消（见 task_cancellation）
     """
 
-    def __init__(self, api_key):
+    def __init__(
+        self,
+        api_key,
+        *,
+        session_pool: Optional[SessionPool] = None,
+        manifest_repository: Optional[WebApiManifestRepository] = None,
+        rate_limiter: Optional[RateLimiterRegistry] = None,
+        app_metadata: Optional[SteamAppMetadataService] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+        single_flight: Optional[SingleFlight] = None,
+    ):
         self.api_key = api_key
         self.api = None
+        self._api_lock = threading.Lock()
+        self._http = session_pool or get_session_pool()
+        self._manifests = manifest_repository or get_webapi_manifest_repository()
+        self._limiter = rate_limiter or get_rate_limiter_registry()
+        self._app_metadata = app_metadata
+        # 重试退避与限速等待一样可被取消：已取消的任务不会在退避中卡住池线程
+        self._resilience = ResilientCaller(circuit_breakers or get_circuit_breaker_registry(), sleep=cancellable_sleep)
+        self._flight = single_flight or get_single_flight()
         # 移除 __init__ 中的 WebAPI 初始化，改为懒加载
         # 因为 WebAPI(key=...) 会立即发起网络请求获取接口列表，这会阻塞主线程
 
     def _ensure_api(self):
-        """确保 WebAPI 已初始化"""
-        if self.api is None and WebAPI and self.api_key:
+        """确保 WebAPI 已初始化（并发拉取时可能被多个线程同时调用）"""
+        if self.api is not None or not WebAPI or not self.api_key:
+            return
+        with self._api_lock:
+            if self.api is not None:
+                return
             try:
-                self.api = WebAPI(key=self.api_key)
+                api = WebAPI(key=self.api_key, auto_load_interfaces=False)
+                # WebAPI 只调用 session.get/post：注入“合并 -> 重试/熔断 -> 限速 -> SessionPool”包装，接口列表与后续调用都复用池内连接
+                api.session = SingleFlightSession(
+                    ResilientSession(
+                        RateLimitedSession(_CancellableSession(self._http), self._limiter, "webapi", sleep=cancellable_sleep),
+                        self._resilience,
+                    ),
+                    self._flight,
+                )
+                # 接口清单走本地缓存（TTL + Key 校验），命中时构建绑定无需任何网络请求
+                api.load_interfaces(self._manifests.get_or_fetch(self.api_key, api.fetch_interfaces))
+                self.api = api
             except Exception as e:
                 logger.exception("Failed to initialize WebAPI")
                 # 这里不抛出异常，让后续调用自行处理 None
 
+    def _http_get(self, family, url, **kwargs):
+        """
+        非 WebAPI 请求的统一出口：
+        - 最外层合并并发中的相同请求（端点 + 参数），共享同一个响应
+        - 重试/熔断在其内，每次尝试都重新经过限速器
+        - 按端点族限速，并根据 429/Retry-After 调整节奏
+        - 任务已取消时，在等待令牌期间或发送前抛出 TaskCancelled
+        """
+
+        def send():
+            checkpoint()
+            return self._http.get(url, **kwargs)
+
+        return self._flight.do(
+            request_key("GET", url, kwargs.get("params")),
+            lambda: self._resilience.call("GET", url, lambda: self._limiter.call(family, send, sleep=cancellable_sleep)),
+        )
+
     def get_player_summaries(self, steam_ids):
         """
         获取玩家基本信息 (头像, 昵称, 状态)
@@ -49,6 +146,19 @@ class SteamClient:
             logger.exception("Steam API Error (GetPlayerSummaries): steam_ids=%s", steam_ids)
             return []
 
+    def get_player_summaries_batched(self, steam_ids):
+        """
+        批量获取多个账号的 summary：每次请求最多 MAX_SUMMARY_STEAMIDS 个 steamid（逗号分隔）。
+        返回 {steamid: player}；失败的批次不包含在结果中。
+        """
+        ids = [str(sid) for sid in steam_ids if sid]
+        players = {}
+        for i in range(0, len(ids), MAX_SUMMARY_STEAMIDS):
+            for player in self.get_player_summaries(",".join(ids[i : i + MAX_SUMMARY_STEAMIDS])):
+                if isinstance(player, dict) and player.get("steamid"):
+                    players[str(player["steamid"])] = player
+        return players
+
     def get_owned_games(self, steam_id):
         """
         获取拥有的游戏列表 (包含时长)
@@ -98,7 +208,7 @@ class SteamClient:
         params = {"appids": app_ids_str, "filters": "price_overview", "cc": "cn", "l": "schinese"}
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self._http_get("store_appdetails", url, params=params, timeout=10)
             if response.status_code == 200:
                 return response.json()
         except Exception as e:
@@ -123,7 +233,7 @@ class SteamClient:
 
     # --- 以下为原逻辑：保留不动（后续再考虑继续拆分/下沉） ---
 
-    def get_all_apps(
+    def iter_app_list_pages(
         self,
         include_games=True,
         include_dlc=False,
@@ -133,86 +243,81 @@ class SteamClient:
         if_modified_since=None,
         max_results=50000,
     ):
+        """
+        分页拉取 IStoreService.GetAppList，逐页 yield apps 列表（生成器，不在内存中累积全量）。
+        每页只发一次请求：last_appid / if_modified_since 合并进同一组参数。
+        请求失败时抛出异常，由调用方决定是否丢弃已拉取的部分。
+        """
         self._ensure_api()
 
-        all_apps = []
         last_appid = 0
-        import time
+        while True:
+            params = {
+                "include_games": include_games,
+                "include_dlc": include_dlc,
+                "include_software": include_software,
+                "include_videos": include_videos,
+                "include_hardware": include_hardware,
+                "max_results": max_results,
+                "language": "schinese",
+            }
+            if last_appid > 0:
+                params["last_appid"] = last_appid
+            if if_modified_since:
+                params["if_modified_since"] = int(if_modified_since)
+
+            data = self._get_app_list_page(params)
+            apps = data.get("apps", [])
+            if not apps:
+                return
+
+            yield apps
+
+            last_appid = apps[-1]["appid"]
+            if not data.get("have_more_results", False):
+                return
+
+    def _get_app_list_page(self, params):
+        if self.api is not None:
+            try:
+                response = self.api.IStoreService.GetAppList(**params)
+                return response.get("response", {}) or {}
+            except (TypeError, ValueError, AttributeError):
+                # 接口清单里缺少该方法/参数时退回直接请求
+                logger.debug("GetAppList binding unavailable, falling back to raw HTTP", exc_info=True)
 
-        try:
-            while True:
-                try:
-                    response = self.api.IStoreService.GetAppList(
-                        include_games=include_games,
-                        include_dlc=include_dlc,
-                        include_software=include_software,
-                        include_videos=include_videos,
-                        include_hardware=include_hardware,
-                        max_results=max_results,
-                        language="schinese",
-                    )
-                    if last_appid > 0:
-                        response = self.api.IStoreService.GetAppList(
-                            include_games=include_games,
-                            include_dlc=include_dlc,
-                            include_software=include_software,
-                            include_videos=include_videos,
-                            include_hardware=include_hardware,
-                            max_results=max_results,
-                            language="schinese",
-                            last_appid=last_appid,
-                        )
-                    if if_modified_since:
-                        response = self.api.IStoreService.GetAppList(
-                            include_games=include_games,
-                            include_dlc=include_dlc,
-                            include_software=include_software,
-                            include_videos=include_videos,
-                            include_hardware=include_hardware,
-                            max_results=max_results,
-                            language="schinese",
-                            if_modified_since=if_modified_since,
-                        )
-
-                    data = response.get("response", {})
-                    apps = data.get("apps", [])
-                except TypeError:
-                    url = "https://api.steampowered.com/IStoreService/GetAppList/v1/"
-                    params = {
-                        "key": self.api_key,
-                        "include_games": str(include_games).lower(),
-                        "include_dlc": str(include_dlc).lower(),
-                        "include_software": str(include_software).lower(),
-                        "include_videos": str(include_videos).lower(),
-                        "include_hardware": str(include_hardware).lower(),
-                        "max_results": max_results,
-                        "language": "schinese",
-                    }
-
-                    if last_appid > 0:
-                        params["last_appid"] = last_appid
-
-                    if if_modified_since:
-                        params["if_modified_since"] = if_modified_since
-
-                    resp = requests.get(url, params=params, timeout=30)
-                    if resp.status_code != 200:
-                        logger.error("Steam API Error (GetAppList): HTTP %s", resp.status_code)
-                        break
-
-                    data = resp.json().get("response", {})
-                    apps = data.get("apps", [])
-
-                if not apps:
-                    break
+        url = "https://api.steampowered.com/IStoreService/GetAppList/v1/"
+        raw_params = {"key": self.api_key}
+        for name, value in params.items():
+            raw_params[name] = str(value).lower() if isinstance(value, bool) else value
 
-                all_apps.extend(apps)
-                last_appid = apps[-1]["appid"]
-                have_more_results = data.get("have_more_results", False)
-                if not have_more_results:
-                    break
-                time.sleep(0.5)
+        resp = self._http_get("webapi", url, params=raw_params, timeout=30)
+        resp.raise_for_status()
+        return resp.json().get("response", {}) or {}
 
+    def get_all_apps(
+        self,
+        include_games=True,
+        include_dlc=False,
+        include_software=False,
+        include_videos=False,
+        include_hardware=False,
+        if_modified_since=None,
+        max_results=50000,
+    ):
+        """兼容接口：一次性返回全部 apps。大批量同步请使用 iter_app_list_pages。"""
+        all_apps = []
+        try:
+            for apps in self.iter_app_list_pages(
+                include_games=include_games,
+                include_dlc=include_dlc,
+                include_software=include_software,
+                include_videos=include_videos,
+                include_hardware=include_hardware,
+                if_modified_since=if_modified_since,
+                max_results=max_results,
+            ):
+                all_apps.extend(apps)
         except Exception as e:
             logger.exception("Steam API Error (GetAppList)")
 
@@ -220,34 +325,46 @@ class SteamClient:
 
     def get_apps_info(self, app_ids):
         """
-        获取游戏基本信息 (名称, 图标等)
-        由于 appdetails 接口多 ID 查询不稳定，改为逐个查询。
+        获取游戏基本信息 (名称, 简介, 类型, 封面, 发售日期)
+        配置了 app_metadata 时优先读缓存，仅为未命中/过期的 appid 发起请求。
+        返回 {appid_str: normalize_app_details 记录}。
         """
         if not app_ids:
             return {}
 
+        if self._app_metadata is not None:
+            return self._app_metadata.get_many(app_ids, self._fetch_apps_info)
+
+        fetched = self._fetch_apps_info(app_ids)
         result = {}
-        import time
+        for appid_str, data in fetched.items():
+            record = normalize_app_details(data)
+            if record:
+                result[appid_str] = record
+        return result
 
+    def _fetch_apps_info(self, app_ids):
+        """
+        逐个请求 appdetails（多 ID 查询仅对 price_overview 稳定）。
+        返回 {appid_str: data}；success=false 的 appid 映射为 None，请求失败的 appid 不出现在结果中。
+        """
+        result = {}
         url = "https://store.steampowered.com/api/appdetails"
-        
+
         for appid in app_ids:
-            # 逐个查询，使用 filters=basic 减少数据量
-            params = {"appids": appid, "filters": "basic", "cc": "cn", "l": "schinese"}
+            # 逐个查询，使用 filters 限制数据量
+            params = {"appids": appid, "filters": "basic,release_date", "cc": "cn", "l": "schinese"}
             try:
-                response = requests.get(url, params=params, timeout=5)
+                response = self._http_get("store_appdetails", url, params=params, timeout=5)
                 if response.status_code == 200:
-                    data = response.json()
+                    data = response.json() or {}
                     # data 结构: {"730": {"success": true, "data": {...}}}
                     appid_str = str(appid)
-                    if appid_str in data and data[appid_str].get("success"):
-                        result[appid_str] = data[appid_str].get("data", {})
-                
-                # 避免请求过快
-                time.sleep(0.1)
+                    entry = data.get(appid_str) or {}
+                    result[appid_str] = entry.get("data", {}) if entry.get("success") else None
             except Exception as e:
                 logger.exception("Steam API Error (get_apps_info): appid=%s", appid)
-        
+
         return result
 
     def get_wishlist_app(self, steam_id):
@@ -276,43 +393,60 @@ class SteamClient:
         return app_ids
 
     def get_wishlist(self, steam_id):
+        """一次性返回完整愿望单 {appid_str: {"subs", "name", "capsule"}}（所有条目都补全名称）。"""
+        wishlist_dict = {}
+        for entries in self.iter_wishlist(steam_id, resolve_all_names=True):
+            wishlist_dict.update(entries)
+        return wishlist_dict
+
+    def iter_wishlist(self, steam_id, max_in_flight=1, resolve_all_names=False):
+        """
+        愿望单富化流水线（生成器），每完成一批就 yield {appid_str: 条目}：
+        - 价格分块查询与名称查询在同一个线程池中并发执行，节奏仍由共享限速器控制
+        - 名称按价格块批量查询（每块一次 get_apps_info），命中元数据缓存的条目不再请求
+        - 默认只为有折扣的条目查询名称（展示只用到折扣条目），其余条目拿到价格后直接 yield
+        - 愿望单列表为空时退回 wishlistdata 页面，一次性 yield
+        """
         self._ensure_api()
 
         app_ids1 = self.get_wishlist_app(steam_id)
         app_ids2 = self.get_game_followed(steam_id)
         app_ids = list(set(app_ids1 + app_ids2))
 
-        if app_ids:
-            wishlist_dict = {}
-            import time
-
-            app_info_map = self.get_apps_info(app_ids)
-
-            chunk_size = 50
-            for i in range(0, len(app_ids), chunk_size):
-                chunk = app_ids[i : i + chunk_size]
-                details_map = self.get_app_price(chunk)
-
-                for appid_str, data_wrapper in details_map.items():
-                    if not data_wrapper.get("success"):
-                        continue
-                    data = data_wrapper.get("data", {})
-                    if not isinstance(data, dict):
+        if not app_ids:
+            fallback = self._get_wishlist_page(steam_id)
+            if fallback:
+                yield fallback
+            return
+
+        chunks = [app_ids[i : i + WISHLIST_PRICE_CHUNK] for i in range(0, len(app_ids), WISHLIST_PRICE_CHUNK)]
+        with ThreadPoolExecutor(max_workers=max(1, int(max_in_flight or 1)), thread_name_prefix="steam-wishlist") as pool:
+            # future -> None（价格块）或 待补全名称的条目
+            # 池线程不继承 contextvars：显式带上当前任务的取消令牌
+            get_app_price = propagate_token(self.get_app_price)
+            get_apps_info = propagate_token(self.get_apps_info)
+            pending = {pool.submit(get_app_price, chunk): None for chunk in chunks}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    entries = pending.pop(future)
+                    if entries is not None:
+                        yield apply_app_info(entries, future.result() or {})
                         continue
 
-                    price_overview = data.get("price_overview", {})
-                    sub = {"discount_pct": price_overview.get("discount_percent", 0), "price": price_overview.get("final_formatted", "")}
-
-                    info = app_info_map.get(str(appid_str), {})
-                    name = info.get("name", "Unknown")
-
-                    wishlist_dict[str(appid_str)] = {"subs": [sub], "name": name}
-
-                if i + chunk_size < len(app_ids):
-                    time.sleep(0.2)
-
-            return wishlist_dict
-
+                    ready, named = {}, {}
+                    for appid_str, entry in wishlist_entries_from_prices(future.result()).items():
+                        if resolve_all_names or best_discount(entry) > 0:
+                            named[appid_str] = entry
+                        else:
+                            ready[appid_str] = entry
+                    if named:
+                        # 每个价格块只发起一次名称查询：get_apps_info 经元数据缓存只请求未命中的 appid
+                        pending[pool.submit(get_apps_info, list(named))] = named
+                    if ready:
+                        yield ready
+
+    def _get_wishlist_page(self, steam_id):
         if str(steam_id).isdigit():
             url = f"https://store.steampowered.com/wishlist/profiles/{steam_id}/wishlistdata/"
         else:
@@ -322,7 +456,7 @@ class SteamClient:
         headers = {"User-Agent": "Mozilla/5.0"}
 
         try:
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            response = self._http_get("store", url, params=params, headers=headers, timeout=10)
             if response.status_code == 200:
                 return response.json()
         except Exception as e:
@@ -330,14 +464,31 @@ class SteamClient:
 
         return {}
 
-    def get_player_inventory(self, steam_id, appid, contextid):
+    def iter_inventory_pages(self, steam_id, appid, contextid, page_size=2000):
+        """
+        分页拉取社区库存，逐页 yield 原始 JSON（生成器，不在内存中累积全部页）。
+        按 last_assetid / more_items 翻页；请求失败时抛出异常，由调用方决定是否丢弃已累计的部分。
+        """
         url = f"https://steamcommunity.com/inventory/{steam_id}/{appid}/{contextid}"
-        params = {"l": "schinese", "count": 5000}
+        start_assetid = None
+        while True:
+            params = {"l": "schinese", "count": page_size}
+            if start_assetid:
+                params["start_assetid"] = start_assetid
 
-        try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self._http_get("community", url, params=params, timeout=15)
             response.raise_for_status()
-            return response.json()
+            page = response.json() or {}
+            yield page
+
+            start_assetid = page.get("last_assetid")
+            if not page.get("more_items") or not start_assetid or not page.get("assets"):
+                return
+
+    def get_player_inventory(self, steam_id, appid, contextid):
+        """兼容接口：仅返回第一页。完整统计请使用 iter_inventory_pages。"""
+        try:
+            return next(self.iter_inventory_pages(steam_id, appid, contextid), None)
         except Exception as e:
             logger.exception(
                 "Steam Inventory Request Error: steam_id=%s appid=%s contextid=%s",
@@ -347,7 +498,6 @@ class SteamClient:
             )
             return None
 
-
-__all__ = ["SteamClient"]
+__all__ = ["MAX_SUMMARY_STEAMIDS", "SteamClient"]
 
 
@@ -4,9 +4,11 @@ import logging
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
 
+from src.feature_core.app.background_executor import BackgroundExecutor, get_background_executor
 from src.feature_core.services.epic_free_games_service import EpicFreeGamesService
+from src.feature_core.services.refresh_scheduler import RefreshScheduler
 
 
 logger = logging.getLogger(__name__)
@@ -16,22 +18,16 @@ if TYPE_CHECKING:
     from src.feature_core.adapters.qt.steam_facade_qt import SteamFacadeQt
 
 
-class _EpicFreeGamesWorker(QThread):
-    data_ready = pyqtSignal(dict)
-
-    def __init__(self, service: EpicFreeGamesService):
-        super().__init__()
-        self._service = service
-
-    def run(self) -> None:
-        result: dict = {"type": "epic_free_games", "data": None, "error": None}
-        try:
-            snapshot = self._service.get_snapshot(locale="zh-CN", country="CN", allow_countries="CN")
-            items = self._service.build_info_window_items(snapshot)
-            result["data"] = {"items": items}
-        except Exception as e:
-            result["error"] = str(e)
-        self.data_ready.emit(result)
+def _fetch_free_games(service: EpicFreeGamesService) -> dict:
+    """在后台执行器的 network 通道中运行：拉取 Epic 免费游戏快照（不抛出异常）。"""
+    result: dict = {"type": "epic_free_games", "data": None, "error": None}
+    try:
+        snapshot = service.get_snapshot(locale="zh-CN", country="CN", allow_countries="CN")
+        items = service.build_info_window_items(snapshot)
+        result["data"] = {"items": items}
+    except Exception as e:
+        result["error"] = str(e)
+    return result
 
 
 class EpicFreeGamesFacadeQt(QObject):
@@ -39,6 +35,8 @@ class EpicFreeGamesFacadeQt(QObject):
 
     on_epic_free_games_data = pyqtSignal(list)
     on_error = pyqtSignal(str)
+    # 后台线程 -> 主线程
+    _result_ready = pyqtSignal(dict)
 
     def __init__(
         self,
@@ -46,13 +44,18 @@ class EpicFreeGamesFacadeQt(QObject):
         service: EpicFreeGamesService | None = None,
         steam_manager: "SteamFacadeQt | None" = None,
         cache_key: str = "free_game",
+        executor: BackgroundExecutor | None = None,
+        refresh_scheduler: RefreshScheduler | None = None,
     ):
         super().__init__()
         self._service = service or EpicFreeGamesService()
-        self._active_workers: list[_EpicFreeGamesWorker] = []
+        self._executor = executor or get_background_executor()
+        self._result_ready.connect(self._handle_result, Qt.ConnectionType.QueuedConnection)
         self._last_items: list[dict] = []
         self._steam_manager = steam_manager
         self._cache_key = cache_key
+        # 默认与 Steam 缓存共用刷新时间戳（Epic 数据同样落在 game_data.json）
+        self._refresh_scheduler = refresh_scheduler or getattr(steam_manager, "refresh_scheduler", None)
 
         self._load_cached_from_game_data()
 
@@ -77,17 +80,19 @@ class EpicFreeGamesFacadeQt(QObject):
         if isinstance(items, list):
             self._last_items = items
 
-    def fetch_free_games(self) -> None:
-        worker = _EpicFreeGamesWorker(self._service)
-        worker.data_ready.connect(self._handle_result)
-        worker.finished.connect(lambda: self._cleanup_worker(worker))
+    def refresh_if_stale(self) -> bool:
+        """仅在 Epic 数据过期（或从未成功获取）时刷新；返回是否发起了请求。"""
+        scheduler = self._refresh_scheduler
+        if scheduler is not None and self._last_items and not scheduler.is_stale("epic"):
+            return False
+        self.fetch_free_games()
+        return True
 
-        self._active_workers.append(worker)
-        worker.start()
+    def fetch_free_games(self) -> None:
+        self._executor.submit("network", self._run_fetch, name="epic_free_games")
 
-    def _cleanup_worker(self, worker: _EpicFreeGamesWorker) -> None:
-        if worker in self._active_workers:
-            self._active_workers.remove(worker)
+    def _run_fetch(self) -> None:
+        self._result_ready.emit(_fetch_free_games(self._service))
 
     def _handle_result(self, result: dict) -> None:
         if result.get("error"):
@@ -98,6 +103,8 @@ class EpicFreeGamesFacadeQt(QObject):
         items = data.get("items") or []
         if isinstance(items, list):
             self._last_items = items
+            if self._refresh_scheduler is not None:
+                self._refresh_scheduler.mark_success("epic")
             self._persist_to_game_data(items)
             self.on_epic_free_games_data.emit(items)
 
@@ -110,8 +117,9 @@ class EpicFreeGamesFacadeQt(QObject):
         repo = getattr(sm, "repository", None)
         if not isinstance(cache, dict) or repo is None:
             return
+        save_changes = getattr(repo, "save_changes", None)
         save_data = getattr(repo, "save_data", None)
-        if not callable(save_data):
+        if not callable(save_changes) and not callable(save_data):
             return
 
         try:
@@ -119,7 +127,11 @@ class EpicFreeGamesFacadeQt(QObject):
                 "updated_at": datetime.now().isoformat(timespec="seconds"),
                 "items": items,
             }
-            save_data(cache)
+            # 只写 Epic 这一段（及刷新时间戳），不重写整个缓存
+            if callable(save_changes):
+                save_changes(cache, {self._cache_key: None, "refresh_state": None})
+            else:
+                save_data(cache)
         except Exception as e:
             logger.exception("Failed to persist epic free games into game data")
             try:
@@ -4,44 +4,39 @@ import logging
 from datetime import datetime
 from typing import Optional
 
-from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
 
+from src.feature_core.app.background_executor import BackgroundExecutor, get_background_executor
 from src.feature_core.services.game_news_service import GameNewsService
+from src.feature_core.services.refresh_scheduler import RefreshScheduler
 from src.storage.news_repository import NewsRepository
 
 
 logger = logging.getLogger(__name__)
 
 
-class _GameNewsWorker(QThread):
-    data_ready = pyqtSignal(dict)
-
-    def __init__(self, service: GameNewsService, *, force_refresh: bool = False):
-        super().__init__()
-        self._service = service
-        self._force_refresh = force_refresh
-
-    def run(self) -> None:
-        result: dict = {"type": "news", "data": None, "error": None}
-        try:
-            items, from_cache = self._service.get_news(force_refresh=self._force_refresh)
-            result["data"] = {
-                "items": [
-                    {
-                        "title": it.title,
-                        "source": it.source,
-                        "pub_date": _format_pub_date(it.published_at),
-                        "link": it.url,
-                        "summary": it.summary,
-                    }
-                    for it in items
-                ],
-                "from_cache": from_cache,
-            }
-        except Exception as e:
-            logger.exception("GameNews worker failed: force_refresh=%s", self._force_refresh)
-            result["error"] = str(e)
-        self.data_ready.emit(result)
+def _fetch_news(service: GameNewsService, force_refresh: bool) -> dict:
+    """在后台执行器的 network 通道中运行：拉取新闻并转换为 UI 结构（不抛出异常）。"""
+    result: dict = {"type": "news", "data": None, "error": None}
+    try:
+        items, from_cache = service.get_news(force_refresh=force_refresh)
+        result["data"] = {
+            "items": [
+                {
+                    "title": it.title,
+                    "source": it.source,
+                    "pub_date": _format_pub_date(it.published_at),
+                    "link": it.url,
+                    "summary": it.summary,
+                }
+                for it in items
+            ],
+            "from_cache": from_cache,
+        }
+    except Exception as e:
+        logger.exception("GameNews fetch failed: force_refresh=%s", force_refresh)
+        result["error"] = str(e)
+    return result
 
 
 def _format_pub_date(dt: Optional[datetime]) -> str:
@@ -60,29 +55,43 @@ class GameNewsFacadeQt(QObject):
 
     on_news_data = pyqtSignal(list)
     on_error = pyqtSignal(str)
-
-    def __init__(self, *, repository: Optional[NewsRepository] = None, service: Optional[GameNewsService] = None):
+    # 后台线程 -> 主线程
+    _result_ready = pyqtSignal(dict)
+
+    def __init__(
+        self,
+        *,
+        repository: Optional[NewsRepository] = None,
+        service: Optional[GameNewsService] = None,
+        executor: Optional[BackgroundExecutor] = None,
+        refresh_scheduler: Optional[RefreshScheduler] = None,
+    ):
         super().__init__()
         self._repository = repository or NewsRepository()
         self._service = service or GameNewsService(self._repository)
-        self._active_workers: list[_GameNewsWorker] = []
+        self._executor = executor or get_background_executor()
+        # 记录最近一次联网成功的时间；打开窗口仍读本地按日缓存，后台定时器据此决定是否强制联网刷新
+        self._refresh_scheduler = refresh_scheduler
+        self._result_ready.connect(self._handle_result, Qt.ConnectionType.QueuedConnection)
 
         try:
             self._repository.error_occurred.connect(self.on_error.emit)
         except Exception:
             logger.exception("Failed to connect NewsRepository.error_occurred")
 
-    def fetch_news(self, *, force_refresh: bool = False) -> None:
-        worker = _GameNewsWorker(self._service, force_refresh=force_refresh)
-        worker.data_ready.connect(self._handle_result)
-        worker.finished.connect(lambda: self._cleanup_worker(worker))
+    def refresh_if_stale(self) -> bool:
+        """仅在新闻过期（或从未联网获取）时强制联网刷新；返回是否发起了请求。"""
+        scheduler = self._refresh_scheduler
+        if scheduler is not None and not scheduler.is_stale("news"):
+            return False
+        self.fetch_news(force_refresh=True)
+        return True
 
-        self._active_workers.append(worker)
-        worker.start()
+    def fetch_news(self, *, force_refresh: bool = False) -> None:
+        self._executor.submit("network", self._run_fetch, force_refresh, name="news")
 
-    def _cleanup_worker(self, worker: _GameNewsWorker) -> None:
-        if worker in self._active_workers:
-            self._active_workers.remove(worker)
+    def _run_fetch(self, force_refresh: bool) -> None:
+        self._result_ready.emit(_fetch_news(self._service, force_refresh))
 
     def _handle_result(self, result: dict) -> None:
         if result.get("error"):
@@ -91,6 +100,8 @@ class GameNewsFacadeQt(QObject):
             return
         data = result.get("data") or {}
         items = data.get("items") or []
+        if self._refresh_scheduler is not None and not data.get("from_cache"):
+            self._refresh_scheduler.mark_success("news")
         if isinstance(items, list):
             self.on_news_data.emit(items)
 
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import logging
-import threading
 import time
 import uuid
 from typing import Optional
 
 from PyQt6.QtCore import QObject
 
+from src.feature_core.app.background_executor import BackgroundExecutor, get_background_executor
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +29,7 @@ class SayHelloFacadeQt(QObject):
         llm_service,
         prompt_manager,
         steam_manager,
+        executor: Optional[BackgroundExecutor] = None,
     ) -> None:
         super().__init__()
         self._ui_intents = ui_intents
@@ -36,6 +38,7 @@ class SayHelloFacadeQt(QObject):
         self._prompt_manager = prompt_manager
         self._steam_manager = steam_manager
         self._active_request_id: Optional[str] = None
+        self._executor = executor or get_background_executor()
 
     def say_hello(self, **kwargs) -> None:
         _ = kwargs
@@ -99,7 +102,7 @@ class SayHelloFacadeQt(QObject):
                 if self._active_request_id == request_id:
                     self._ui_intents.say_hello_stream_done.emit(request_id)
 
-        threading.Thread(target=_run, daemon=True).start()
+        self._executor.submit("llm", _run, name="say_hello")
 
 
 __all__ = ["SayHelloFacadeQt"]
@@ -1,8 +1,13 @@
+import itertools
+import json
 import logging
-from typing import Optional
+import time
+from typing import Any, Dict, Optional
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
+from src.feature_core.adapters.http.resilience import CircuitBreakerRegistry
+from src.feature_core.services.refresh_scheduler import RefreshScheduler
 from src.feature_core.services.steam.games_aggregator import GamesAggregator
 from src.feature_core.services.steam.account_service import SteamAccountService
 from src.feature_core.domain.steam_account_models import SteamAccountPolicy
@@ -13,22 +18,45 @@ from src.feature_core.services.steam.profile_service import SteamProfileService
 from src.feature_core.services.steam.price_service import SteamPriceService
 from src.feature_core.services.steam.wishlist_service import SteamWishlistService
 from src.feature_core.services.steam.achievement_service import SteamAchievementService
+from src.feature_core.services.steam.app_catalog_service import SteamAppCatalogService
+from src.feature_core.services.steam.app_metadata_service import SteamAppMetadataService
+from src.feature_core.services.steam.cache_changes import merge_changes
+from src.feature_core.services.steam.job_journal import JOURNALED_TASK_TYPES, JobJournal
+from src.feature_core.services.steam.inventory_service import (
+    DEFAULT_INVENTORY_APPID,
+    DEFAULT_INVENTORY_CONTEXTID,
+    SteamInventoryService,
+)
+from src.feature_core.services.steam.payload_projection import project_cache
 from src.feature_core.services.steam.steam_result_processor import (
     EmitAchievements,
     EmitError,
     EmitGamesStats,
+    EmitInventory,
     EmitPlayerSummary,
+    EmitProgress,
     EmitStorePrices,
     EmitWishlist,
     SaveStep,
     SteamResultProcessor,
 )
 from src.feature_core.services.steam.steam_ports import SteamRepositoryPort, SteamTaskServicePort
+from src.feature_core.services.steam.task_priority import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_VISIBLE,
+)
 
 
 logger = logging.getLogger(__name__)
 
 
+# 在途任务超过该时长仍未返回则视为丢失：不再与之合并，允许重新提交
+_INFLIGHT_TTL_SECONDS = 120.0
+# 批量作业的 partial 结果最多每隔这么久落盘一次（退出时再补一次）
+_CHECKPOINT_INTERVAL_SECONDS = 5.0
+
+
 class SteamFacadeQt(QObject):
     """
     Qt 对外入口：SteamFacadeQt
@@ -41,7 +69,12 @@ class SteamFacadeQt(QObject):
     on_store_prices = pyqtSignal(dict)
     on_wishlist_data = pyqtSignal(list)
     on_achievements_data = pyqtSignal(dict)
+    on_inventory_data = pyqtSignal(dict)
+    # 长任务（价格/成就）进度：{"type", "task_id", "done", "total", "elapsed", "eta"}
+    on_task_progress = pyqtSignal(dict)
     on_error = pyqtSignal(str)
+    # 各 host 熔断状态 {host: "closed"|"open"|"half_open"}；可能由 worker 线程触发（跨线程排队投递）
+    on_circuit_state = pyqtSignal(dict)
 
     def __init__(
         self,
@@ -49,6 +82,9 @@ class SteamFacadeQt(QObject):
         *,
         repository: SteamRepositoryPort,
         task_service: SteamTaskServicePort,
+        app_metadata: Optional[SteamAppMetadataService] = None,
+        app_catalog: Optional[SteamAppCatalogService] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
     ):
         super().__init__()
         self.config = config_manager
@@ -60,6 +96,24 @@ class SteamFacadeQt(QObject):
         self.games_aggregator = GamesAggregator()
         self.repository = repository
         self.service = task_service  # Qt worker：异步抓取
+        # 在途任务：相同 (api_key, task_type, steam_id, extra_data) 只保留一个，重复提交直接合并
+        self._task_ids = itertools.count(1)
+        self._inflight: Dict[int, Dict[str, Any]] = {}
+        self._inflight_by_key: Dict[tuple, int] = {}
+        self._coalesced = 0
+        # 已取消但最终结果尚未返回的任务：其结果（含 partial）一律丢弃
+        self._cancelled_ids: set = set()
+        self._cancelled = 0
+        self._cancelled_dropped = 0
+        # 当前游戏聚合轮次：(账号列表, 主账号, 开始时间)
+        self._games_round: Optional[tuple] = None
+        # 应用元数据缓存（名称/简介/封面等）：供 worker 与推荐等非 worker 路径共享
+        self.app_metadata = app_metadata
+        # 本地 appid→name 目录：同步在 worker 中进行，查询纯本地
+        self.app_catalog = app_catalog
+        self.circuit_breakers = circuit_breakers
+        if self.circuit_breakers is not None:
+            self.circuit_breakers.add_listener(self._on_circuit_change)
         # 纯业务子域（不依赖 Qt）：现阶段不做“多 service 协同”，Qt 直接调用这些子域
         self.account_service = SteamAccountService()
         self.query_service = SteamQueryService()
@@ -69,6 +123,7 @@ class SteamFacadeQt(QObject):
         self.price_service = SteamPriceService()
         self.wishlist_service = SteamWishlistService()
         self.achievement_service = SteamAchievementService()
+        self.inventory_service = SteamInventoryService()
 
         try:
             self.repository.set_error_handler(self.on_error.emit)
@@ -78,10 +133,29 @@ class SteamFacadeQt(QObject):
 
         self.cache = self.repository.load_data()
 
+        # 旧版本缓存保留了原始 payload 的全部字段：按投影裁剪一次
+        slimmed = project_cache(self.cache)
         # 启动/离线：若 games 缺失，则基于本地 games_accounts 聚合一次并落盘
-        if self.games_aggregation_service.ensure_games_from_accounts(self.cache):
+        if self.games_aggregation_service.ensure_games_from_accounts(self.cache) or slimmed:
             self.repository.save_data(self.cache)
 
+        # 各类数据最近一次成功获取的时间戳：随 game_data.json 落盘，重启后未过期的数据不再请求
+        refresh_state = self.cache.get("refresh_state")
+        if not isinstance(refresh_state, dict):
+            refresh_state = {}
+            self.cache["refresh_state"] = refresh_state
+        self.refresh_scheduler = RefreshScheduler(refresh_state, ttls=self.config.get("refresh_ttls"))
+        # 价格/成就批量作业的断点日志：与已合并的数据一起落盘，下次启动跳过已完成的 appid
+        jobs_state = self.cache.get("jobs")
+        if not isinstance(jobs_state, dict):
+            jobs_state = {}
+            self.cache["jobs"] = jobs_state
+        self.job_journal = JobJournal(jobs_state)
+        self._checkpoint_dirty = False
+        self._last_checkpoint = 0.0
+        # 有任务出错的作业：其最后一个在途任务结束时保留作业（下次续传），不视为完成
+        self._failed_jobs: set = set()
+
         self._result_processor = SteamResultProcessor(
             cache=self.cache,
             games_aggregator=self.games_aggregator,
@@ -91,10 +165,13 @@ class SteamFacadeQt(QObject):
             price_service=self.price_service,
             wishlist_service=self.wishlist_service,
             achievement_service=self.achievement_service,
+            inventory_service=self.inventory_service,
         )
 
-        self.fetch_player_summary()
-        self.fetch_games_stats() 
+        # 启动只刷新已过期的数据，且走后台优先级，不与用户随后打开窗口触发的请求抢占线程
+        self.refresh_stale(("summary", "games"), priority=PRIORITY_BACKGROUND)
+        self._resume_jobs()
+        self.sync_app_catalog()
 
     def invalidate_account_policy_cache(self) -> None:
         """
@@ -106,9 +183,20 @@ class SteamFacadeQt(QObject):
         """
         账号凭证发生变化后的最小刷新动作：
         - 失效账号策略缓存
+        - 取消旧 API Key / 已移除账号的在途任务，避免其结果写入缓存
         - 重新抓取 games_stats + player_summary
         """
         self.invalidate_account_policy_cache()
+        policy = self._policy()
+        account_ids = {str(sid) for sid in policy.account_ids}
+
+        def is_stale(key, task_type, target):
+            if key != policy.api_key:
+                return True
+            # 目录同步与账号无关，只要 Key 未变就继续
+            return task_type != "app_catalog" and target not in account_ids
+
+        self._cancel_inflight(is_stale, "credentials_changed")
         self.fetch_games_stats()
         self.fetch_player_summary()
 
@@ -124,13 +212,57 @@ class SteamFacadeQt(QObject):
         policy = self._policy()
         return policy.api_key, policy.primary_id
 
-    def fetch_player_summary(self):
+    def refresh_stale(self, kinds=("summary", "games"), priority=None):
+        """
+        只为已过期（超过 TTL 或从未成功获取）的数据发起请求；返回实际提交刷新的数据类型。
+        支持 summary / games（任一账号过期即重新聚合全部账号）/ wishlist；priority 为 None 时使用各 fetch 的默认优先级。
+        用户手动刷新请直接调用对应的 fetch_*。
+        """
+        scheduler = self.refresh_scheduler
+        options = {} if priority is None else {"priority": priority}
+        refreshed = []
+        for kind in kinds:
+            if kind == "games":
+                stale = bool(scheduler.stale_keys("games", self._policy().account_ids))
+            else:
+                stale = scheduler.is_stale(kind)
+            if not stale:
+                continue
+            fetch = {
+                "summary": self.fetch_player_summary,
+                "games": self.fetch_games_stats,
+                "wishlist": self.fetch_wishlist,
+            }.get(kind)
+            if fetch is None:
+                logger.warning("refresh_stale: unsupported kind %s", kind)
+                continue
+            fetch(**options)
+            refreshed.append(kind)
+        if refreshed:
+            logger.debug("Refreshing stale steam data: %s", refreshed)
+        return refreshed
+
+    def _mark_refreshed(self, result):
+        """完整成功的结果记录刷新时间（partial/出错/空数据不记录）。"""
+        if result.get("error") or result.get("partial") or result.get("data") is None:
+            return
+        task_type = result.get("type")
+        if task_type in ("summary", "profiles"):
+            self.refresh_scheduler.mark_success("summary")
+        elif task_type in ("games", "profile_and_games"):
+            self.refresh_scheduler.mark_success("games", result.get("steam_id"))
+        elif task_type == "wishlist":
+            self.refresh_scheduler.mark_success("wishlist")
+        elif task_type == "store_prices":
+            self.refresh_scheduler.mark_success("prices")
+
+    def fetch_player_summary(self, priority=PRIORITY_INTERACTIVE):
         key, sid = self._get_primary_credentials()
         if not key or not sid:
             return
-        self.service.start_task(key, sid, "summary")
+        self._submit(key, sid, "summary", priority=priority)
 
-    def fetch_games_stats(self):
+    def fetch_games_stats(self, priority=PRIORITY_INTERACTIVE):
         policy = self._policy()
         key = policy.api_key
         ids = policy.account_ids
@@ -138,28 +270,310 @@ class SteamFacadeQt(QObject):
             return
 
         primary_id = policy.primary_id or ids[0]
-        self.games_aggregator.begin(ids, primary_id)
+        # 同一组账号的聚合仍在进行：合并到进行中的这一轮，不再重新开始
+        now = time.monotonic()
+        if (
+            self.games_aggregator.is_active()
+            and self._games_round is not None
+            and self._games_round[:2] == (tuple(ids), primary_id)
+            and now - self._games_round[2] < _INFLIGHT_TTL_SECONDS
+        ):
+            self._coalesced += 1
+            logger.debug("fetch_games_stats coalesced into generation %s", self.games_aggregator.generation)
+            return
+
+        # 所有账号的 summary 合并为一个批量任务，各账号任务只拉取游戏库：
+        # 往返从 3N 次降为 1 次批量 summary + N 次并发等级 + N 次游戏库
+        # 账号组变化时开始新一轮；上一轮仍在途的同账号任务不重复提交，其结果并入新一轮
+        generation = self.games_aggregator.begin(ids, primary_id, batched_profiles=True)
+        self._games_round = (tuple(ids), primary_id, now)
 
+        self._submit(
+            key, primary_id, "profiles", extra_data=list(ids), steam_id=primary_id, priority=priority, generation=generation
+        )
         for sid in ids:
-            self.service.start_task(key, sid, "profile_and_games", steam_id=sid)
+            self._submit(key, sid, "games", steam_id=sid, priority=priority, generation=generation)
 
-    def fetch_store_prices(self, appids):
+    def fetch_store_prices(self, appids, priority=PRIORITY_VISIBLE):
         key, sid = self._get_primary_credentials()
         if not key or not sid:
             return
-        self.service.start_task(key, sid, "store_prices", extra_data=appids)
+        self._submit_job(key, sid, "store_prices", appids, priority)
 
-    def fetch_wishlist(self):
+    def refresh_store_prices(self, appids):
+        """只拉取缺失或已过期（按打折/原价 TTL）的价格；返回实际提交刷新的 appid 数量。"""
+        stale = self.price_service.plan_refresh(self.cache, appids)
+        if stale:
+            self.fetch_store_prices(stale, priority=PRIORITY_INTERACTIVE)
+        return len(stale)
+
+    def fetch_wishlist(self, priority=PRIORITY_INTERACTIVE):
         key, sid = self._get_primary_credentials()
         if not key or not sid:
             return
-        self.service.start_task(key, sid, "wishlist")
+        self._submit(key, sid, "wishlist", priority=priority)
+
+    def fetch_achievements(self, appids, priority=PRIORITY_VISIBLE):
+        key, sid = self._get_primary_credentials()
+        if not key or not sid:
+            return
+        self._submit_job(key, sid, "achievements", appids, priority)
+
+    def fetch_inventory(self, appid=DEFAULT_INVENTORY_APPID, contextid=DEFAULT_INVENTORY_CONTEXTID, force=False):
+        """拉取主账号库存汇总（分页累计）；缓存未过期时直接 emit 缓存结果。"""
+        key, sid = self._get_primary_credentials()
+        if not key or not sid:
+            return
+        cached = self.inventory_service.get_cached(self.cache, sid, appid, contextid)
+        if not force and self.inventory_service.is_fresh(cached):
+            self.on_inventory_data.emit(cached)
+            return
+        self._submit(
+            key, sid, "inventory", extra_data={"appid": appid, "contextid": contextid}, priority=PRIORITY_INTERACTIVE
+        )
+
+    def sync_app_catalog(self, force=False):
+        """目录为空或超过有效期时触发一次同步（首轮全量，之后按 if_modified_since 增量）。"""
+        if self.app_catalog is None:
+            return
+        if not force and not self.app_catalog.needs_sync():
+            return
+        key, sid = self._get_primary_credentials()
+        if not key or not sid:
+            return
+        self._submit(key, sid, "app_catalog", priority=PRIORITY_BACKGROUND)
+
+    def _submit_job(self, key, sid, task_type, appids, priority):
+        """
+        提交可续传的批量作业（价格/成就）：
+        - 同账号同类作业仍在途：本次请求中作业尚未包含的 appid 并入该作业，只为这部分追加提交一个任务；
+          已全部覆盖时直接合并，进度由在途作业回传（不取消在途任务，也不丢弃其未完成的条目）
+        - 否则开始新作业（沿用上次未完成作业中已完成的 appid），只提交剩余部分
+        """
+        job_id = JobJournal.job_id(task_type, sid)
+        if self.job_journal.get(job_id) is not None and self._job_inflight(job_id):
+            added = self.job_journal.extend(job_id, appids)
+            if not added:
+                self._coalesced += 1
+                return
+            self._checkpoint_dirty = True
+            self._submit(key, sid, task_type, extra_data=added, priority=priority, job_id=job_id)
+            return
 
-    def fetch_achievements(self, appids):
+        self._failed_jobs.discard(job_id)
+        job = self.job_journal.begin(task_type, sid, appids)
+        if job["resumed"]:
+            logger.info("Resuming %s job: %s/%s already done", task_type, job["resumed"], job["total"])
+        if not job["pending"]:
+            # 全部条目上次已完成：直接回报完成
+            self.job_journal.finish(job_id)
+            total = job["total"]
+            self.on_task_progress.emit(
+                {"type": task_type, "task_id": None, "done": total, "total": total, "elapsed": 0.0, "eta": 0.0, "resumed": total}
+            )
+            return
+        self._submit(key, sid, task_type, extra_data=job["pending"], priority=priority, job_id=job_id)
+
+    def _resume_jobs(self):
+        """启动时以后台优先级续传上次未完成的作业；其他账号的作业或多次续传仍未完成的作业直接丢弃。"""
         key, sid = self._get_primary_credentials()
         if not key or not sid:
             return
-        self.service.start_task(key, sid, "achievements", extra_data=appids)
+        resumed = 0
+        for job in self.job_journal.unfinished():
+            job_id = job["job_id"]
+            if job["type"] not in JOURNALED_TASK_TYPES or job["steam_id"] != str(sid):
+                self.job_journal.discard(job_id)
+                continue
+            state = self.job_journal.resume(job_id)
+            if state is None or not state["pending"]:
+                self.job_journal.finish(job_id)
+                continue
+            logger.info("Resuming unfinished %s job: %s/%s", job["type"], state["resumed"], state["total"])
+            self._submit(key, sid, job["type"], extra_data=state["pending"], priority=PRIORITY_BACKGROUND, job_id=job_id)
+            resumed += 1
+        if resumed:
+            # 续传计数先落盘：反复在同一处崩溃时不会无限续传
+            self._checkpoint_dirty = True
+            self.save_checkpoint(force=True)
+
+    def _job_inflight(self, job_id):
+        return any(info.get("job_id") == job_id for info in self._inflight.values())
+
+    def job_states(self):
+        """未完成作业的状态（{"job_id", "type", "done", "total", "resumed", "running", ...}），供界面展示续传进度。"""
+        return [{**job, "running": self._job_inflight(job["job_id"])} for job in self.job_journal.unfinished()]
+
+    def _journal_result(self, result):
+        """
+        批量作业结果：把返回的 appid 记入日志，并把进度换算为整个作业的进度（含此前已完成的条目）。
+        作业的最后一个在途任务完整成功时结束作业；出错或被取消的作业保留，下次继续。
+        """
+        job_id = result.get("job_id")
+        job = self.job_journal.get(job_id) if job_id is not None else None
+        if job is None:
+            return result
+        data = result.get("data")
+        if isinstance(data, dict) and not result.get("error"):
+            self.job_journal.record(job_id, data.keys())
+        progress = result.get("progress")
+        if isinstance(progress, dict):
+            resumed = int(job.get("resumed") or 0)
+            result = {
+                **result,
+                "progress": {
+                    **progress,
+                    "done": resumed + int(progress.get("done") or 0),
+                    "total": resumed + int(progress.get("total") or 0),
+                    "resumed": resumed,
+                },
+            }
+        if result.get("partial"):
+            self._checkpoint_dirty = True
+        else:
+            if result.get("error"):
+                self._failed_jobs.add(job_id)
+            # 本任务已在 _settle_inflight 中解除登记：同一作业的其他追加任务仍在途时保留作业
+            if not self._job_inflight(job_id):
+                if job_id not in self._failed_jobs:
+                    self.job_journal.finish(job_id)
+                self._failed_jobs.discard(job_id)
+        return result
+
+    def save_checkpoint(self, force=False):
+        """落盘批量作业已合并的 partial 数据与断点日志（无新数据时跳过；距上次落盘不足间隔时跳过，force 除外）。"""
+        if not self._checkpoint_dirty:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_checkpoint < _CHECKPOINT_INTERVAL_SECONDS:
+            return
+        try:
+            self._save_cache(self._result_processor.take_changes())
+        except Exception:
+            logger.exception("Failed to save steam job checkpoint")
+            return
+        self._checkpoint_dirty = False
+        self._last_checkpoint = now
+
+    def _submit(
+        self, key, sid, task_type, extra_data=None, steam_id=None, priority=PRIORITY_VISIBLE, generation=None, job_id=None
+    ):
+        """
+        提交任务（带在途合并）：相同 (api_key, task_type, steam_id, extra_data) 的任务仍在途时不再重复提交。
+        generation 为所属游戏聚合轮次，job_id 为所属批量作业，结果返回时分别回填到 result。返回是否实际提交。
+        """
+        target = str(steam_id or sid)
+        coalesce_key = (key, task_type, target, _freeze(extra_data))
+        now = time.monotonic()
+
+        task_id = self._inflight_by_key.get(coalesce_key)
+        if task_id is not None:
+            info = self._inflight.get(task_id)
+            if info is not None and now - info["submitted_at"] < _INFLIGHT_TTL_SECONDS:
+                self._coalesced += 1
+                return False
+            self._inflight.pop(task_id, None)
+
+        task_id = next(self._task_ids)
+        self._inflight_by_key[coalesce_key] = task_id
+        self._inflight[task_id] = {"key": coalesce_key, "generation": generation, "job_id": job_id, "submitted_at": now}
+        self.service.start_task(
+            key, sid, task_type, extra_data=extra_data, steam_id=steam_id, priority=priority, task_id=task_id
+        )
+        return True
+
+    def cancel_tasks(self, task_types=None, reason="cancelled"):
+        """
+        取消在途任务（task_types 为 None 时取消全部）：调度层协作式停止，已到达/稍后到达的结果都不再处理。
+        返回取消的任务数。
+        """
+        types = None if task_types is None else set(task_types)
+        return self._cancel_inflight(lambda key, task_type, target: types is None or task_type in types, reason)
+
+    def _cancel_inflight(self, predicate, reason):
+        task_ids = []
+        for task_id, info in list(self._inflight.items()):
+            key, task_type, target, _ = info["key"]
+            if not predicate(key, task_type, target):
+                continue
+            del self._inflight[task_id]
+            if self._inflight_by_key.get(info["key"]) == task_id:
+                del self._inflight_by_key[info["key"]]
+            self._cancelled_ids.add(task_id)
+            task_ids.append(task_id)
+            if task_type in ("games", "profiles"):
+                # 本轮聚合已不完整：下次 fetch_games_stats 必须重新开始，而不是合并进这一轮
+                self._games_round = None
+        if not task_ids:
+            return 0
+        self._cancelled += len(task_ids)
+        logger.debug("Cancelling %s steam task(s): reason=%s", len(task_ids), reason)
+        try:
+            self.service.cancel_tasks(task_ids, reason)
+        except Exception:
+            logger.exception("Failed to cancel steam tasks: reason=%s", reason)
+        return len(task_ids)
+
+    def task_stats(self):
+        """在途任务数、被合并（未重复提交）的请求次数，以及取消的任务数与因取消而丢弃的结果数。"""
+        return {
+            "inflight": len(self._inflight),
+            "coalesced": self._coalesced,
+            "cancelled": self._cancelled,
+            "cancelled_dropped": self._cancelled_dropped,
+            "games_generation": self.games_aggregator.generation,
+            **self.games_aggregator.stats,
+        }
+
+    def _settle_inflight(self, result):
+        """
+        按 task_id 认领在途任务；最终结果到达时解除合并，并回填聚合轮次。
+        已取消任务的结果（以及调度层回传的 cancelled 结果）返回 None，不再处理。
+        """
+        task_id = result.get("task_id")
+        if task_id is not None and task_id in self._cancelled_ids:
+            if not result.get("partial"):
+                self._cancelled_ids.discard(task_id)
+            if not result.get("cancelled"):
+                self._cancelled_dropped += 1
+            return None
+        if result.get("cancelled"):
+            # 调度层自行取消（如退出时）：只解除在途登记
+            info = self._inflight.pop(task_id, None) if task_id is not None else None
+            if info is not None and self._inflight_by_key.get(info["key"]) == task_id:
+                del self._inflight_by_key[info["key"]]
+            return None
+        if task_id is None:
+            return result
+        if result.get("partial"):
+            info = self._inflight.get(task_id)
+        else:
+            info = self._inflight.pop(task_id, None)
+            if info is not None and self._inflight_by_key.get(info["key"]) == task_id:
+                del self._inflight_by_key[info["key"]]
+        if info is not None and info["generation"] is not None:
+            result = {**result, "generation": info["generation"]}
+        if info is not None and info.get("job_id") is not None:
+            result = {**result, "job_id": info["job_id"]}
+        return result
+
+    def resolve_app_names(self, appids):
+        """纯本地查询 appid→name；目录未同步时返回空 dict。"""
+        if self.app_catalog is None:
+            return {}
+        return self.app_catalog.resolve_names(appids)
+
+    def get_circuit_states(self):
+        """各 host 的熔断状态快照（未配置熔断器时为空）。"""
+        if self.circuit_breakers is None:
+            return {}
+        return self.circuit_breakers.states()
+
+    def _on_circuit_change(self, host, state):
+        try:
+            self.on_circuit_state.emit(self.get_circuit_states())
+        except Exception:
+            logger.exception("SteamFacadeQt failed to emit on_circuit_state: host=%s state=%s", host, state)
 
     def get_recent_games(self, limit=3):
         primary_id = self._policy().primary_id
@@ -173,6 +587,9 @@ class SteamFacadeQt(QObject):
         if not self._result_processor:
             return
 
+        result = self._settle_inflight(result or {})
+        if result is None:
+            return
         task_type = (result or {}).get("type")
         steam_id = (result or {}).get("steam_id")
         error = (result or {}).get("error")
@@ -194,6 +611,7 @@ class SteamFacadeQt(QObject):
                     error,
                 )
 
+        result = self._journal_result(result)
         try:
             outcome = self._result_processor.process(result)
         except Exception:
@@ -208,19 +626,25 @@ class SteamFacadeQt(QObject):
                 logger.exception("SteamFacadeQt failed to emit on_error")
             return
 
+        # 在 SaveStep 之前记录，使时间戳与数据一起落盘
+        self._mark_refreshed(result)
+
         emitters = {
             EmitPlayerSummary: self.on_player_summary.emit,
             EmitGamesStats: self.on_games_stats.emit,
             EmitStorePrices: self.on_store_prices.emit,
             EmitWishlist: self.on_wishlist_data.emit,
             EmitAchievements: self.on_achievements_data.emit,
+            EmitInventory: self.on_inventory_data.emit,
+            EmitProgress: self.on_task_progress.emit,
             EmitError: self.on_error.emit,
         }
 
         for step in outcome.steps:
             if isinstance(step, SaveStep):
                 try:
-                    self.repository.save_data(self.cache)
+                    self._save_cache(step.changes)
+                    self._checkpoint_dirty = False
                 except Exception:
                     logger.exception("Failed to save steam cache: type=%s steam_id=%s", task_type, steam_id)
                 continue
@@ -236,10 +660,25 @@ class SteamFacadeQt(QObject):
                         type(step).__name__,
                     )
 
+        if result.get("partial") and result.get("job_id") is not None:
+            self.save_checkpoint()
+
+    def _save_cache(self, changes=None):
+        """
+        保存缓存：changes 为变更集时只写变化的部分（刷新时间戳与作业日志几乎每次都会变，一并写入）；
+        None 时全量保存。
+        """
+        if changes is None:
+            self.repository.save_data(self.cache)
+            return
+        self.repository.save_changes(self.cache, merge_changes(dict(changes), {"refresh_state": None, "jobs": None}))
+
     def get_game_datasets(self):
         policy = self._policy()
         return self.dataset_service.build_game_datasets(self.cache, policy.primary_id, policy.alt_ids)
 
-__all__ = ["SteamFacadeQt"]
+def _freeze(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=str, ensure_ascii=False)
 
 
+__all__ = ["SteamFacadeQt"]
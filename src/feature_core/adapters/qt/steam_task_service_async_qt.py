@@ -0,0 +1,411 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import traceback
+from typing import Any, Dict, Optional, Tuple
+
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+
+from src.feature_core.adapters.http.async_http import AsyncHttpClient
+from src.feature_core.adapters.http.rate_limiter import RateLimiterRegistry, get_rate_limiter_registry
+from src.feature_core.adapters.http.resilience import CircuitBreakerRegistry, get_circuit_breaker_registry
+from src.feature_core.adapters.http.single_flight import AsyncSingleFlight
+from src.feature_core.adapters.http.steam_async_client import AsyncSteamClient
+from src.feature_core.adapters.http.steam_client import SteamClient
+from src.feature_core.services.steam.app_catalog_service import SteamAppCatalogService
+from src.feature_core.services.steam.app_metadata_service import SteamAppMetadataService
+from src.feature_core.services.steam.inventory_service import InventoryTally, inventory_target
+from src.feature_core.services.steam.profile_service import build_profile_summaries
+from src.feature_core.services.steam.task_cancellation import CancellationToken
+from src.feature_core.services.steam.task_priority import (
+    DEFAULT_AGING_SECONDS,
+    PRIORITY_VISIBLE,
+    PriorityTaskQueue,
+)
+from src.feature_core.services.steam.task_results import (
+    APP_CATALOG_MISSING_ERROR,
+    MISSING_CREDENTIALS_ERROR,
+    STREAM_FLUSH_SECONDS,
+    WISHLIST_DISCOUNT_LIMIT,
+    StreamBatcher,
+    apply_games,
+    apply_summary,
+    cancelled_result,
+    fill_unknown_names,
+    new_result,
+    partial_result,
+    price_chunks,
+    profile_and_games_data,
+)
+from src.feature_core.services.steam.wishlist_discount_service import DiscountedWishlistStream
+
+
+logger = logging.getLogger(__name__)
+
+
+class SteamTaskServiceAsyncQt(QObject):
+    """
+    Steam 异步任务调度（asyncio 实现，满足 SteamTaskServicePort）：
+    - 所有任务在同一个事件循环线程中以协程执行，并发请求不再各占一个 QThread
+    - 结果经由 QueuedConnection 信号投递回 Qt 主线程，再发射 task_finished
+    - 同时运行的任务数受 max_concurrent_tasks 限制，其余按优先级类别（带老化）排队
+    - 返回结构（含 partial 流式结果）与 SteamTaskServiceQt 完全一致
+    - cancel_tasks：排队中的任务出队时跳过，运行中的协程在当前 await 处被取消
+    """
+
+    task_finished = pyqtSignal(dict)
+    # 事件循环线程 -> Qt 主线程的内部通道
+    _result_ready = pyqtSignal(dict)
+
+    def __init__(
+        self,
+        *,
+        rate_limiter: RateLimiterRegistry | None = None,
+        achievement_concurrency: int = 4,
+        app_metadata: SteamAppMetadataService | None = None,
+        app_catalog: SteamAppCatalogService | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
+        max_connections_per_host: int = 8,
+        max_concurrent_tasks: int = 8,
+        aging_seconds: float = DEFAULT_AGING_SECONDS,
+    ):
+        super().__init__()
+        self.app_metadata = app_metadata
+        self.app_catalog = app_catalog
+        self.circuit_breakers = circuit_breakers or get_circuit_breaker_registry()
+        self.rate_limiter = rate_limiter or get_rate_limiter_registry()
+        self.achievement_concurrency = max(1, int(achievement_concurrency or 1))
+        self._max_connections_per_host = max_connections_per_host
+
+        self._result_ready.connect(self._handle_result, Qt.ConnectionType.QueuedConnection)
+
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._http: Optional[AsyncHttpClient] = None
+        self._closed = False
+        # 与 _http 一样只在事件循环线程内使用；所有任务共享，使并发中的相同请求只发一次
+        self._flight = AsyncSingleFlight()
+        self._queue = PriorityTaskQueue(aging_seconds)
+        self._max_concurrent_tasks = max(1, int(max_concurrent_tasks or 1))
+        # task_id -> 取消令牌（任务结束时移除）；受 _lock 保护
+        self._tokens: Dict[Any, CancellationToken] = {}
+        # 仅在事件循环线程内读写：运行中的协程 -> (令牌, cancelled 结果模板)
+        self._running: Dict[asyncio.Task, tuple] = {}
+        # 与 SteamTaskServiceQt.pool_stats 同构的计数；受 _lock 保护
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "dropped": 0,
+            "cancelled_queued": 0,
+            "cancelled_running": 0,
+            "running": 0,
+            "max_queued": 0,
+            "wait_total": 0.0,
+            "wait_max": 0.0,
+        }
+
+    def connection_stats(self) -> Dict[str, int]:
+        """返回异步连接池的请求/新建/复用连接计数。"""
+        return self._http.stats() if self._http is not None else {}
+
+    def single_flight_stats(self) -> Dict[str, object]:
+        """返回请求合并计数：calls/executed/shared 及按端点的 shared 次数。"""
+        return self._flight.stats()
+
+    def pool_stats(self) -> Dict[str, object]:
+        """
+        与 SteamTaskServiceQt.pool_stats 同名同构：队列深度、运行中任务数与排队等待时间（秒）；
+        pool_size 为同时运行的任务上限（max_concurrent_tasks）。
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        started = stats["completed"] + stats["running"]
+        stats["pool_size"] = self._max_concurrent_tasks
+        stats["queued"] = len(self._queue)
+        stats["wait_avg"] = stats["wait_total"] / started if started else 0.0
+        stats["by_priority"] = self._queue.stats()
+        return stats
+
+    def start_task(self, key, sid, task_type, extra_data=None, steam_id=None, priority=PRIORITY_VISIBLE, task_id=None):
+        """
+        提交任务；priority 为优先级类别（见 task_priority），默认 visible；
+        task_id 原样回填到结果中，也是 cancel_tasks 的取消依据。
+        """
+        # 关闭后直接丢弃：不能再经 _ensure_loop 拉起新的事件循环线程
+        loop = self._ensure_loop()
+        if loop is None:
+            logger.debug("SteamTaskServiceAsyncQt is shut down; dropping task: type=%s", task_type)
+            return
+        token = CancellationToken()
+        with self._lock:
+            if task_id is not None:
+                self._tokens[task_id] = token
+            self._stats["submitted"] += 1
+        if self._queue.put((key, steam_id or sid, task_type, extra_data, task_id, token), priority):
+            with self._lock:
+                self._stats["max_queued"] = max(self._stats["max_queued"], len(self._queue))
+            loop.call_soon_threadsafe(self._pump)
+
+    def cancel_tasks(self, task_ids, reason: str = "cancelled") -> int:
+        """取消指定任务（可从任意线程调用），每个被取消的任务只回传一条 cancelled=True 的最终结果；返回新取消的任务数。"""
+        with self._lock:
+            tokens = [self._tokens.get(task_id) for task_id in task_ids]
+            loop = self._loop
+        cancelled = sum(1 for token in tokens if token is not None and token.cancel(reason))
+        if cancelled and loop is not None:
+            loop.call_soon_threadsafe(self._cancel_running)
+        return cancelled
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """丢弃排队任务、取消运行中任务、关闭连接并停止事件循环线程（可重复调用）。"""
+        with self._lock:
+            self._closed = True
+        dropped = self._queue.close(discard=True)
+        with self._lock:
+            self._stats["dropped"] += len(dropped)
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+            tokens = list(self._tokens.values())
+        for token in tokens:
+            token.cancel("shutdown")
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(self._cancel_running, "shutdown")
+        if self._http is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self._http.close(), loop).result(timeout)
+            except Exception:
+                logger.debug("Failed to close async HTTP connections", exc_info=True)
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout)
+
+    # ---- event loop ----
+
+    def _ensure_loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """返回事件循环（首次调用时启动循环线程）；shutdown 之后返回 None。"""
+        with self._lock:
+            if self._closed:
+                return None
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                thread = threading.Thread(target=self._loop_main, args=(loop, ready), name="steam-asyncio", daemon=True)
+                thread.start()
+                ready.wait()
+                self._loop = loop
+                self._thread = thread
+            return self._loop
+
+    def _loop_main(self, loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        # AsyncHttpClient 内部的 Semaphore 等原语需在循环所在线程中创建
+        self._http = AsyncHttpClient(max_connections_per_host=self._max_connections_per_host)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    # ---- tasks (run on the event loop thread) ----
+
+    def _pump(self) -> None:
+        """在并发上限内按优先级启动排队任务；任务结束时再次调用。"""
+        while len(self._running) < self._max_concurrent_tasks:
+            entry = self._queue.get_nowait()
+            if entry is None:
+                return
+            (key, steam_id, task_type, extra_data, task_id, token), _, waited = entry
+            marker = new_result(task_type, steam_id, task_id)
+            if token.is_cancelled:
+                with self._lock:
+                    self._stats["cancelled_queued"] += 1
+                self._forget_token(task_id)
+                self._result_ready.emit(cancelled_result(marker, token.reason))
+                continue
+            with self._lock:
+                self._stats["running"] += 1
+                self._stats["wait_total"] += waited
+                self._stats["wait_max"] = max(self._stats["wait_max"], waited)
+            task = asyncio.ensure_future(self._run_task(key, steam_id, task_type, extra_data, task_id))
+            self._running[task] = (token, marker)
+            task.add_done_callback(self._on_task_done)
+
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        token, marker = self._running.pop(task, (None, None))
+        if marker is not None:
+            self._forget_token(marker["task_id"])
+            with self._lock:
+                self._stats["running"] -= 1
+                self._stats["completed"] += 1
+                if task.cancelled():
+                    self._stats["cancelled_running"] += 1
+        if task.cancelled() and token is not None:
+            if token.reason != "shutdown":
+                self._result_ready.emit(cancelled_result(marker, token.reason))
+        self._pump()
+
+    def _cancel_running(self, shutdown_reason: Optional[str] = None) -> None:
+        """取消令牌已被标记的运行中协程；传入 shutdown_reason 时取消全部。"""
+        for task, (token, _) in list(self._running.items()):
+            if shutdown_reason is not None:
+                token.cancel(shutdown_reason)
+            if token.is_cancelled:
+                task.cancel()
+
+    def _forget_token(self, task_id) -> None:
+        if task_id is not None:
+            with self._lock:
+                self._tokens.pop(task_id, None)
+
+    async def _run_task(self, api_key, steam_id, task_type, extra_data, task_id=None) -> None:
+        result = new_result(task_type, steam_id, task_id)
+
+        if not api_key or not steam_id:
+            result["error"] = MISSING_CREDENTIALS_ERROR
+            self._result_ready.emit(result)
+            return
+
+        client = AsyncSteamClient(
+            api_key,
+            self._http,
+            rate_limiter=self.rate_limiter,
+            app_metadata=self.app_metadata,
+            circuit_breakers=self.circuit_breakers,
+            single_flight=self._flight,
+        )
+        loop = asyncio.get_running_loop()
+
+        try:
+            if task_type == "summary":
+                players, level = await asyncio.gather(client.get_player_summaries(steam_id), client.get_steam_level(steam_id))
+                apply_summary(result, players, level)
+
+            elif task_type == "games":
+                apply_games(result, await client.get_owned_games(steam_id))
+
+            elif task_type == "store_prices":
+                appids = extra_data
+                if appids:
+                    result["data"], result["progress"] = await self._fetch_store_prices(client, appids, result)
+
+            elif task_type == "inventory":
+                appid, contextid = inventory_target(extra_data)
+                tally = InventoryTally()
+                async for page in client.iter_inventory_pages(steam_id, appid, contextid):
+                    tally.add_page(page)
+                result["data"] = tally.summary(appid, contextid)
+
+            elif task_type == "wishlist":
+                stream = DiscountedWishlistStream(limit=WISHLIST_DISCOUNT_LIMIT, min_interval=STREAM_FLUSH_SECONDS)
+                async for entries in client.iter_wishlist(steam_id):
+                    if self.app_catalog is not None:
+                        await loop.run_in_executor(None, fill_unknown_names, self.app_catalog, entries)
+                    items = stream.add(entries)
+                    if items is not None:
+                        self._result_ready.emit(partial_result(result, items))
+                result["data"] = stream.result()
+
+            elif task_type == "profiles":
+                steam_ids = [str(sid) for sid in (extra_data or [steam_id])]
+                players, *levels = await asyncio.gather(
+                    client.get_player_summaries_batched(steam_ids),
+                    *(client.get_steam_level(sid) for sid in steam_ids),
+                )
+                result["data"] = {"summaries": build_profile_summaries(steam_ids, players, dict(zip(steam_ids, levels)))}
+
+            elif task_type == "profile_and_games":
+                players, level, games_data = await asyncio.gather(
+                    client.get_player_summaries(steam_id),
+                    client.get_steam_level(steam_id),
+                    client.get_owned_games(steam_id),
+                )
+                result["data"] = profile_and_games_data(players, level, games_data)
+
+            elif task_type == "app_catalog":
+                if self.app_catalog is None:
+                    result["error"] = APP_CATALOG_MISSING_ERROR
+                else:
+                    # 目录同步是“拉一页写一页”的同步流水线（mmap 文件写入），整体放到线程池执行
+                    sync_client = SteamClient(api_key, rate_limiter=self.rate_limiter, circuit_breakers=self.circuit_breakers)
+                    result["data"] = await loop.run_in_executor(None, self.app_catalog.sync, sync_client.iter_app_list_pages)
+
+            elif task_type == "achievements":
+                appids = extra_data
+                if appids:
+                    result["data"], result["progress"] = await self._fetch_achievements(client, steam_id, appids, result)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            result["error"] = str(e)
+            result["traceback"] = traceback.format_exc()
+            logger.exception("Async Steam task failed: task_type=%s steam_id=%s", task_type, steam_id)
+
+        self._result_ready.emit(result)
+
+    async def _fetch_store_prices(self, client: AsyncSteamClient, appids, result) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """同 SteamTask._fetch_store_prices：各块并发请求（节奏由限速器控制），每完成一块回传该块价格与进度。"""
+
+        async def fetch_chunk(chunk):
+            return len(chunk), await client.get_app_price(chunk)
+
+        batcher = StreamBatcher(len(appids), self._partial_emitter(result))
+        await _consume_as_completed([fetch_chunk(chunk) for chunk in price_chunks(appids)], batcher.add_prices)
+        return batcher.finish()
+
+    async def _fetch_achievements(self, client: AsyncSteamClient, steam_id, appids, result) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """同 SteamTask._fetch_achievements：并发受 achievement_concurrency 限制，完成的条目攒批连同进度流式回传。"""
+        gate = asyncio.Semaphore(self.achievement_concurrency)
+
+        async def fetch_one(appid):
+            async with gate:
+                return appid, await client.get_player_achievements(steam_id, appid)
+
+        batcher = StreamBatcher(len(appids), self._partial_emitter(result))
+        await _consume_as_completed([fetch_one(appid) for appid in appids], batcher.add_achievement)
+        return batcher.finish()
+
+    def _partial_emitter(self, result):
+        """以 result 的 type/steam_id/task_id 回传 partial=True 的中间结果（附带进度）。"""
+        return lambda data, progress: self._result_ready.emit(partial_result(result, data, progress))
+
+    # ---- Qt main thread ----
+
+    def _handle_result(self, result):
+        try:
+            logger.debug(
+                "SteamTaskServiceAsyncQt emit task_finished: type=%s keys=%s",
+                (result or {}).get("type"),
+                sorted(list((result or {}).keys())),
+            )
+            self.task_finished.emit(result)
+        except Exception:
+            logger.exception(
+                "SteamTaskServiceAsyncQt failed to emit task_finished: type=%s",
+                (result or {}).get("type"),
+            )
+
+
+async def _consume_as_completed(coros, consume) -> None:
+    """
+    并发执行 coros，按完成顺序把结果展开传给 consume。
+    子任务显式创建：外层协程被取消（或 consume 抛错）时撤销并等待尚未完成的请求，不再继续消耗限速额度。
+    """
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            consume(*await next_done)
+    finally:
+        unfinished = [task for task in tasks if not task.done()]
+        for task in unfinished:
+            task.cancel()
+        if unfinished:
+            await asyncio.gather(*unfinished, return_exceptions=True)
+
+
+__all__ = ["SteamTaskServiceAsyncQt"]
@@ -1,38 +1,254 @@
+from __future__ import annotations
+
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+
+from src.feature_core.adapters.http.resilience import CircuitBreakerRegistry, get_circuit_breaker_registry
+from src.feature_core.adapters.http.rate_limiter import RateLimiterRegistry, get_rate_limiter_registry
+from src.feature_core.adapters.http.session_pool import SessionPool, get_session_pool
+from src.feature_core.adapters.http.single_flight import SingleFlight, get_single_flight
+from src.feature_core.adapters.http.steam_client import SteamClient
+from src.feature_core.adapters.qt.steam_worker_qt import SteamTask
+from src.feature_core.services.steam.app_catalog_service import SteamAppCatalogService
+from src.feature_core.services.steam.app_metadata_service import SteamAppMetadataService
+from src.feature_core.services.steam.task_cancellation import CancellationToken
+from src.feature_core.services.steam.task_priority import (
+    DEFAULT_AGING_SECONDS,
+    PRIORITY_VISIBLE,
+    PriorityTaskQueue,
+)
+from src.feature_core.services.steam.task_results import cancelled_result, new_result
+
+
+logger = logging.getLogger(__name__)
 
-from PyQt6.QtCore import QObject, pyqtSignal
 
-from src.feature_core.adapters.qt.steam_worker_qt import SteamWorker
+# 任务内部可并发发请求的任务类型（并发度取 achievement_concurrency，节奏仍由共享限速器控制）
+_CONCURRENT_TASKS = ("achievements", "profiles", "wishlist")
 
 
 class SteamTaskServiceQt(QObject):
     """
     Steam 异步任务调度（Qt 适配）：
-    - 管理 SteamWorker（QThread）
-    - 发射 task_finished 信号给上层（SteamFacadeQt）
+    - 固定大小的线程池 + 任务队列执行 SteamTask（不再每个任务新建一个 QThread）
+    - 队列按优先级类别（interactive > visible > background）出队，排队过久的任务逐步提升优先级
+    - 池线程通过 QueuedConnection 把结果交回主线程，再发射 task_finished 信号给上层（SteamFacadeQt）
+    - 每个池线程按 API Key 复用一个 SteamClient（及其 WebAPI 接口列表）
+    - 所有任务共享同一个 SessionPool（按 host 复用 keep-alive 连接）与同一份限速额度
+    - 所有任务共享同一个 SingleFlight：并发中的相同请求只发一次
+    - 任务内的并发请求（成就/等级）共用一个 achievement_concurrency 大小的线程池，
+      总线程数为 pool_size + achievement_concurrency，而不是每个任务各建一个池
+    - 每个任务带一个取消令牌：cancel_tasks 后排队中的任务不再执行，运行中的任务在下一个检查点停止
     """
 
     task_finished = pyqtSignal(dict)
+    # 池线程 -> 主线程
+    _result_ready = pyqtSignal(dict)
 
-    def __init__(self):
+    def __init__(
+        self,
+        *,
+        session_pool: SessionPool | None = None,
+        rate_limiter: RateLimiterRegistry | None = None,
+        achievement_concurrency: int = 4,
+        app_metadata: SteamAppMetadataService | None = None,
+        app_catalog: SteamAppCatalogService | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
+        single_flight: SingleFlight | None = None,
+        pool_size: int = 4,
+        aging_seconds: float = DEFAULT_AGING_SECONDS,
+    ):
         super().__init__()
-        self.active_workers = []
+        self.app_metadata = app_metadata
+        self.app_catalog = app_catalog
+        self.circuit_breakers = circuit_breakers or get_circuit_breaker_registry()
+        self.achievement_concurrency = max(1, int(achievement_concurrency or 1))
+        self.session_pool = session_pool or get_session_pool()
+        self.rate_limiter = rate_limiter or get_rate_limiter_registry()
+        self.single_flight = single_flight or get_single_flight()
+        self.pool_size = max(1, int(pool_size or 1))
+
+        self._queue = PriorityTaskQueue(aging_seconds)
+        self._local = threading.local()
+        self._cond = threading.Condition()
+        self._closed = False
+        # task_id -> 取消令牌（任务结束时移除）
+        self._tokens = {}
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "dropped": 0,
+            "cancelled_queued": 0,
+            "cancelled_running": 0,
+            "running": 0,
+            "max_queued": 0,
+            "wait_total": 0.0,
+            "wait_max": 0.0,
+        }
+        self._result_ready.connect(self._handle_result, Qt.ConnectionType.QueuedConnection)
+        self._fanout = ThreadPoolExecutor(max_workers=self.achievement_concurrency, thread_name_prefix="steam-fanout")
+        self._threads = [
+            threading.Thread(target=self._worker_main, name=f"steam-task-{i}", daemon=True) for i in range(self.pool_size)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def connection_stats(self):
+        """返回共享 SessionPool 的按 host 连接复用计数。"""
+        return self.session_pool.stats()
+
+    def single_flight_stats(self):
+        """返回请求合并计数：calls/executed/shared 及按端点的 shared 次数。"""
+        return self.single_flight.stats()
+
+    def pool_stats(self):
+        """
+        返回线程池指标：队列深度、运行中任务数与排队等待时间（秒）；
+        cancelled_queued/cancelled_running 为出队前/运行中被取消的任务数；
+        by_priority 为按优先级类别的排队数与等待时间。
+        """
+        with self._cond:
+            stats = dict(self._stats)
+        started = stats["completed"] + stats["running"]
+        stats["pool_size"] = self.pool_size
+        stats["queued"] = len(self._queue)
+        stats["wait_avg"] = stats["wait_total"] / started if started else 0.0
+        stats["by_priority"] = self._queue.stats()
+        return stats
 
-    def start_task(self, key, sid, task_type, extra_data=None, steam_id=None):
-        worker = SteamWorker(key, steam_id or sid, task_type, extra_data)
-        worker.data_ready.connect(self._handle_result)
-        worker.finished.connect(lambda: self._cleanup_worker(worker))
+    def start_task(self, key, sid, task_type, extra_data=None, steam_id=None, priority=PRIORITY_VISIBLE, task_id=None):
+        """
+        提交任务；priority 为优先级类别（见 task_priority），默认 visible；
+        task_id 原样回填到结果中，也是 cancel_tasks 的取消依据。
+        """
+        token = CancellationToken()
+        with self._cond:
+            if self._closed:
+                logger.debug("SteamTaskServiceQt is shut down; dropping task: type=%s", task_type)
+                return
+            self._stats["submitted"] += 1
+            if task_id is not None:
+                self._tokens[task_id] = token
+        self._queue.put((key, steam_id or sid, task_type, extra_data, task_id, token), priority)
+        with self._cond:
+            self._stats["max_queued"] = max(self._stats["max_queued"], len(self._queue))
+
+    def cancel_tasks(self, task_ids, reason: str = "cancelled") -> int:
+        """
+        协作式取消（可从任意线程调用）：排队中的任务出队时直接跳过，运行中的任务在下一个检查点停止；
+        两种情况都只回传一条 cancelled=True 的最终结果。返回本次新取消的任务数。
+        """
+        with self._cond:
+            tokens = [self._tokens.get(task_id) for task_id in task_ids]
+        return sum(1 for token in tokens if token is not None and token.cancel(reason))
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """
+        停止接收新任务并排空线程池（可重复调用）：
+        - 丢弃仍在排队的任务，取消运行中的任务
+        - 最多等待 timeout 秒让运行中的任务结束；之后到达的结果不再发射
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            tokens = list(self._tokens.values())
+        for token in tokens:
+            token.cancel("shutdown")
+        dropped = self._queue.close(discard=True)
+        # 任务已取消：撤销尚未开始的并发请求，不等待线程退出
+        self._fanout.shutdown(wait=False, cancel_futures=True)
+        with self._cond:
+            self._stats["dropped"] += len(dropped)
+        deadline = time.monotonic() + max(0.0, float(timeout))
+        with self._cond:
+            while self._stats["running"] > 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning("SteamTaskServiceQt shutdown timed out: running=%s", self._stats["running"])
+                    break
+                self._cond.wait(remaining)
+
+    # ---- pool threads ----
+
+    def _worker_main(self):
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                return
+            (key, steam_id, task_type, extra_data, task_id, token), _, waited = entry
+            if token.is_cancelled:
+                self._skip_cancelled(steam_id, task_type, task_id, token)
+                continue
+            try:
+                self._run_task(waited, key, steam_id, task_type, extra_data, task_id, token)
+            except Exception:
+                logger.exception("Steam task crashed: type=%s steam_id=%s", task_type, steam_id)
+
+    def _skip_cancelled(self, steam_id, task_type, task_id, token):
+        with self._cond:
+            self._stats["cancelled_queued"] += 1
+            self._tokens.pop(task_id, None)
+        self._emit_from_pool(cancelled_result(new_result(task_type, steam_id, task_id), token.reason))
+
+    def _run_task(self, waited, key, steam_id, task_type, extra_data, task_id=None, token=None):
+        with self._cond:
+            self._stats["running"] += 1
+            self._stats["wait_total"] += waited
+            self._stats["wait_max"] = max(self._stats["wait_max"], waited)
+        try:
+            SteamTask(
+                self._client_for(key),
+                steam_id,
+                task_type,
+                extra_data,
+                max_in_flight=self.achievement_concurrency if task_type in _CONCURRENT_TASKS else 1,
+                app_catalog=self.app_catalog,
+                emit=self._emit_from_pool,
+                task_id=task_id,
+                cancel_token=token,
+                executor=self._fanout,
+            ).run()
+        finally:
+            with self._cond:
+                self._stats["running"] -= 1
+                self._stats["completed"] += 1
+                if token is not None and token.is_cancelled:
+                    self._stats["cancelled_running"] += 1
+                self._tokens.pop(task_id, None)
+                self._cond.notify_all()
+
+    def _client_for(self, api_key):
+        """每个池线程按 API Key 缓存一个 SteamClient，避免每个任务重建 WebAPI。"""
+        clients = getattr(self._local, "clients", None)
+        if clients is None:
+            clients = self._local.clients = {}
+        client = clients.get(api_key)
+        if client is None:
+            client = SteamClient(
+                api_key,
+                session_pool=self.session_pool,
+                rate_limiter=self.rate_limiter,
+                app_metadata=self.app_metadata,
+                circuit_breakers=self.circuit_breakers,
+                single_flight=self.single_flight,
+            )
+            clients[api_key] = client
+        return client
 
-        self.active_workers.append(worker)
-        worker.start()
+    def _emit_from_pool(self, result):
+        if self._closed:
+            return
+        self._result_ready.emit(result)
 
-    def _cleanup_worker(self, worker):
-        if worker in self.active_workers:
-            self.active_workers.remove(worker)
+    # ---- Qt main thread ----
 
     def _handle_result(self, result):
         try:
-            logger = logging.getLogger(__name__)
             logger.debug(
                 "SteamTaskServiceQt emit task_finished: type=%s keys=%s",
                 (result or {}).get("type"),
@@ -40,7 +256,7 @@ class SteamTaskServiceQt(QObject):
             )
             self.task_finished.emit(result)
         except Exception:
-            logging.getLogger(__name__).exception(
+            logger.exception(
                 "SteamTaskServiceQt failed to emit task_finished: type=%s",
                 (result or {}).get("type"),
             )
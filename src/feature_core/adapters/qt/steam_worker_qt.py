@@ -1,122 +1,224 @@
-from PyQt6.QtCore import QThread, pyqtSignal
 import logging
-import time
 import traceback
-
-from src.feature_core.adapters.http.steam_client import SteamClient
-from src.feature_core.services.steam.achievement_stats_service import summarize_achievements
-from src.feature_core.services.steam.games_payload_service import build_games_payload
-from src.feature_core.services.steam.wishlist_discount_service import build_discounted_wishlist_items
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+
+from src.feature_core.services.steam.inventory_service import InventoryTally, inventory_target
+from src.feature_core.services.steam.profile_service import build_profile_summaries
+from src.feature_core.services.steam.task_cancellation import (
+    TaskCancelled,
+    bind_token,
+    checkpoint,
+    propagate_token,
+)
+from src.feature_core.services.steam.task_results import (
+    APP_CATALOG_MISSING_ERROR,
+    MISSING_CREDENTIALS_ERROR,
+    STREAM_FLUSH_SECONDS,
+    WISHLIST_DISCOUNT_LIMIT,
+    StreamBatcher,
+    apply_games,
+    apply_summary,
+    cancelled_result,
+    fill_unknown_names,
+    new_result,
+    partial_result,
+    price_chunks,
+    profile_and_games_data,
+)
+from src.feature_core.services.steam.wishlist_discount_service import DiscountedWishlistStream
 
 
 logger = logging.getLogger(__name__)
 
 
-class SteamWorker(QThread):
-    """后台工作线程，用于执行耗时的网络请求（Qt）。"""
-
-    data_ready = pyqtSignal(dict)
-
-    def __init__(self, api_key, steam_id, task_type="summary", extra_data=None):
-        super().__init__()
-        self.client = SteamClient(api_key)
+class SteamTask:
+    """
+    一次 Steam 后台任务的执行体（不依赖 Qt 线程模型）：
+    - 在调用方所在线程同步执行；结果（含 partial 流式结果）通过 emit 回调交出
+    - 由 SteamTaskServiceQt 的固定大小线程池调度
+    - 传入 cancel_token 时协作式取消：分块之间与每次 HTTP 请求前检查，取消后只回传一条 cancelled 结果
+    - 传入 executor 时，任务内的并发请求（成就/等级）提交到这个共享线程池，所有任务的并发总量受其大小限制
+    """
+
+    def __init__(
+        self,
+        client,
+        steam_id,
+        task_type="summary",
+        extra_data=None,
+        max_in_flight=1,
+        app_catalog=None,
+        emit=None,
+        task_id=None,
+        cancel_token=None,
+        executor=None,
+    ):
+        self.client = client
         self.steam_id = steam_id
         self.task_type = task_type
         self.extra_data = extra_data
+        self.max_in_flight = max(1, int(max_in_flight or 1))
+        self.app_catalog = app_catalog
+        self._emit = emit or (lambda result: None)
+        # 调用方的任务标识：原样回填到每条结果（含 partial）中
+        self.task_id = task_id
+        self.cancel_token = cancel_token
+        self.executor = executor
+
+    @property
+    def cancelled(self):
+        return self.cancel_token is not None and self.cancel_token.is_cancelled
 
     def run(self):
-        result = {
-            "type": self.task_type,
-            "data": None,
-            "error": None,
-            "steam_id": self.steam_id,
-            "traceback": None,
-        }
+        with bind_token(self.cancel_token):
+            self._run()
+
+    def _run(self):
+        result = new_result(self.task_type, self.steam_id, self.task_id)
 
         if not self.client.api_key or not self.steam_id:
-            result["error"] = "Missing API Key or Steam ID"
-            self.data_ready.emit(result)
+            result["error"] = MISSING_CREDENTIALS_ERROR
+            self._emit(result)
             return
 
         try:
             if self.task_type == "summary":
                 players = self.client.get_player_summaries(self.steam_id)
-                level = self.client.get_steam_level(self.steam_id)
-
-                if players:
-                    data = players[0]
-                    data["steam_level"] = level
-                    result["data"] = data
-                else:
-                    result["error"] = "Failed to fetch player summary"
+                apply_summary(result, players, self.client.get_steam_level(self.steam_id))
 
             elif self.task_type == "games":
-                games_data = self.client.get_owned_games(self.steam_id)
-                if games_data:
-                    games = games_data.get("games", [])
-                    result["data"] = build_games_payload(games, games_data.get("game_count", 0))
-                else:
-                    result["error"] = "Failed to fetch games data (API returned None)"
+                apply_games(result, self.client.get_owned_games(self.steam_id))
 
             elif self.task_type == "store_prices":
                 appids = self.extra_data
                 if appids:
-                    chunk_size = 20
-                    all_prices = {}
-                    for i in range(0, len(appids), chunk_size):
-                        chunk = appids[i : i + chunk_size]
-                        prices = self.client.get_app_price(chunk)
-                        if prices:
-                            all_prices.update(prices)
-                        time.sleep(0.5)
-                    result["data"] = all_prices
+                    result["data"], result["progress"] = self._fetch_store_prices(appids)
 
             elif self.task_type == "inventory":
-                inv_data = self.client.get_player_inventory(self.steam_id, 730, 2)
-                if inv_data and "assets" in inv_data:
-                    result["data"] = {"total_items": len(inv_data["assets"])}
+                appid, contextid = inventory_target(self.extra_data)
+                tally = InventoryTally()
+                for page in self.client.iter_inventory_pages(self.steam_id, appid, contextid):
+                    tally.add_page(page)
+                    checkpoint()
+                result["data"] = tally.summary(appid, contextid)
 
             elif self.task_type == "wishlist":
-                wishlist_data = self.client.get_wishlist(self.steam_id)
-                result["data"] = build_discounted_wishlist_items(wishlist_data, limit=10)
+                # 价格与名称查询流水线并发执行；折扣列表有变化时以 partial=True 逐步回传
+                stream = DiscountedWishlistStream(limit=WISHLIST_DISCOUNT_LIMIT, min_interval=STREAM_FLUSH_SECONDS)
+                for entries in self.client.iter_wishlist(self.steam_id, max_in_flight=self.max_in_flight):
+                    checkpoint()
+                    fill_unknown_names(self.app_catalog, entries)
+                    items = stream.add(entries)
+                    if items is not None:
+                        self._emit_partial(items)
+                result["data"] = stream.result()
+
+            elif self.task_type == "profiles":
+                # 多账号 summary 合并为一次批量请求；等级按账号并发查询
+                steam_ids = [str(sid) for sid in (self.extra_data or [self.steam_id])]
+                players = self.client.get_player_summaries_batched(steam_ids)
+                with self._fanout_pool(min(self.max_in_flight, len(steam_ids)), "steam-level") as pool:
+                    levels = dict(zip(steam_ids, pool.map(propagate_token(self.client.get_steam_level), steam_ids)))
+                result["data"] = {"summaries": build_profile_summaries(steam_ids, players, levels)}
 
             elif self.task_type == "profile_and_games":
                 players = self.client.get_player_summaries(self.steam_id)
                 level = self.client.get_steam_level(self.steam_id)
-                summary_data = None
-                if players:
-                    summary_data = players[0]
-                    summary_data["steam_level"] = level
-
-                games_data = self.client.get_owned_games(self.steam_id)
-                games_payload = None
-                if games_data:
-                    games = games_data.get("games", [])
-                    games_payload = build_games_payload(games, games_data.get("game_count", 0))
+                result["data"] = profile_and_games_data(players, level, self.client.get_owned_games(self.steam_id))
 
-                result["data"] = {"summary": summary_data, "games": games_payload}
+            elif self.task_type == "app_catalog":
+                if self.app_catalog is None:
+                    result["error"] = APP_CATALOG_MISSING_ERROR
+                else:
+                    result["data"] = self.app_catalog.sync(self.client.iter_app_list_pages)
 
             elif self.task_type == "achievements":
                 appids = self.extra_data
                 if appids:
-                    achievements_data = {}
-                    for appid in appids:
-                        stats = self.client.get_player_achievements(self.steam_id, appid)
-                        achievements_data[str(appid)] = summarize_achievements(stats)
-
-                        time.sleep(0.1)
-                    result["data"] = achievements_data
+                    result["data"], result["progress"] = self._fetch_achievements(appids)
 
+        except TaskCancelled as e:
+            # 合并请求的发起方被取消时跟随方会自行重试；本任务未取消却收到 TaskCancelled 时按错误处理（兜底）
+            if not self.cancelled:
+                result["error"] = f"Shared request was cancelled: {e}"
         except Exception as e:
-            result["error"] = str(e)
-            result["traceback"] = traceback.format_exc()
-            logger.exception(
-                "SteamWorker failed: task_type=%s steam_id=%s",
-                self.task_type,
-                self.steam_id,
-            )
+            if not self.cancelled:
+                result["error"] = str(e)
+                result["traceback"] = traceback.format_exc()
+                logger.exception(
+                    "Steam task failed: task_type=%s steam_id=%s",
+                    self.task_type,
+                    self.steam_id,
+                )
+
+        if self.cancelled:
+            # 取消后客户端可能吞掉异常并返回空数据：统一丢弃，不让半截结果写入缓存
+            result = cancelled_result(result, self.cancel_token.reason)
+            logger.debug("Steam task cancelled: task_type=%s steam_id=%s", self.task_type, self.steam_id)
+        self._emit(result)
+
+    def _fetch_store_prices(self, appids):
+        """
+        分块拉取价格：每完成一块即以 partial=True 回传该块价格与进度；
+        返回 (尚未回传的剩余价格, 最终进度)，不在内存中累积整批结果。
+        """
+        batcher = StreamBatcher(len(appids), self._emit_partial)
+        for chunk in price_chunks(appids):
+            checkpoint()
+            batcher.add_prices(len(chunk), self.client.get_app_price(chunk))
+        return batcher.finish()
+
+    def _fetch_achievements(self, appids):
+        """
+        拉取成就汇总：
+        - max_in_flight > 1 时并发请求（节奏仍由共享限速器控制）
+        - 完成的条目攒批后以 partial=True 的结果连同进度流式回传；
+          返回 (尚未回传的剩余条目, 最终进度)，不在内存中累积整批结果
+        """
+        batcher = StreamBatcher(len(appids), self._emit_partial)
+
+        if self.max_in_flight <= 1 or len(appids) <= 1:
+            for appid in appids:
+                checkpoint()
+                batcher.add_achievement(appid, self.client.get_player_achievements(self.steam_id, appid))
+            return batcher.finish()
+
+        with self._fanout_pool(self.max_in_flight, "steam-ach") as pool:
+            fetch = propagate_token(self.client.get_player_achievements)
+            futures = {pool.submit(fetch, self.steam_id, appid): appid for appid in appids}
+            try:
+                for future in as_completed(futures):
+                    checkpoint()
+                    appid = futures[future]
+                    try:
+                        stats = future.result()
+                    except TaskCancelled:
+                        raise
+                    except Exception:
+                        logger.exception("Achievement fetch failed: steam_id=%s appid=%s", self.steam_id, appid)
+                        stats = None
+                    batcher.add_achievement(appid, stats)
+            except TaskCancelled:
+                # 尚未开始的请求直接撤销，不再排队等限速
+                for future in futures:
+                    future.cancel()
+                raise
+        return batcher.finish()
+
+    @contextmanager
+    def _fanout_pool(self, max_workers, thread_name_prefix):
+        """优先使用调用方共享的 executor；未提供时为本任务临时建一个线程池（结束时关闭）。"""
+        if self.executor is not None:
+            yield self.executor
+            return
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix) as pool:
+            yield pool
 
-        self.data_ready.emit(result)
-__all__ = ["SteamWorker"]
+    def _emit_partial(self, data, progress=None):
+        if self.cancelled:
+            return
+        self._emit(partial_result(new_result(self.task_type, self.steam_id, self.task_id), data, progress))
 
 
+__all__ = ["SteamTask"]
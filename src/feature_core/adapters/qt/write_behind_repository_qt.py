@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from PyQt6.QtCore import QObject, QTimer
+
+from src.feature_core.app.background_executor import BackgroundExecutor, get_background_executor
+from src.feature_core.services.steam.cache_changes import Changes, merge_changes
+
+
+logger = logging.getLogger(__name__)
+
+
+# 默认去抖窗口：窗口内的多次保存合并为一次写盘
+DEFAULT_SAVE_DEBOUNCE_MS = 1500
+
+
+class WriteBehindRepositoryQt(QObject):
+    """
+    Steam 缓存仓库的延迟写包装（实现 SteamRepositoryPort，需在 Qt 主线程使用）：
+    - save_data / save_changes 只标记脏（合并变更集）并启动去抖定时器，窗口内的多次保存合并为一次
+    - 定时器到期时在主线程上调用 repository.snapshot 得到一致快照（缓存只在主线程修改），
+      实际写盘（JSON 原子替换 / SQLite 事务）在后台执行器的 disk 通道完成
+    - 快照按序号排队串行写出：完整快照（JSON）只写最新一份，增量快照（SQLite）按顺序逐个写出；
+      flush 在退出时同步写出所有未落盘的快照
+    被包装的仓库需提供 snapshot(data, changes)、write_snapshot(snapshot) 与 snapshots_are_complete。
+    """
+
+    def __init__(
+        self,
+        repository: Any,
+        *,
+        executor: Optional[BackgroundExecutor] = None,
+        debounce_ms: int = DEFAULT_SAVE_DEBOUNCE_MS,
+    ) -> None:
+        super().__init__()
+        self._repository = repository
+        self._executor = executor or get_background_executor()
+        self._complete = bool(getattr(repository, "snapshots_are_complete", True))
+        # 待落盘的缓存引用与累积的变更集（None 表示需要全量保存）
+        self._dirty: Optional[Dict[str, Any]] = None
+        self._changes: Optional[Changes] = {}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(max(0, int(debounce_ms)))
+        self._timer.timeout.connect(self._write_behind)
+
+        # 写盘状态（后台线程与主线程共享）：_lock 只保护队列与计数，_io_lock 串行化写入，
+        # 主线程取快照不必等待正在进行的写盘
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._seq = 0
+        self._queue: Deque[Tuple[int, Any]] = deque()
+        self._stats = {"requested": 0, "written": 0, "skipped": 0}
+
+    @property
+    def repository(self) -> Any:
+        return self._repository
+
+    def set_error_handler(self, fn: Callable[[str], Any]) -> None:
+        self._repository.set_error_handler(fn)
+
+    def load_data(self) -> dict:
+        return self._repository.load_data()
+
+    def save_data(self, data: dict) -> None:
+        """标记缓存需要全量落盘；实际写入在去抖窗口结束后进行。"""
+        self._mark(data, None)
+
+    def save_changes(self, data: dict, changes: Optional[Changes] = None) -> None:
+        """标记缓存中 changes 涉及的部分需要落盘（changes 为 None 时全量）。"""
+        self._mark(data, changes)
+
+    def flush(self) -> None:
+        """同步写出尚未落盘的全部快照（退出时调用）。"""
+        self._timer.stop()
+        if self._dirty is not None:
+            self._snapshot()
+        self._drain()
+
+    def stats(self) -> Dict[str, int]:
+        """保存请求次数、实际写盘次数、被更新的完整快照取代而跳过的写入次数。"""
+        with self._lock:
+            return dict(self._stats)
+
+    def _mark(self, data: dict, changes: Optional[Changes]) -> None:
+        self._stats["requested"] += 1
+        self._dirty = data
+        if changes is None or self._changes is None:
+            self._changes = None
+        else:
+            merge_changes(self._changes, changes)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _snapshot(self) -> bool:
+        try:
+            snapshot = self._repository.snapshot(self._dirty, self._changes)
+        except Exception:
+            # 保留待落盘标记；变更集可能已不完整，下次改为全量保存，避免丢失变更
+            logger.exception("Failed to snapshot steam cache")
+            self._changes = None
+            return False
+        self._dirty, self._changes = None, {}
+        with self._lock:
+            self._seq += 1
+            self._queue.append((self._seq, snapshot))
+        return True
+
+    def _write_behind(self) -> None:
+        if self._dirty is None or not self._snapshot():
+            return
+        if self._executor.submit("disk", self._drain, name="save_game_data") is None:
+            # 执行器已关闭（正在退出）：直接同步写
+            self._drain()
+
+    def _drain(self) -> None:
+        with self._io_lock:
+            while True:
+                with self._lock:
+                    if not self._queue:
+                        return
+                    if self._complete and len(self._queue) > 1:
+                        # 完整快照：只需写出最新的一份
+                        self._stats["skipped"] += len(self._queue) - 1
+                        latest = self._queue.pop()
+                        self._queue.clear()
+                        self._queue.append(latest)
+                    seq, snapshot = self._queue[0]
+                if not self._repository.write_snapshot(snapshot):
+                    # 保留在队首，下次保存或 flush 时重试（增量快照不能跳过）
+                    return
+                with self._lock:
+                    if self._queue and self._queue[0][0] == seq:
+                        self._queue.popleft()
+                    self._stats["written"] += 1
+
+
+__all__ = ["DEFAULT_SAVE_DEBOUNCE_MS", "WriteBehindRepositoryQt"]
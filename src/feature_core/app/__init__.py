@@ -1,7 +1,8 @@
 from src.feature_core.app.actions import Action
 from src.feature_core.app.action_bus import ActionBus
+from src.feature_core.app.background_executor import BackgroundExecutor, get_background_executor
 from src.feature_core.app.ui_intents_qt import UiIntentsQt
 
-__all__ = ["Action", "ActionBus", "UiIntentsQt"]
+__all__ = ["Action", "ActionBus", "BackgroundExecutor", "UiIntentsQt", "get_background_executor"]
 
 
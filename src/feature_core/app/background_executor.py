@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+# 执行通道 -> 默认并发上限
+# - network：新闻/Epic/推荐元数据等外部请求
+# - llm：大模型流式输出与可用性检查（并发保持很低，避免抢占额度）
+# - disk：缓存/文件读写
+# - cpu：纯计算
+DEFAULT_LANES: Dict[str, int] = {
+    "network": 4,
+    "llm": 2,
+    "disk": 1,
+    "cpu": 2,
+}
+
+
+class _Lane:
+    def __init__(self, name: str, max_workers: int) -> None:
+        self.name = name
+        self.max_workers = max(1, int(max_workers or 1))
+        self.queue: Deque[Tuple[Future, Callable[..., Any], tuple, dict, str]] = deque()
+        self.threads: List[threading.Thread] = []
+        self.idle = 0
+        self.active = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+
+
+class BackgroundExecutor:
+    """
+    应用级后台执行器（纯 Python，无 Qt）：
+    - 按通道（network/llm/disk/cpu）各自限制并发，超出的任务在该通道内 FIFO 排队
+    - 工作线程按需创建（不超过通道上限）并常驻复用，线程名为 bg-<lane>-<i>
+    - submit 返回 concurrent.futures.Future；任务异常只记录日志并写入 Future，不会静默丢失
+    - shutdown 有序退出：拒绝新任务、撤销排队任务、在超时内等待运行中的任务结束
+    回到 Qt 主线程的工作由调用方自行通过信号完成。
+    """
+
+    def __init__(self, lanes: Optional[Mapping[str, int]] = None) -> None:
+        self._cond = threading.Condition()
+        self._closed = False
+        self._lanes: Dict[str, _Lane] = {}
+        self.configure(lanes)
+
+    def configure(self, lanes: Optional[Mapping[str, int]]) -> None:
+        """以默认通道为基础覆盖并发上限（可新增通道）；已创建的线程不回收，只影响之后的扩容。"""
+        limits = dict(DEFAULT_LANES)
+        for name, value in (lanes or {}).items():
+            try:
+                limits[str(name)] = max(1, int(value))
+            except (TypeError, ValueError):
+                logger.warning("Invalid background lane limit: %s=%r", name, value)
+        with self._cond:
+            for name, max_workers in limits.items():
+                lane = self._lanes.get(name)
+                if lane is None:
+                    self._lanes[name] = _Lane(name, max_workers)
+                else:
+                    lane.max_workers = max_workers
+
+    def submit(self, lane: str, fn: Callable[..., Any], *args: Any, name: Optional[str] = None, **kwargs: Any) -> Optional[Future]:
+        """
+        在指定通道中执行 fn(*args, **kwargs)；name 仅用于日志。
+        执行器已关闭时返回 None；未知通道抛出 KeyError。
+        """
+        future: Future = Future()
+        label = name or getattr(fn, "__qualname__", repr(fn))
+        with self._cond:
+            target = self._lanes[lane]
+            if self._closed:
+                logger.debug("BackgroundExecutor is shut down; dropping task: lane=%s name=%s", lane, label)
+                return None
+            target.submitted += 1
+            target.queue.append((future, fn, args, kwargs, label))
+            if target.idle > 0:
+                self._cond.notify_all()
+            if len(target.queue) > target.idle and len(target.threads) < target.max_workers:
+                thread = threading.Thread(
+                    target=self._worker_main,
+                    args=(target,),
+                    name=f"bg-{lane}-{len(target.threads)}",
+                    daemon=True,
+                )
+                target.threads.append(thread)
+                thread.start()
+        return future
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """每个通道：并发上限、运行中/排队中任务数与累计计数。"""
+        with self._cond:
+            return {
+                name: {
+                    "max_workers": lane.max_workers,
+                    "threads": len(lane.threads),
+                    "active": lane.active,
+                    "queued": len(lane.queue),
+                    "submitted": lane.submitted,
+                    "completed": lane.completed,
+                    "failed": lane.failed,
+                    "cancelled": lane.cancelled,
+                }
+                for name, lane in self._lanes.items()
+            }
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """拒绝新任务并撤销排队任务，最多等待 timeout 秒让运行中的任务结束（可重复调用）。"""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            threads = []
+            for lane in self._lanes.values():
+                while lane.queue:
+                    future = lane.queue.popleft()[0]
+                    future.cancel()
+                    lane.cancelled += 1
+                threads.extend(lane.threads)
+            self._cond.notify_all()
+
+        deadline = time.monotonic() + max(0.0, float(timeout))
+        for thread in threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        alive = [thread.name for thread in threads if thread.is_alive()]
+        if alive:
+            logger.warning("BackgroundExecutor shutdown timed out: running=%s", alive)
+
+    def _worker_main(self, lane: _Lane) -> None:
+        while True:
+            with self._cond:
+                while not lane.queue and not self._closed:
+                    lane.idle += 1
+                    self._cond.wait()
+                    lane.idle -= 1
+                if not lane.queue:
+                    return
+                future, fn, args, kwargs, label = lane.queue.popleft()
+                if not future.set_running_or_notify_cancel():
+                    lane.cancelled += 1
+                    continue
+                lane.active += 1
+
+            failed = False
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as exc:
+                failed = True
+                logger.exception("Background task failed: lane=%s name=%s", lane.name, label)
+                future.set_exception(exc)
+            finally:
+                with self._cond:
+                    lane.active -= 1
+                    lane.completed += 1
+                    if failed:
+                        lane.failed += 1
+
+
+_executor: Optional[BackgroundExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_background_executor() -> BackgroundExecutor:
+    """进程级共享的后台执行器（懒加载）。"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = BackgroundExecutor()
+    return _executor
+
+
+__all__ = ["BackgroundExecutor", "DEFAULT_LANES", "get_background_executor"]
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+# 各类数据的有效期（秒）：未过期时启动/打开窗口直接使用缓存，不再请求
+# - games 按账号分别记录（key 为 steam_id）
+# - prices 的逐条过期由 SteamPriceService 按打折/原价 TTL 判断，这里只记录最近一次成功时间
+DEFAULT_REFRESH_TTLS: Dict[str, float] = {
+    "summary": 30 * 60,
+    "games": 2 * 3600,
+    "wishlist": 6 * 3600,
+    "prices": 6 * 3600,
+    "news": 3 * 3600,
+    "epic": 6 * 3600,
+}
+
+
+class RefreshScheduler:
+    """
+    数据刷新调度（纯 Python，无 Qt）：
+    - 按数据类型（可选再按 key，如账号）记录最近一次成功获取的时间戳
+    - is_stale 判断是否超过 TTL；从未成功过、TTL<=0 或时间戳损坏都视为过期
+    - 状态是一个普通 dict（由调用方放进 game_data.json 随缓存一起落盘），重启后依然有效
+    何时真正发起请求由调用方决定：启动、打开窗口、后台定时器只在过期时请求；用户手动刷新不受限制。
+    """
+
+    def __init__(
+        self,
+        state: Optional[MutableMapping[str, Any]] = None,
+        *,
+        ttls: Optional[Mapping[str, Any]] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._state: MutableMapping[str, Any] = state if state is not None else {}
+        self._clock = clock
+        self._ttls: Dict[str, float] = dict(DEFAULT_REFRESH_TTLS)
+        self.configure(ttls)
+
+    def configure(self, ttls: Optional[Mapping[str, Any]]) -> None:
+        """覆盖部分数据类型的 TTL（秒）；非法值忽略并记录警告。"""
+        for kind, value in (ttls or {}).items():
+            try:
+                self._ttls[str(kind)] = float(value)
+            except (TypeError, ValueError):
+                logger.warning("Invalid refresh ttl: %s=%r", kind, value)
+
+    def ttl(self, kind: str) -> float:
+        return self._ttls.get(kind, 0.0)
+
+    def last_success(self, kind: str, key: Any = None) -> Optional[float]:
+        try:
+            return float(self._state[_slot(kind, key)])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def mark_success(self, kind: str, key: Any = None, *, at: Optional[float] = None) -> None:
+        self._state[_slot(kind, key)] = self._clock() if at is None else float(at)
+
+    def invalidate(self, kind: str, key: Any = None) -> None:
+        """使某类数据过期；key 为 None 时同时清除该类型下所有 key 的记录。"""
+        prefix = f"{kind}:"
+        for slot in list(self._state):
+            if slot == kind or (key is None and slot.startswith(prefix)) or slot == _slot(kind, key):
+                self._state.pop(slot, None)
+
+    def is_stale(self, kind: str, key: Any = None, *, now: Optional[float] = None) -> bool:
+        ttl = self.ttl(kind)
+        last = self.last_success(kind, key)
+        if ttl <= 0 or last is None:
+            return True
+        current = self._clock() if now is None else now
+        return (current - last) >= ttl
+
+    def stale_keys(self, kind: str, keys: Iterable[Any]) -> List[Any]:
+        """返回 keys 中已过期的子集（保持顺序）。"""
+        now = self._clock()
+        return [key for key in keys if self.is_stale(kind, key, now=now)]
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """各记录的最近成功时间、年龄与是否过期（用于日志/调试）。"""
+        now = self._clock()
+        out: Dict[str, Dict[str, Any]] = {}
+        for slot in sorted(self._state):
+            kind, _, key = slot.partition(":")
+            last = self.last_success(kind, key or None)
+            out[slot] = {
+                "last_success": last,
+                "age": None if last is None else max(0.0, now - last),
+                "stale": self.is_stale(kind, key or None, now=now),
+            }
+        return out
+
+
+def _slot(kind: str, key: Any) -> str:
+    return kind if key is None else f"{kind}:{key}"
+
+
+__all__ = ["DEFAULT_REFRESH_TTLS", "RefreshScheduler"]
@@ -18,14 +18,33 @@ from src.feature_core.services.steam.launcher_service import LaunchPlan, SteamLa
 from src.feature_core.services.steam.games_payload_service import build_games_payload
 from src.feature_core.services.steam.wishlist_discount_service import build_discounted_wishlist_items
 from src.feature_core.services.steam.achievement_stats_service import summarize_achievements
+from src.feature_core.services.steam.app_catalog_service import SteamAppCatalogService
+from src.feature_core.services.steam.app_metadata_service import SteamAppMetadataService, normalize_app_details
+from src.feature_core.services.steam.inventory_service import InventoryTally, SteamInventoryService
+from src.feature_core.services.steam.payload_projection import project, project_cache
+from src.feature_core.services.steam.task_priority import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_VISIBLE,
+    PriorityTaskQueue,
+)
+from src.feature_core.services.steam.task_cancellation import CancellationToken, TaskCancelled
+from src.feature_core.services.steam.task_progress import ProgressTracker
+from src.feature_core.services.steam.task_results import StreamBatcher
+from src.feature_core.services.steam.job_journal import JobJournal
+from src.feature_core.services.steam.cache_changes import merge_changes
 
 __all__ = [
     "SteamAchievementService",
     "SteamAccountPolicy",
     "SteamAccountService",
+    "SteamAppCatalogService",
+    "SteamAppMetadataService",
     "SteamDatasetService",
     "SteamGamesAggregationService",
     "SteamGamesService",
+    "SteamInventoryService",
+    "InventoryTally",
     "LaunchPlan",
     "SteamLauncherService",
     "SteamPriceService",
@@ -35,6 +54,19 @@ __all__ = [
     "build_games_payload",
     "build_discounted_wishlist_items",
     "summarize_achievements",
+    "normalize_app_details",
+    "project",
+    "project_cache",
+    "PRIORITY_BACKGROUND",
+    "PRIORITY_INTERACTIVE",
+    "PRIORITY_VISIBLE",
+    "PriorityTaskQueue",
+    "CancellationToken",
+    "TaskCancelled",
+    "ProgressTracker",
+    "StreamBatcher",
+    "JobJournal",
+    "merge_changes",
 ]
 
 
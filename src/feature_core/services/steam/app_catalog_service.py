@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Protocol, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CATALOG_MAX_AGE_SECONDS = 24 * 3600
+
+PageFetcher = Callable[..., Iterable[List[Dict[str, Any]]]]
+
+
+class AppCatalogStore(Protocol):
+    def __len__(self) -> int: ...
+
+    def lookup_many(self, appids: Iterable[Any]) -> Dict[str, str]: ...
+
+    def load_meta(self) -> Dict[str, Any]: ...
+
+    def save_meta(self, meta: Dict[str, Any]) -> None: ...
+
+    def rebuild(self, records: Iterable[Tuple[int, str, int]]) -> int: ...
+
+    def merge(self, updates: Iterable[Tuple[int, str, int]]) -> int: ...
+
+
+class SteamAppCatalogService:
+    """
+    appid→name 目录同步（纯 Python）：
+    - 目录为空时全量同步；否则以上次的 max(last_modified) 作为 if_modified_since 增量同步
+    - 分页结果以生成器方式直接写入目录，不在内存中累积全量 apps
+    """
+
+    def __init__(
+        self,
+        catalog: AppCatalogStore,
+        *,
+        max_age_seconds: float = DEFAULT_CATALOG_MAX_AGE_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.catalog = catalog
+        self._max_age = float(max_age_seconds)
+        self._clock = clock
+
+    def needs_sync(self) -> bool:
+        if len(self.catalog) == 0:
+            return True
+        meta = self.catalog.load_meta()
+        try:
+            synced_at = float(meta.get("synced_at") or 0)
+        except (TypeError, ValueError):
+            return True
+        return (self._clock() - synced_at) >= self._max_age
+
+    def resolve_names(self, appids: Iterable[Any]) -> Dict[str, str]:
+        """纯本地查询：{appid_str: name}，目录中不存在的 appid 不出现在结果中。"""
+        return self.catalog.lookup_many(appids)
+
+    def sync(self, fetch_pages: PageFetcher) -> Dict[str, Any]:
+        """
+        执行一次同步；fetch_pages(if_modified_since=...) 需逐页返回 apps 列表。
+        分页中途失败时异常向上抛出，目录保持原状（写入是原子替换）。
+        """
+        meta = self.catalog.load_meta()
+        incremental = len(self.catalog) > 0 and bool(meta.get("max_last_modified"))
+        since = int(meta.get("max_last_modified") or 0) if incremental else None
+
+        watermark = {"max_last_modified": since or 0, "fetched": 0}
+
+        def records() -> Iterator[Tuple[int, str, int]]:
+            for apps in fetch_pages(if_modified_since=since):
+                for app in apps or []:
+                    if not isinstance(app, dict) or app.get("appid") is None:
+                        continue
+                    last_modified = int(app.get("last_modified") or 0)
+                    if last_modified > watermark["max_last_modified"]:
+                        watermark["max_last_modified"] = last_modified
+                    watermark["fetched"] += 1
+                    yield int(app["appid"]), str(app.get("name") or ""), last_modified
+
+        started_at = self._clock()
+        if incremental:
+            # 增量结果通常很小：先收集再合并，避免无更新时重写目录
+            updates = list(records())
+            count = self.catalog.merge(updates) if updates else len(self.catalog)
+        else:
+            count = self.catalog.rebuild(records())
+
+        # 目录写入成功后再推进水位；中途失败则下次仍从旧水位开始
+        self.catalog.save_meta(
+            {"synced_at": started_at, "max_last_modified": watermark["max_last_modified"], "count": count}
+        )
+
+        mode = "incremental" if incremental else "full"
+        logger.info("App catalog synced: mode=%s fetched=%s total=%s", mode, watermark["fetched"], count)
+        return {"mode": mode, "fetched": watermark["fetched"], "count": count}
+
+
+__all__ = ["DEFAULT_CATALOG_MAX_AGE_SECONDS", "SteamAppCatalogService"]
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_METADATA_TTL_SECONDS = 7 * 24 * 3600
+# 下架/无效 appid（appdetails success=false）的负缓存时长，避免每次都重复请求
+DEFAULT_MISSING_TTL_SECONDS = 24 * 3600
+# 落盘节流：新条目最多每隔这么久整体写一次文件（退出时 flush 补写）
+DEFAULT_SAVE_INTERVAL_SECONDS = 10.0
+
+
+class AppMetadataStore(Protocol):
+    def load(self) -> Dict[str, Dict[str, Any]]: ...
+
+    def save(self, entries: Dict[str, Dict[str, Any]]) -> None: ...
+
+
+def normalize_app_details(data: Any) -> Dict[str, Any]:
+    """将 appdetails 的 data 字段收敛为精简记录（纯 Python）。"""
+    if not isinstance(data, dict):
+        return {}
+    release = data.get("release_date")
+    release_date = release.get("date", "") if isinstance(release, dict) else ""
+    return {
+        "name": data.get("name", "") or "",
+        "short_description": data.get("short_description", "") or "",
+        "type": data.get("type", "") or "",
+        "capsule": data.get("capsule_image") or data.get("header_image") or "",
+        "release_date": release_date or "",
+    }
+
+
+class SteamAppMetadataService:
+    """
+    应用元数据缓存（纯 Python，线程安全）：
+    - 以 appid 为键，条目带 fetched_at，按 TTL 过期
+    - `get_many(appids, fetch)` 只为未命中/已过期的 appid 调用 fetch
+    - 新条目只标记脏，按 save_interval 节流批量落盘；`flush()` 立即写出（退出时调用）
+    """
+
+    def __init__(
+        self,
+        repository: Optional[AppMetadataStore] = None,
+        *,
+        ttl_seconds: float = DEFAULT_METADATA_TTL_SECONDS,
+        missing_ttl_seconds: float = DEFAULT_MISSING_TTL_SECONDS,
+        save_interval_seconds: float = DEFAULT_SAVE_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._repository = repository
+        self._ttl = float(ttl_seconds)
+        self._missing_ttl = float(missing_ttl_seconds)
+        self._clock = clock
+        self._save_interval = max(0.0, float(save_interval_seconds))
+        self._lock = threading.Lock()
+        # 串行化“取快照 + 写盘”：后写出的快照一定不旧于先写出的
+        self._save_lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+        self._last_save: Optional[float] = None
+
+    def get(self, appid: Any) -> Optional[Dict[str, Any]]:
+        """仅查缓存：命中且未过期时返回记录，否则返回 None。"""
+        with self._lock:
+            entry = self._entries_locked().get(str(appid))
+            if entry is None or not self._is_fresh(entry) or entry.get("missing"):
+                return None
+            return self._public(entry)
+
+    def missing(self, appids: Iterable[Any]) -> List[str]:
+        """返回需要重新拉取的 appid（未缓存或已过期）。"""
+        with self._lock:
+            entries = self._entries_locked()
+            return [aid for aid in _unique_ids(appids) if not self._is_fresh(entries.get(aid))]
+
+    def get_many(
+        self,
+        appids: Iterable[Any],
+        fetch: Callable[[List[str]], Dict[str, Any]],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        批量查询：fetch(missing_appids) 需返回 {appid: appdetails.data 或 None}。
+        返回 {appid: 记录}；拉取失败或不存在的 appid 不出现在结果中。
+        """
+        ids = _unique_ids(appids)
+        to_fetch = self.missing(ids)
+
+        if to_fetch:
+            fetched: Dict[str, Any] = {}
+            try:
+                fetched = fetch(to_fetch) or {}
+            except Exception:
+                logger.exception("App metadata fetch failed: count=%s", len(to_fetch))
+            self._store(to_fetch, fetched)
+
+        with self._lock:
+            entries = self._entries_locked()
+            result: Dict[str, Dict[str, Any]] = {}
+            for aid in ids:
+                entry = entries.get(aid)
+                if entry and not entry.get("missing"):
+                    result[aid] = self._public(entry)
+            return result
+
+    def _store(self, requested: List[str], fetched: Dict[str, Any]) -> None:
+        now = self._clock()
+        changed = False
+        with self._lock:
+            entries = self._entries_locked()
+            for aid in requested:
+                if aid not in fetched:
+                    # 网络失败等：不写入，下次继续尝试
+                    continue
+                record = normalize_app_details(fetched.get(aid))
+                if record:
+                    record["fetched_at"] = now
+                else:
+                    record = {"missing": True, "fetched_at": now}
+                entries[aid] = record
+                changed = True
+            if changed:
+                self._dirty = True
+
+        if changed:
+            self._save(force=False)
+
+    def flush(self) -> None:
+        """立即写出尚未落盘的条目。"""
+        self._save(force=True)
+
+    def _save(self, force: bool) -> None:
+        if self._repository is None:
+            return
+        # 节流路径不等待：其他线程正在写盘时，本次变更留待下次保存或 flush
+        if not self._save_lock.acquire(blocking=force):
+            return
+        try:
+            with self._lock:
+                if not self._dirty:
+                    return
+                now = self._clock()
+                if not force and self._last_save is not None and now - self._last_save < self._save_interval:
+                    return
+                snapshot = dict(self._entries_locked())
+                self._dirty = False
+                self._last_save = now
+            self._repository.save(snapshot)
+        finally:
+            self._save_lock.release()
+
+    def _entries_locked(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            loaded: Dict[str, Dict[str, Any]] = {}
+            if self._repository is not None:
+                try:
+                    loaded = self._repository.load() or {}
+                except Exception:
+                    logger.exception("Failed to load app metadata cache")
+            self._entries = loaded
+        return self._entries
+
+    def _is_fresh(self, entry: Optional[Dict[str, Any]]) -> bool:
+        if not isinstance(entry, dict):
+            return False
+        try:
+            fetched_at = float(entry.get("fetched_at") or 0)
+        except (TypeError, ValueError):
+            return False
+        ttl = self._missing_ttl if entry.get("missing") else self._ttl
+        return (self._clock() - fetched_at) < ttl
+
+    @staticmethod
+    def _public(entry: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: v for k, v in entry.items() if k != "fetched_at"}
+
+
+def _unique_ids(appids: Iterable[Any]) -> List[str]:
+    seen = set()
+    ids: List[str] = []
+    for appid in appids or []:
+        if appid is None:
+            continue
+        aid = str(appid)
+        if aid and aid not in seen:
+            seen.add(aid)
+            ids.append(aid)
+    return ids
+
+
+__all__ = [
+    "DEFAULT_METADATA_TTL_SECONDS",
+    "DEFAULT_MISSING_TTL_SECONDS",
+    "DEFAULT_SAVE_INTERVAL_SECONDS",
+    "SteamAppMetadataService",
+    "normalize_app_details",
+]
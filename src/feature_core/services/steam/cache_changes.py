@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Mapping, Optional
+
+
+# 缓存变更集：{section: rows}，section 为 cache 的顶层键
+# - rows 为 dict 时表示该 section 中按键更新的条目（如 {"prices": {"570": {...}}}），仓库只需逐行 upsert
+# - rows 为 None 时表示整个 section 被替换/删除，仓库需按当前 cache 重写该 section
+# 整个变更集为 None 表示“变更未知”，仓库需全量保存
+Changes = Dict[str, Optional[Dict[str, Any]]]
+
+
+def merge_changes(base: Optional[Changes], extra: Optional[Mapping[str, Any]]) -> Changes:
+    """把 extra 合并进 base（就地修改并返回 base）；任一方为整段替换时结果为整段替换。"""
+    merged: Changes = base if base is not None else {}
+    for section, rows in (extra or {}).items():
+        if section in merged and merged[section] is None:
+            continue
+        if rows is None:
+            merged[section] = None
+        else:
+            merged.setdefault(section, {}).update(rows)
+    return merged
+
+
+__all__ = ["Changes", "merge_changes"]
@@ -1,51 +1,118 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
+
+
+# 批量 summary 任务（"profiles"）在待返回集合中的键
+PROFILES_KEY = "__profiles__"
 
 
 class GamesAggregator:
-    """管理多账号游戏统计的聚合上下文（纯 Python）。"""
+    """
+    管理多账号游戏统计的聚合上下文（纯 Python）：
+    - 每轮聚合有递增的 generation，进度按“尚未返回的账号”集合跟踪（而非计数）
+    - 新一轮开始后，被取代轮次的迟到结果：账号仍在本轮待返回集合中则并入本轮，否则丢弃
+      （批量 profiles 结果与当轮账号组绑定，只接受同一轮次的）
+    - 重复结果同样被丢弃，不会让本轮提前完成
+    """
 
     def __init__(self):
         self._ctx: Optional[Dict[str, Any]] = None
-
-    def begin(self, account_ids: List[str], primary_id: str):
-        self._ctx = {"pending": len(account_ids), "primary": primary_id, "results": []}
+        self._generation = 0
+        self.stats = {"merged_late": 0, "dropped": 0}
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def is_active(self) -> bool:
+        return self._ctx is not None
+
+    def pending_keys(self) -> Set[str]:
+        return set(self._ctx["pending"]) if self._ctx else set()
+
+    def begin(self, account_ids: List[str], primary_id: str, batched_profiles: bool = False) -> int:
+        """
+        开始新一轮聚合并返回其 generation。
+        batched_profiles=True：各账号任务只回传 games，summary 由一个批量 "profiles" 任务回传，
+        该任务也计入待返回集合。
+        """
+        self._generation += 1
+        pending = {str(sid) for sid in account_ids}
+        if batched_profiles:
+            pending.add(PROFILES_KEY)
+        self._ctx = {
+            "generation": self._generation,
+            "pending": pending,
+            "primary": primary_id,
+            "results": [],
+            "profiles": {},
+        }
+        return self._generation
 
     def add_result(
         self,
         steam_id: str,
         games: Optional[Dict[str, Any]],
         summary: Optional[Dict[str, Any]],
+        generation: Optional[int] = None,
     ) -> bool:
-        if not self._ctx:
+        if not self._accept(steam_id, generation):
+            return False
+
+        self._ctx["results"].append({"steam_id": str(steam_id), "games": games, "summary": summary})
+        return self._settle(steam_id)
+
+    def add_profiles(self, summaries: Optional[Dict[str, Dict[str, Any]]], generation: Optional[int] = None) -> bool:
+        if not self._accept(PROFILES_KEY, generation, same_round=True):
             return False
 
-        self._ctx["results"].append({"steam_id": steam_id, "games": games, "summary": summary})
-        self._ctx["pending"] -= 1
-        return self._ctx["pending"] <= 0
+        self._ctx["profiles"].update(summaries or {})
+        return self._settle(PROFILES_KEY)
 
-    def mark_error(self) -> bool:
+    def mark_error(self, steam_id: Optional[str] = None, generation: Optional[int] = None) -> bool:
         if not self._ctx:
             return False
-        self._ctx["pending"] -= 1
-        return self._ctx["pending"] <= 0
+        if steam_id is None:
+            # 无法归属到账号的失败：按旧的计数语义结束任意一个待返回项
+            if self._ctx["pending"]:
+                self._ctx["pending"].pop()
+            return not self._ctx["pending"]
+        if not self._accept(steam_id, generation, same_round=steam_id == PROFILES_KEY):
+            return False
+        return self._settle(steam_id)
 
     def finalize(self):
         if not self._ctx:
             return {}
 
         results = self._ctx["results"]
+        profiles = self._ctx["profiles"]
         self._ctx = None
 
         account_map: Dict[str, Dict[str, Any]] = {}
         for item in results:
             sid = item.get("steam_id")
             games = item.get("games")
-            summary = item.get("summary")
+            summary = item.get("summary") or profiles.get(sid)
             if sid and games:
                 account_map[sid] = {"games": games, "summary": summary}
 
         return account_map
 
+    def _accept(self, key: Any, generation: Optional[int], same_round: bool = False) -> bool:
+        if not self._ctx:
+            return False
+        stale = generation is not None and generation != self._ctx["generation"]
+        if str(key) not in self._ctx["pending"] or (stale and same_round):
+            self.stats["dropped"] += 1
+            return False
+        if stale:
+            self.stats["merged_late"] += 1
+        return True
+
+    def _settle(self, key: Any) -> bool:
+        self._ctx["pending"].discard(str(key))
+        return not self._ctx["pending"]
+
 
 def merge_games(results: List[Dict[str, Any]]):
     merged: Dict[Any, Dict[str, Any]] = {}
@@ -88,6 +155,6 @@ def merge_games(results: List[Dict[str, Any]]):
     }
 
 
-__all__ = ["GamesAggregator", "merge_games"]
+__all__ = ["GamesAggregator", "PROFILES_KEY", "merge_games"]
 
 
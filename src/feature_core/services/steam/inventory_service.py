@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+# 库存汇总的缓存有效期：库存变化不频繁，且 community 端点限速严格
+DEFAULT_INVENTORY_TTL_SECONDS = 6 * 3600
+
+
+# 默认统计 CS2 的社区库存（appid=730, contextid=2）
+DEFAULT_INVENTORY_APPID = 730
+DEFAULT_INVENTORY_CONTEXTID = 2
+
+
+def inventory_target(extra_data: Any) -> Tuple[Any, Any]:
+    """从任务 extra_data（{"appid", "contextid"} 或 None）解析目标库存。"""
+    if isinstance(extra_data, dict):
+        return (
+            extra_data.get("appid") or DEFAULT_INVENTORY_APPID,
+            extra_data.get("contextid") or DEFAULT_INVENTORY_CONTEXTID,
+        )
+    return DEFAULT_INVENTORY_APPID, DEFAULT_INVENTORY_CONTEXTID
+
+
+class InventoryTally:
+    """
+    逐页累计库存统计（纯 Python）：
+    - 每页只在 add_page 期间引用该页的 assets/descriptions，处理完即可释放，内存与库存规模无关
+    - 按 description 的 type（如“隐秘 步枪”）统计数量，可堆叠物品按 amount 计数
+    """
+
+    def __init__(self) -> None:
+        self.total_items = 0
+        self.total_assets = 0
+        self.reported_total: Optional[int] = None
+        self.pages = 0
+        self.by_type: Dict[str, int] = {}
+
+    def add_page(self, page: Dict[str, Any]) -> None:
+        self.pages += 1
+        if page.get("total_inventory_count") is not None:
+            try:
+                self.reported_total = int(page["total_inventory_count"])
+            except (TypeError, ValueError):
+                pass
+
+        # 同一页的 descriptions 覆盖该页 assets 用到的 (classid, instanceid)
+        types: Dict[tuple, str] = {}
+        for desc in page.get("descriptions") or []:
+            key = (str(desc.get("classid")), str(desc.get("instanceid", "0")))
+            types[key] = desc.get("type") or "Unknown"
+
+        for asset in page.get("assets") or []:
+            try:
+                amount = int(asset.get("amount", 1))
+            except (TypeError, ValueError):
+                amount = 1
+            self.total_assets += 1
+            self.total_items += amount
+            item_type = types.get((str(asset.get("classid")), str(asset.get("instanceid", "0"))), "Unknown")
+            self.by_type[item_type] = self.by_type.get(item_type, 0) + amount
+
+    def summary(self, appid: Any, contextid: Any) -> Dict[str, Any]:
+        return {
+            "appid": str(appid),
+            "contextid": str(contextid),
+            "total_items": self.total_items,
+            "total_assets": self.total_assets,
+            "total_inventory_count": self.reported_total if self.reported_total is not None else self.total_assets,
+            "pages": self.pages,
+            "by_type": dict(sorted(self.by_type.items(), key=lambda kv: kv[1], reverse=True)),
+        }
+
+
+class SteamInventoryService:
+    """
+    Steam 库存子域（纯 Python）。
+    - 按 steam_id + appid/contextid 缓存汇总结果（附带 fetched_at）
+    - `is_fresh` 供上层决定是否跳过网络请求
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = DEFAULT_INVENTORY_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._ttl = float(ttl_seconds)
+        self._clock = clock
+
+    @staticmethod
+    def cache_key(steam_id: Any, appid: Any, contextid: Any) -> str:
+        return f"{steam_id}:{appid}:{contextid}"
+
+    def apply_inventory(self, cache: Dict[str, Any], steam_id: Any, summary: Dict[str, Any]) -> Dict[str, Any]:
+        inventory = cache.get("inventory")
+        if not isinstance(inventory, dict):
+            inventory = {}
+            cache["inventory"] = inventory
+
+        record = dict(summary)
+        record["steam_id"] = str(steam_id)
+        record["fetched_at"] = self._clock()
+        inventory[self.cache_key(steam_id, record.get("appid"), record.get("contextid"))] = record
+        return {"inventory_to_emit": record, "should_save": True}
+
+    def get_cached(self, cache: Dict[str, Any], steam_id: Any, appid: Any, contextid: Any) -> Optional[Dict[str, Any]]:
+        inventory = cache.get("inventory")
+        if not isinstance(inventory, dict):
+            return None
+        record = inventory.get(self.cache_key(steam_id, appid, contextid))
+        return record if isinstance(record, dict) else None
+
+    def is_fresh(self, record: Optional[Dict[str, Any]]) -> bool:
+        if not isinstance(record, dict):
+            return False
+        try:
+            fetched_at = float(record.get("fetched_at"))
+        except (TypeError, ValueError):
+            return False
+        return (self._clock() - fetched_at) < self._ttl
+
+
+__all__ = [
+    "DEFAULT_INVENTORY_APPID",
+    "DEFAULT_INVENTORY_CONTEXTID",
+    "DEFAULT_INVENTORY_TTL_SECONDS",
+    "InventoryTally",
+    "SteamInventoryService",
+    "inventory_target",
+]
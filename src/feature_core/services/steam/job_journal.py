@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, Iterable, List, MutableMapping, Optional
+
+
+# 支持断点续传的批量任务类型（extra_data 为 appid 列表）
+JOURNALED_TASK_TYPES = ("store_prices", "achievements")
+# 启动时自动续传的次数上限：持续失败的任务不会在每次启动时反复重试
+DEFAULT_MAX_RESUMES = 3
+
+
+class JobJournal:
+    """
+    长批量任务（价格/成就）的断点日志（纯 Python）：
+    - 每个 (任务类型, 账号) 只保留一个作业，job_id 形如 "achievements:7656..."
+    - 按 appid 记录已完成条目；状态是普通 dict，由调用方与已合并的数据一起落盘，
+      保证日志中标记完成的 appid 其数据也已写入
+    - 重新发起同类作业时沿用上次已完成的 appid（即续传），作业完成后移除
+    - 作业仍在运行时的新请求用 extend 并入同一作业，不覆盖其未完成的条目
+    """
+
+    def __init__(
+        self,
+        state: Optional[MutableMapping[str, Any]] = None,
+        *,
+        max_resumes: int = DEFAULT_MAX_RESUMES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._state: MutableMapping[str, Any] = state if state is not None else {}
+        self._max_resumes = max(0, int(max_resumes))
+        self._clock = clock
+
+    @staticmethod
+    def job_id(task_type: str, steam_id: Any) -> str:
+        return f"{task_type}:{steam_id}"
+
+    def begin(self, task_type: str, steam_id: Any, appids: Iterable[Any]) -> Dict[str, Any]:
+        """
+        开始（或续传）一个作业：沿用同一 job_id 未完成作业中、本次仍请求的已完成 appid。
+        返回 {"job_id", "pending", "resumed", "total"}，pending 保持请求顺序并去重。
+        """
+        job_id = self.job_id(task_type, steam_id)
+        requested = _unique(appids)
+        previous = self._state.get(job_id)
+        finished = set(previous.get("done") or []) if isinstance(previous, dict) else set()
+        done = [str(appid) for appid in requested if str(appid) in finished]
+        now = self._clock()
+        self._state[job_id] = {
+            "type": task_type,
+            "steam_id": str(steam_id),
+            "appids": requested,
+            "done": done,
+            "resumed": len(done),
+            "resumes": 0,
+            "started_at": now,
+            "updated_at": now,
+        }
+        return {
+            "job_id": job_id,
+            "pending": self.pending(job_id),
+            "resumed": len(done),
+            "total": len(requested),
+        }
+
+    def extend(self, job_id: str, appids: Iterable[Any]) -> List[Any]:
+        """把作业尚未包含的 appid 追加到作业中（保持请求顺序并去重）；返回新追加的 appid。"""
+        job = self.get(job_id)
+        if job is None:
+            return []
+        members = job.setdefault("appids", [])
+        known = {str(appid) for appid in members}
+        added = [appid for appid in _unique(appids) if str(appid) not in known]
+        if added:
+            members.extend(added)
+            job["updated_at"] = self._clock()
+        return added
+
+    def resume(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        启动时续传：累计续传次数，超过上限则丢弃作业并返回 None。
+        返回值与 begin 相同；resumed 为此前已完成的条目数。
+        """
+        job = self._state.get(job_id)
+        if not isinstance(job, dict):
+            return None
+        resumes = int(job.get("resumes") or 0) + 1
+        if resumes > self._max_resumes:
+            self.discard(job_id)
+            return None
+        job["resumes"] = resumes
+        job["resumed"] = len(job.get("done") or [])
+        job["updated_at"] = self._clock()
+        return {
+            "job_id": job_id,
+            "pending": self.pending(job_id),
+            "resumed": job["resumed"],
+            "total": len(job.get("appids") or []),
+        }
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self._state.get(job_id)
+        return job if isinstance(job, dict) else None
+
+    def pending(self, job_id: str) -> List[Any]:
+        job = self.get(job_id)
+        if job is None:
+            return []
+        done = set(job.get("done") or [])
+        return [appid for appid in job.get("appids") or [] if str(appid) not in done]
+
+    def record(self, job_id: str, appids: Iterable[Any]) -> int:
+        """把 appids 标记为已完成（忽略不属于该作业或已记录的条目）；返回新增数量。"""
+        job = self.get(job_id)
+        if job is None:
+            return 0
+        members = {str(appid) for appid in job.get("appids") or []}
+        done = job.setdefault("done", [])
+        known = set(done)
+        added = 0
+        for appid in appids:
+            key = str(appid)
+            if key in members and key not in known:
+                known.add(key)
+                done.append(key)
+                added += 1
+        if added:
+            job["updated_at"] = self._clock()
+        return added
+
+    def finish(self, job_id: str) -> None:
+        self._state.pop(job_id, None)
+
+    discard = finish
+
+    def unfinished(self) -> List[Dict[str, Any]]:
+        """未完成的作业状态：{"job_id", "type", "steam_id", "done", "total", "resumed", "updated_at"}。"""
+        jobs = []
+        for job_id, job in self._state.items():
+            if not isinstance(job, dict):
+                continue
+            jobs.append(
+                {
+                    "job_id": job_id,
+                    "type": job.get("type"),
+                    "steam_id": job.get("steam_id"),
+                    "done": len(job.get("done") or []),
+                    "total": len(job.get("appids") or []),
+                    "resumed": int(job.get("resumed") or 0),
+                    "updated_at": job.get("updated_at"),
+                }
+            )
+        return jobs
+
+
+def _unique(appids: Iterable[Any]) -> List[Any]:
+    seen = set()
+    out: List[Any] = []
+    for appid in appids or []:
+        if appid is None or str(appid) in seen:
+            continue
+        seen.add(str(appid))
+        out.append(appid)
+    return out
+
+
+__all__ = ["DEFAULT_MAX_RESUMES", "JOURNALED_TASK_TYPES", "JobJournal"]
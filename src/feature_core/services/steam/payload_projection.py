@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Mapping, Union
+
+
+# 声明式投影：字段名 -> True（原样保留）或子投影（递归裁剪 dict / list 中的 dict）
+# 只保留 services 与窗口实际读取的字段；新增读取字段时需同步补到这里
+Projection = Mapping[str, Union[bool, "Projection"]]
+
+
+OWNED_GAME_PROJECTION: Projection = {
+    "appid": True,
+    "name": True,
+    "playtime_forever": True,
+    "playtime_2weeks": True,
+    "rtime_last_played": True,
+}
+
+# IPlayerService.GetOwnedGames 的 response 字段
+OWNED_GAMES_PROJECTION: Projection = {
+    "game_count": True,
+    "games": OWNED_GAME_PROJECTION,
+}
+
+# ISteamUser.GetPlayerSummaries 的单个 player（steam_level 由 worker 另行补入）
+PLAYER_SUMMARY_PROJECTION: Projection = {
+    "steamid": True,
+    "personaname": True,
+    "timecreated": True,
+    "lastlogoff": True,
+    "steam_level": True,
+}
+
+# store appdetails 的单个 {"success":..., "data": {...}} 包装
+STORE_PRICE_PROJECTION: Projection = {
+    "success": True,
+    "fetched_at": True,
+    "data": {
+        "is_free": True,
+        "price_overview": {
+            "final": True,
+            "discount_percent": True,
+            "final_formatted": True,
+        },
+    },
+}
+
+GAMES_PAYLOAD_PROJECTION: Projection = {
+    "count": True,
+    "total_playtime": True,
+    "all_games": OWNED_GAME_PROJECTION,
+    "top_games": OWNED_GAME_PROJECTION,
+    "recent_game": OWNED_GAME_PROJECTION,
+    "top_2weeks": OWNED_GAME_PROJECTION,
+}
+
+
+def project(value: Any, projection: Union[bool, Projection]) -> Any:
+    """按投影裁剪 JSON 值（纯 Python，返回新对象，不修改入参）。"""
+    if projection is True:
+        return value
+    if isinstance(value, list):
+        return [project(item, projection) for item in value]
+    if not isinstance(value, dict):
+        return value
+    return {key: project(value[key], sub) for key, sub in projection.items() if sub and key in value}
+
+
+def project_owned_games(response: Any) -> Any:
+    return project(response, OWNED_GAMES_PROJECTION)
+
+
+def project_player_summary(player: Any) -> Any:
+    return project(player, PLAYER_SUMMARY_PROJECTION)
+
+
+def project_store_prices(prices: Any) -> Dict[str, Any]:
+    """appdetails 结果 {appid: wrapper} 的逐项投影。"""
+    if not isinstance(prices, dict):
+        return {}
+    return {str(appid): project(entry, STORE_PRICE_PROJECTION) for appid, entry in prices.items()}
+
+
+def project_cache(cache: Dict[str, Any]) -> bool:
+    """
+    就地裁剪旧版本写入的缓存（启动时调用一次）。
+    返回是否有字段被移除，调用方据此决定是否回写文件。
+    """
+    if not isinstance(cache, dict):
+        return False
+    before = _size(cache)
+
+    summary = cache.get("summary")
+    if isinstance(summary, dict):
+        cache["summary"] = project_player_summary(summary)
+
+    games = cache.get("games")
+    if isinstance(games, dict):
+        cache["games"] = project(games, GAMES_PAYLOAD_PROJECTION)
+
+    accounts = cache.get("games_accounts")
+    if isinstance(accounts, dict):
+        for sid, entry in list(accounts.items()):
+            if not isinstance(entry, dict):
+                continue
+            if isinstance(entry.get("games"), dict):
+                entry["games"] = project(entry["games"], GAMES_PAYLOAD_PROJECTION)
+            if isinstance(entry.get("summary"), dict):
+                entry["summary"] = project_player_summary(entry["summary"])
+
+    prices = cache.get("prices")
+    if isinstance(prices, dict):
+        cache["prices"] = project_store_prices(prices)
+
+    return _size(cache) != before
+
+
+def _size(value: Any) -> int:
+    """统计 dict 键总数，用于判断投影是否移除了字段。"""
+    if isinstance(value, dict):
+        return len(value) + sum(_size(v) for v in value.values())
+    if isinstance(value, list):
+        return sum(_size(v) for v in value)
+    return 0
+
+
+__all__ = [
+    "GAMES_PAYLOAD_PROJECTION",
+    "OWNED_GAMES_PROJECTION",
+    "OWNED_GAME_PROJECTION",
+    "PLAYER_SUMMARY_PROJECTION",
+    "Projection",
+    "STORE_PRICE_PROJECTION",
+    "project",
+    "project_cache",
+    "project_owned_games",
+    "project_player_summary",
+    "project_store_prices",
+]
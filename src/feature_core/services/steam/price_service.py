@@ -1,23 +1,93 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+# 价格条目有效期：打折中的价格随时可能恢复原价，需要更频繁地刷新
+DEFAULT_SALE_TTL_SECONDS = 6 * 3600
+DEFAULT_REGULAR_TTL_SECONDS = 3 * 24 * 3600
+# appdetails 返回 success=false（下架/锁区等）时的复查间隔
+DEFAULT_UNAVAILABLE_TTL_SECONDS = 7 * 24 * 3600
 
 
 class SteamPriceService:
     """
     Steam 商店价格子域（纯 Python）。
-    只负责：把增量价格 merge 到 cache，并返回需要 emit 的增量数据。
+    - 把增量价格 merge 到 cache（附带 fetched_at），并返回需要 emit 的增量数据
+    - 按“打折/原价/不可用”区分 TTL，`plan_refresh` 只返回缺失或过期的 appid
     """
 
+    def __init__(
+        self,
+        *,
+        sale_ttl_seconds: float = DEFAULT_SALE_TTL_SECONDS,
+        regular_ttl_seconds: float = DEFAULT_REGULAR_TTL_SECONDS,
+        unavailable_ttl_seconds: float = DEFAULT_UNAVAILABLE_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._sale_ttl = float(sale_ttl_seconds)
+        self._regular_ttl = float(regular_ttl_seconds)
+        self._unavailable_ttl = float(unavailable_ttl_seconds)
+        self._clock = clock
+
     def apply_store_prices(self, cache: Dict[str, Any], prices_delta: Dict[str, Any]) -> Dict[str, Any]:
         prices = cache.get("prices")
         if not isinstance(prices, dict):
             prices = {}
             cache["prices"] = prices
-        prices.update(prices_delta)
-        return {"prices_to_emit": prices_delta, "should_save": True}
 
+        now = self._clock()
+        stamped: Dict[str, Any] = {}
+        for appid, entry in (prices_delta or {}).items():
+            if not isinstance(entry, dict):
+                continue
+            record = dict(entry)
+            record["fetched_at"] = now
+            stamped[str(appid)] = record
+        prices.update(stamped)
+        return {"prices_to_emit": stamped, "should_save": True}
+
+    def ttl_for(self, entry: Dict[str, Any]) -> float:
+        if not entry.get("success"):
+            return self._unavailable_ttl
+        data = entry.get("data")
+        overview = data.get("price_overview") if isinstance(data, dict) else None
+        if isinstance(overview, dict) and (overview.get("discount_percent") or 0) > 0:
+            return self._sale_ttl
+        return self._regular_ttl
 
-__all__ = ["SteamPriceService"]
+    def is_stale(self, entry: Any, now: Optional[float] = None) -> bool:
+        """缺失、无时间戳（旧版缓存）或超过 TTL 的条目视为过期。"""
+        if not isinstance(entry, dict):
+            return True
+        try:
+            fetched_at = float(entry.get("fetched_at"))
+        except (TypeError, ValueError):
+            return True
+        current = self._clock() if now is None else now
+        return (current - fetched_at) >= self.ttl_for(entry)
+
+    def plan_refresh(self, cache: Dict[str, Any], appids: Iterable[Any]) -> List[Any]:
+        """返回 appids 中需要（重新）拉取价格的子集，保持原有顺序并去重。"""
+        prices = cache.get("prices")
+        if not isinstance(prices, dict):
+            prices = {}
+        now = self._clock()
+        seen = set()
+        stale: List[Any] = []
+        for appid in appids or []:
+            if appid is None or str(appid) in seen:
+                continue
+            seen.add(str(appid))
+            if self.is_stale(prices.get(str(appid)), now):
+                stale.append(appid)
+        return stale
 
 
+__all__ = [
+    "DEFAULT_REGULAR_TTL_SECONDS",
+    "DEFAULT_SALE_TTL_SECONDS",
+    "DEFAULT_UNAVAILABLE_TTL_SECONDS",
+    "SteamPriceService",
+]
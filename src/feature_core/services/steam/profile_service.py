@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+from src.feature_core.services.steam.payload_projection import project_player_summary
 
 
 class SteamProfileService:
@@ -14,6 +16,23 @@ class SteamProfileService:
         return {"summary_to_emit": summary, "should_save": True}
 
 
-__all__ = ["SteamProfileService"]
+def build_profile_summaries(
+    steam_ids: Iterable[str],
+    players: Mapping[str, Any],
+    levels: Mapping[str, Any],
+) -> Dict[str, Dict[str, Any]]:
+    """把批量 summary 与逐个查询的等级组装为 {steamid: summary}；缺失 summary 的账号不包含在内。"""
+    summaries: Dict[str, Dict[str, Any]] = {}
+    for sid in steam_ids:
+        player = players.get(str(sid))
+        if not player:
+            continue
+        summary = project_player_summary(player)
+        summary["steam_level"] = levels.get(str(sid)) or 0
+        summaries[str(sid)] = summary
+    return summaries
+
+
+__all__ = ["SteamProfileService", "build_profile_summaries"]
 
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Optional, Protocol
+from typing import Any, Callable, Dict, Iterable, Optional, Protocol
 
 
 class SignalLike(Protocol):
@@ -19,8 +19,12 @@ class SteamTaskServicePort(Protocol):
         task_type: str,
         extra_data: Any = None,
         steam_id: Optional[str] = None,
+        priority: int = ...,
+        task_id: Any = None,
     ) -> None: ...
 
+    def cancel_tasks(self, task_ids: Iterable[Any], reason: str = ...) -> int: ...
+
 
 class SteamRepositoryPort(Protocol):
     """Steam 缓存仓库端口（最小接口）。"""
@@ -31,5 +35,9 @@ class SteamRepositoryPort(Protocol):
 
     def save_data(self, data: dict) -> None: ...
 
+    def save_changes(self, data: dict, changes: Optional[Dict[str, Any]] = None) -> None:
+        """按变更集保存（见 cache_changes）；不支持增量的实现可整体保存。"""
+        ...
+
 
 __all__ = ["SignalLike", "SteamTaskServicePort", "SteamRepositoryPort"]
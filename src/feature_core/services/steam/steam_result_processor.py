@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional, Union
 
-from src.feature_core.services.steam.games_aggregator import GamesAggregator
+from src.feature_core.services.steam.cache_changes import Changes, merge_changes
+from src.feature_core.services.steam.games_aggregator import PROFILES_KEY, GamesAggregator
 from src.feature_core.services.steam.games_aggregation_service import SteamGamesAggregationService
 from src.feature_core.services.steam.profile_service import SteamProfileService
 from src.feature_core.services.steam.price_service import SteamPriceService
 from src.feature_core.services.steam.wishlist_service import SteamWishlistService
 from src.feature_core.services.steam.achievement_service import SteamAchievementService
+from src.feature_core.services.steam.inventory_service import SteamInventoryService
 
 
 @dataclass(frozen=True)
@@ -36,6 +38,18 @@ class EmitAchievements:
     payload: Any
 
 
+@dataclass(frozen=True)
+class EmitInventory:
+    payload: Any
+
+
+@dataclass(frozen=True)
+class EmitProgress:
+    """长任务进度：{"type", "task_id", "done", "total", "elapsed", "eta"}。"""
+
+    payload: Any
+
+
 @dataclass(frozen=True)
 class EmitError:
     payload: Any
@@ -43,9 +57,13 @@ class EmitError:
 
 @dataclass(frozen=True)
 class SaveStep:
-    """一步操作：要求外层将 cache 持久化。"""
+    """
+    一步操作：要求外层将 cache 持久化。
+    changes 为自上次 SaveStep 以来的变更集（含期间 partial 结果的增量），支持增量写入的仓库据此只写变化的行。
+    """
 
     reason: str
+    changes: Changes = field(default_factory=dict, compare=False)
 
 
 EmitStep = Union[
@@ -54,6 +72,8 @@ EmitStep = Union[
     EmitStorePrices,
     EmitWishlist,
     EmitAchievements,
+    EmitInventory,
+    EmitProgress,
     EmitError,
 ]
 
@@ -89,6 +109,7 @@ class SteamResultProcessor:
         price_service: SteamPriceService,
         wishlist_service: SteamWishlistService,
         achievement_service: SteamAchievementService,
+        inventory_service: Optional[SteamInventoryService] = None,
     ) -> None:
         self._cache = cache
         self._games_aggregator = games_aggregator
@@ -99,15 +120,27 @@ class SteamResultProcessor:
         self._price_service = price_service
         self._wishlist_service = wishlist_service
         self._achievement_service = achievement_service
+        self._inventory_service = inventory_service or SteamInventoryService()
+        # 尚未随 SaveStep 交出的变更（partial 结果只合并不落盘，其增量在这里累积）
+        self._changes: Changes = {}
+
+    def take_changes(self) -> Changes:
+        """取出并清空自上次 SaveStep 以来累积的变更集（供外层在 SaveStep 之外落盘时使用）。"""
+        changes, self._changes = self._changes, {}
+        return changes
+
+    def _save_step(self, reason: str) -> SaveStep:
+        return SaveStep(reason, changes=self.take_changes())
 
     def process(self, result: Dict[str, Any]) -> ProcessOutcome:
         steps: List[Step] = []
 
         if result.get("error"):
-            # games_stats 目前走 profile_and_games；离线/失败时也要正确减少 pending，
+            # games_stats 走 profiles + 各账号 games（旧路径为 profile_and_games）；离线/失败时也要结束对应的待返回项，
             # 否则聚合器会一直卡在未完成状态。
-            if result.get("type") in ("games", "profile_and_games") and self._games_aggregator:
-                done = self._games_aggregator.mark_error()
+            if result.get("type") in ("games", "profiles", "profile_and_games") and self._games_aggregator:
+                key = PROFILES_KEY if result.get("type") == "profiles" else result.get("steam_id")
+                done = self._games_aggregator.mark_error(key, result.get("generation"))
                 if done:
                     steps.extend(self._finalize_games_steps())
 
@@ -116,17 +149,22 @@ class SteamResultProcessor:
 
         task_type = result.get("type")
         data = result.get("data")
+        # partial：同一任务流式回传的中间结果（achievements/store_prices/wishlist），只合并与 emit，不落盘
+        partial = bool(result.get("partial"))
         if data is None:
             return ProcessOutcome(steps=[])
 
         if task_type == "summary":
             updates = self._profile_service.apply_summary(self._cache, data)
+            merge_changes(self._changes, {"summary": None})
             summary_to_emit = updates.get("summary_to_emit")
             if summary_to_emit:
                 steps.append(EmitPlayerSummary(summary_to_emit))
 
         elif task_type in ("games", "profile_and_games"):
             steam_id = result.get("steam_id")
+            # generation：提交任务时所属的聚合轮次（由上层回填）；迟到结果由聚合器决定并入或丢弃
+            generation = result.get("generation")
             if task_type == "profile_and_games":
                 games_data = data.get("games") if data else None
                 summary_data = data.get("summary") if data else None
@@ -136,35 +174,57 @@ class SteamResultProcessor:
 
             if self._games_aggregator:
                 if games_data is None:
-                    done = self._games_aggregator.mark_error()
+                    done = self._games_aggregator.mark_error(steam_id, generation)
                     if done:
                         steps.extend(self._finalize_games_steps())
                 else:
-                    done = self._games_aggregator.add_result(steam_id, games_data, summary_data)
+                    done = self._games_aggregator.add_result(steam_id, games_data, summary_data, generation)
                     if done:
                         steps.extend(self._finalize_games_steps())
 
+        elif task_type == "profiles":
+            if self._games_aggregator:
+                done = self._games_aggregator.add_profiles(data.get("summaries"), result.get("generation"))
+                if done:
+                    steps.extend(self._finalize_games_steps())
+
         elif task_type == "store_prices":
             updates = self._price_service.apply_store_prices(self._cache, data)
             prices_to_emit = updates.get("prices_to_emit")
+            merge_changes(self._changes, {"prices": dict(prices_to_emit or {})})
             if prices_to_emit is not None:
                 steps.append(EmitStorePrices(prices_to_emit))
 
         elif task_type == "wishlist":
             updates = self._wishlist_service.apply_wishlist(self._cache, data)
+            merge_changes(self._changes, {"wishlist": None})
             wishlist_to_emit = updates.get("wishlist_to_emit")
             if wishlist_to_emit is not None:
                 steps.append(EmitWishlist(wishlist_to_emit))
 
         elif task_type == "achievements":
             updates = self._achievement_service.apply_achievements(self._cache, data)
+            merge_changes(self._changes, {"achievements": {str(appid): entry for appid, entry in data.items()}})
             achievements_to_emit = updates.get("achievements_to_emit")
             if achievements_to_emit is not None:
                 steps.append(EmitAchievements(achievements_to_emit))
 
-        # 原逻辑：除了 "games" 类型外，均在此处持久化。
-        if task_type != "games":
-            steps.append(SaveStep("after_task"))
+        elif task_type == "inventory":
+            updates = self._inventory_service.apply_inventory(self._cache, result.get("steam_id"), data)
+            merge_changes(self._changes, {"inventory": None})
+            inventory_to_emit = updates.get("inventory_to_emit")
+            if inventory_to_emit is not None:
+                steps.append(EmitInventory(inventory_to_emit))
+
+        # 进度在数据之后 emit：界面先按新数据刷新，再叠加进度提示
+        progress = result.get("progress")
+        if isinstance(progress, dict):
+            steps.append(EmitProgress({"type": task_type, "task_id": result.get("task_id"), **progress}))
+
+        # 原逻辑：除了 "games" 类型外，均在此处持久化；中间结果等最终结果统一落盘。
+        # profiles 只参与聚合，由 finalize 持久化；app_catalog 写入独立的目录文件，不涉及 cache。
+        if task_type not in ("games", "profiles", "app_catalog") and not partial:
+            steps.append(self._save_step("after_task"))
 
         return ProcessOutcome(steps=steps)
 
@@ -175,6 +235,8 @@ class SteamResultProcessor:
 
         primary_id = self._get_primary_id()
         updates = self._games_aggregation_service.apply_games_aggregation(self._cache, primary_id, account_map)
+        if updates.get("should_save"):
+            merge_changes(self._changes, {"games_accounts": None, "games": None, "summary": None})
 
         summary_to_emit = updates.get("summary_to_emit")
         if summary_to_emit:
@@ -185,7 +247,7 @@ class SteamResultProcessor:
             steps.append(EmitGamesStats(games_to_emit))
 
         if updates.get("should_save"):
-            steps.append(SaveStep("finalize"))
+            steps.append(self._save_step("finalize"))
 
         return steps
 
@@ -196,6 +258,8 @@ __all__ = [
     "EmitStorePrices",
     "EmitWishlist",
     "EmitAchievements",
+    "EmitInventory",
+    "EmitProgress",
     "EmitError",
     "SaveStep",
     "Step",
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+
+class TaskCancelled(Exception):
+    """任务已被取消：由检查点抛出，SteamTask 捕获后回传 cancelled 结果（不是错误）。"""
+
+
+class CancellationToken:
+    """
+    协作式取消令牌（线程安全，纯 Python）：
+    - 提交任务时创建，由调度方在关闭窗口/切换凭证/退出时调用 cancel
+    - 执行方在分块之间、每次 HTTP 请求前检查；取消不会打断已发出的请求
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self.reason: Optional[str] = None
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> bool:
+        """标记取消；首次取消返回 True，重复取消返回 False（保留第一次的原因）。"""
+        if self._event.is_set():
+            return False
+        self.reason = reason
+        self._event.set()
+        return True
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """最多等待 timeout 秒；期间被取消则立即返回 True。"""
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise TaskCancelled(self.reason or "cancelled")
+
+
+# 当前执行上下文绑定的令牌：SteamClient 的请求出口据此检查，无需逐层传参
+_current_token: contextvars.ContextVar[Optional[CancellationToken]] = contextvars.ContextVar(
+    "steam_task_cancellation_token", default=None
+)
+
+
+def current_token() -> Optional[CancellationToken]:
+    return _current_token.get()
+
+
+@contextmanager
+def bind_token(token: Optional[CancellationToken]) -> Iterator[Optional[CancellationToken]]:
+    """在当前上下文（线程/协程）中绑定令牌，退出时恢复。"""
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
+
+
+def checkpoint() -> None:
+    """取消检查点：当前上下文的令牌已取消时抛出 TaskCancelled；未绑定令牌时什么都不做。"""
+    token = _current_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+def cancellable_sleep(delay: float) -> None:
+    """time.sleep 的可取消版本（用于限速等待）：被取消时提前醒来并抛出 TaskCancelled。"""
+    token = _current_token.get()
+    if token is None:
+        time.sleep(delay)
+        return
+    if token.wait(delay):
+        token.raise_if_cancelled()
+
+
+def propagate_token(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    把当前令牌带到线程池中执行（ThreadPoolExecutor 不继承 contextvars）。
+    返回的函数可在多个线程中并发调用。
+    """
+    token = _current_token.get()
+    if token is None:
+        return fn
+
+    def run(*args: Any, **kwargs: Any) -> Any:
+        with bind_token(token):
+            return fn(*args, **kwargs)
+
+    return run
+
+
+__all__ = [
+    "CancellationToken",
+    "TaskCancelled",
+    "bind_token",
+    "cancellable_sleep",
+    "checkpoint",
+    "current_token",
+    "propagate_token",
+]
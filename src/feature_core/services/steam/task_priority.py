@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# 优先级类别（数值越小越先执行）
+PRIORITY_INTERACTIVE = 0  # 用户点击触发的刷新
+PRIORITY_VISIBLE = 1  # 已打开窗口驱动的批量请求（价格块/成就批次等）
+PRIORITY_BACKGROUND = 2  # 启动刷新、目录同步等后台任务
+
+PRIORITY_NAMES = {
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_VISIBLE: "visible",
+    PRIORITY_BACKGROUND: "background",
+}
+
+# 排队每满 N 秒，有效优先级提升一级（防止后台任务饿死）
+DEFAULT_AGING_SECONDS = 10.0
+
+
+def normalize_priority(priority: Any) -> int:
+    """接受类别数值或名称（"interactive"/"visible"/"background"）；无法识别时按后台处理。"""
+    if isinstance(priority, str):
+        for value, name in PRIORITY_NAMES.items():
+            if name == priority:
+                return value
+        return PRIORITY_BACKGROUND
+    try:
+        value = int(priority)
+    except (TypeError, ValueError):
+        return PRIORITY_BACKGROUND
+    return min(max(value, PRIORITY_INTERACTIVE), PRIORITY_BACKGROUND)
+
+
+class PriorityTaskQueue:
+    """
+    带老化的优先级任务队列（线程安全，纯 Python）：
+    - 取出有效优先级最小的任务；有效优先级 = 类别 - 已等待时间 / aging_seconds
+    - 有效优先级相同按提交顺序（FIFO）
+    - 记录每个类别的出队次数与排队等待时间
+    """
+
+    def __init__(self, aging_seconds: float = DEFAULT_AGING_SECONDS, clock: Optional[Callable[[], float]] = None) -> None:
+        self.aging_seconds = max(0.001, float(aging_seconds))
+        self._clock = clock or time.monotonic
+        self._cond = threading.Condition()
+        # (priority, enqueued_at, seq, item)
+        self._items: List[Tuple[int, float, int, Any]] = []
+        self._seq = 0
+        self._closed = False
+        self._wait: Dict[int, Dict[str, float]] = {
+            p: {"count": 0, "wait_total": 0.0, "wait_max": 0.0} for p in PRIORITY_NAMES
+        }
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._items)
+
+    def put(self, item: Any, priority: Any = PRIORITY_BACKGROUND) -> bool:
+        """入队；队列已关闭时返回 False。"""
+        with self._cond:
+            if self._closed:
+                return False
+            self._seq += 1
+            self._items.append((normalize_priority(priority), self._clock(), self._seq, item))
+            self._cond.notify()
+            return True
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Tuple[Any, int, float]]:
+        """
+        阻塞取出下一个任务，返回 (item, priority, waited)；
+        队列关闭且为空、或超时时返回 None。
+        """
+        with self._cond:
+            deadline = None if timeout is None else self._clock() + timeout
+            while not self._items:
+                if self._closed:
+                    return None
+                remaining = None if deadline is None else deadline - self._clock()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+            return self._pop_locked()
+
+    def get_nowait(self) -> Optional[Tuple[Any, int, float]]:
+        with self._cond:
+            if not self._items:
+                return None
+            return self._pop_locked()
+
+    def close(self, discard: bool = True) -> List[Any]:
+        """关闭队列并唤醒所有等待方；discard=True 时丢弃并返回仍在排队的任务。"""
+        with self._cond:
+            self._closed = True
+            dropped = []
+            if discard:
+                dropped = [entry[3] for entry in self._items]
+                self._items.clear()
+            self._cond.notify_all()
+            return dropped
+
+    def stats(self) -> Dict[str, Any]:
+        """每个类别：当前排队数、已出队数与排队等待时间（秒）。"""
+        with self._cond:
+            queued = {p: 0 for p in PRIORITY_NAMES}
+            for priority, _, _, _ in self._items:
+                queued[priority] += 1
+            result = {}
+            for priority, name in PRIORITY_NAMES.items():
+                wait = self._wait[priority]
+                count = int(wait["count"])
+                result[name] = {
+                    "queued": queued[priority],
+                    "dequeued": count,
+                    "wait_avg": wait["wait_total"] / count if count else 0.0,
+                    "wait_max": wait["wait_max"],
+                }
+            return result
+
+    def _pop_locked(self) -> Tuple[Any, int, float]:
+        now = self._clock()
+        best_index = min(
+            range(len(self._items)),
+            key=lambda i: (self._effective(self._items[i], now), self._items[i][2]),
+        )
+        priority, enqueued_at, _, item = self._items.pop(best_index)
+        waited = max(0.0, now - enqueued_at)
+        wait = self._wait[priority]
+        wait["count"] += 1
+        wait["wait_total"] += waited
+        wait["wait_max"] = max(wait["wait_max"], waited)
+        return item, priority, waited
+
+    def _effective(self, entry: Tuple[int, float, int, Any], now: float) -> float:
+        priority, enqueued_at = entry[0], entry[1]
+        return priority - (now - enqueued_at) / self.aging_seconds
+
+
+__all__ = [
+    "DEFAULT_AGING_SECONDS",
+    "PRIORITY_BACKGROUND",
+    "PRIORITY_INTERACTIVE",
+    "PRIORITY_NAMES",
+    "PRIORITY_VISIBLE",
+    "PriorityTaskQueue",
+    "normalize_priority",
+]
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class ProgressTracker:
+    """
+    长任务的进度统计（纯 Python）：
+    - advance 累计已完成条目数；满 every 条、距上次回传超过 min_interval 秒或全部完成时返回进度快照
+    - 进度快照：{"done", "total", "elapsed", "eta"}，eta 按已完成条目的平均耗时估算（秒，未知时为 None）
+    """
+
+    def __init__(
+        self,
+        total: int,
+        *,
+        every: int = 10,
+        min_interval: float = 0.5,
+        clock: Optional[Callable[[], float]] = None,
+    ) -> None:
+        self.total = max(0, int(total or 0))
+        self.every = max(1, int(every or 1))
+        self.min_interval = max(0.0, float(min_interval))
+        self._clock = clock or time.monotonic
+        self._started = self._clock()
+        self._last_report = self._started
+        self._reported = 0
+        self.done = 0
+
+    def advance(self, count: int = 1) -> Optional[Dict[str, Any]]:
+        """累计完成 count 条；需要回传时返回进度快照，否则返回 None。"""
+        self.done = min(self.total, self.done + max(0, int(count)))
+        now = self._clock()
+        if (
+            self.done - self._reported >= self.every
+            or now - self._last_report >= self.min_interval
+            or self.done >= self.total
+        ):
+            self._reported = self.done
+            self._last_report = now
+            return self.snapshot(now)
+        return None
+
+    def snapshot(self, now: Optional[float] = None) -> Dict[str, Any]:
+        now = self._clock() if now is None else now
+        elapsed = max(0.0, now - self._started)
+        eta = None
+        if self.done >= self.total:
+            eta = 0.0
+        elif self.done > 0:
+            eta = elapsed / self.done * (self.total - self.done)
+        return {"done": self.done, "total": self.total, "elapsed": elapsed, "eta": eta}
+
+
+__all__ = ["ProgressTracker"]
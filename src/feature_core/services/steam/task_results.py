@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.feature_core.services.steam.achievement_stats_service import summarize_achievements
+from src.feature_core.services.steam.games_payload_service import build_games_payload
+from src.feature_core.services.steam.payload_projection import (
+    project_owned_games,
+    project_player_summary,
+    project_store_prices,
+)
+from src.feature_core.services.steam.task_progress import ProgressTracker
+
+
+# 长任务（成就/价格）流式回传的攒批阈值：满 N 条或距上次回传超过 T 秒即 flush
+STREAM_FLUSH_COUNT = 10
+STREAM_FLUSH_SECONDS = 0.5
+# 价格查询每次请求的 appid 数量
+PRICE_CHUNK = 20
+# 愿望单任务回传的折扣条目数
+WISHLIST_DISCOUNT_LIMIT = 10
+
+MISSING_CREDENTIALS_ERROR = "Missing API Key or Steam ID"
+APP_CATALOG_MISSING_ERROR = "App catalog is not configured"
+
+
+def new_result(task_type: str, steam_id: Any, task_id: Any = None) -> Dict[str, Any]:
+    """一条任务结果的初始结构（线程版与异步版任务服务共用）。"""
+    return {
+        "type": task_type,
+        "data": None,
+        "error": None,
+        "steam_id": steam_id,
+        "traceback": None,
+        "task_id": task_id,
+    }
+
+
+def partial_result(result: Dict[str, Any], data: Any, progress: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """以 result 的 type/steam_id/task_id 构造一条 partial=True 的中间结果（可附带进度）。"""
+    partial = {**result, "data": data, "error": None, "traceback": None, "partial": True}
+    partial.pop("progress", None)
+    if progress is not None:
+        partial["progress"] = progress
+    return partial
+
+
+def cancelled_result(result: Dict[str, Any], reason: Optional[str]) -> Dict[str, Any]:
+    """被取消任务的最终结果：丢弃已取得的数据，不让半截结果写入缓存。"""
+    return {**result, "data": None, "error": None, "traceback": None, "cancelled": True, "reason": reason}
+
+
+def apply_summary(result: Dict[str, Any], players: Any, level: Any) -> None:
+    """summary 任务：写入玩家摘要（含等级）或错误。"""
+    if players:
+        data = project_player_summary(players[0])
+        data["steam_level"] = level
+        result["data"] = data
+    else:
+        result["error"] = "Failed to fetch player summary"
+
+
+def apply_games(result: Dict[str, Any], owned_games: Any) -> None:
+    """games 任务：写入游戏库载荷或错误。"""
+    payload = games_payload(owned_games)
+    if payload is not None:
+        result["data"] = payload
+    else:
+        result["error"] = "Failed to fetch games data (API returned None)"
+
+
+def games_payload(owned_games: Any) -> Optional[Dict[str, Any]]:
+    """GetOwnedGames 原始响应 -> 游戏库载荷；响应为空时返回 None。"""
+    games_data = project_owned_games(owned_games)
+    if not games_data:
+        return None
+    return build_games_payload(games_data.get("games", []), games_data.get("game_count", 0))
+
+
+def profile_and_games_data(players: Any, level: Any, owned_games: Any) -> Dict[str, Any]:
+    """profile_and_games 任务的数据：{"summary", "games"}，缺失的部分为 None。"""
+    summary = None
+    if players:
+        summary = project_player_summary(players[0])
+        summary["steam_level"] = level
+    return {"summary": summary, "games": games_payload(owned_games)}
+
+
+def price_chunks(appids: Sequence[Any]) -> List[Sequence[Any]]:
+    return [appids[i : i + PRICE_CHUNK] for i in range(0, len(appids), PRICE_CHUNK)]
+
+
+class StreamBatcher:
+    """
+    长任务的流式攒批（价格/成就）：
+    - add_prices / add_achievement 累积条目并推进进度；需要回传时调用 emit(待回传条目, 进度) 并清空
+    - finish 返回 (尚未回传的剩余条目, 最终进度)，不在内存中累积整批结果
+    """
+
+    def __init__(self, total: int, emit: Callable[[Dict[str, Any], Dict[str, Any]], Any]) -> None:
+        self._tracker = ProgressTracker(total, every=STREAM_FLUSH_COUNT, min_interval=STREAM_FLUSH_SECONDS)
+        self._emit = emit
+        self._pending: Dict[str, Any] = {}
+
+    def add_prices(self, count: int, prices: Any) -> None:
+        if prices:
+            self._pending.update(project_store_prices(prices))
+        self._advance(count)
+
+    def add_achievement(self, appid: Any, stats: Any) -> None:
+        self._pending[str(appid)] = summarize_achievements(stats)
+        self._advance(1)
+
+    def finish(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        return self._pending, self._tracker.snapshot()
+
+    def _advance(self, count: int) -> None:
+        progress = self._tracker.advance(count)
+        if progress is not None:
+            pending, self._pending = self._pending, {}
+            self._emit(pending, progress)
+
+
+def fill_unknown_names(app_catalog: Any, wishlist_data: Any) -> None:
+    """元数据缺失时用本地 appid→name 目录补全愿望单条目名称（原地修改，不发起网络请求）。"""
+    if app_catalog is None or not isinstance(wishlist_data, dict):
+        return
+    unknown = [
+        appid
+        for appid, details in wishlist_data.items()
+        if isinstance(details, dict) and details.get("name") in (None, "", "Unknown")
+    ]
+    if not unknown:
+        return
+    for appid, name in app_catalog.resolve_names(unknown).items():
+        if name:
+            wishlist_data[appid]["name"] = name
+
+
+__all__ = [
+    "APP_CATALOG_MISSING_ERROR",
+    "MISSING_CREDENTIALS_ERROR",
+    "PRICE_CHUNK",
+    "STREAM_FLUSH_COUNT",
+    "STREAM_FLUSH_SECONDS",
+    "StreamBatcher",
+    "WISHLIST_DISCOUNT_LIMIT",
+    "apply_games",
+    "apply_summary",
+    "cancelled_result",
+    "fill_unknown_names",
+    "games_payload",
+    "new_result",
+    "partial_result",
+    "price_chunks",
+    "profile_and_games_data",
+]
@@ -1,6 +1,45 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+
+def wishlist_entries_from_prices(details_map: Any) -> Dict[str, dict]:
+    """
+    appdetails(price_overview) 结果 {appid: wrapper} -> 愿望单条目 {appid_str: {"subs", "name", "capsule"}}。
+    名称与封面待后续补全（默认 "Unknown" / ""）。
+    """
+    entries: Dict[str, dict] = {}
+    if not isinstance(details_map, dict):
+        return entries
+
+    for appid_str, data_wrapper in details_map.items():
+        if not isinstance(data_wrapper, dict) or not data_wrapper.get("success"):
+            continue
+        data = data_wrapper.get("data", {})
+        if not isinstance(data, dict):
+            continue
+
+        price_overview = data.get("price_overview", {})
+        sub = {"discount_pct": price_overview.get("discount_percent", 0), "price": price_overview.get("final_formatted", "")}
+        entries[str(appid_str)] = {"subs": [sub], "name": "Unknown", "capsule": ""}
+    return entries
+
+
+def apply_app_info(entries: Dict[str, dict], app_info_map: Mapping[str, Any]) -> Dict[str, dict]:
+    """用 get_apps_info 的结果补全条目名称与封面（原地修改并返回）。"""
+    for appid_str, entry in entries.items():
+        info = app_info_map.get(str(appid_str)) or {}
+        entry["name"] = info.get("name") or "Unknown"
+        entry["capsule"] = info.get("capsule", "")
+    return entries
+
+
+def best_discount(details: Any) -> int:
+    """条目所有 sub 中的最大折扣百分比（无折扣为 0）。"""
+    if not isinstance(details, dict):
+        return 0
+    return max((sub.get("discount_pct", 0) or 0 for sub in details.get("subs", []) if isinstance(sub, dict)), default=0)
 
 
 def build_discounted_wishlist_items(wishlist_data: Dict[str, Any], limit: int = 10) -> List[dict]:
@@ -43,6 +82,47 @@ def build_discounted_wishlist_items(wishlist_data: Dict[str, Any], limit: int =
     return discounted_games[: int(limit or 0)]
 
 
-__all__ = ["build_discounted_wishlist_items"]
+class DiscountedWishlistStream:
+    """
+    流式累计愿望单条目，并决定何时回传中间结果（纯 Python）：
+    - 折扣列表（前 limit 项）有变化时才回传；首次立即回传，之后至少间隔 min_interval 秒
+    - result() 返回全部条目到齐后的最终列表
+    """
+
+    def __init__(self, limit: int = 10, min_interval: float = 0.5, clock: Optional[Callable[[], float]] = None) -> None:
+        self.limit = limit
+        self.min_interval = max(0.0, float(min_interval))
+        self._clock = clock or time.monotonic
+        self._entries: Dict[str, Any] = {}
+        self._last_items: Optional[List[dict]] = None
+        self._last_emit: Optional[float] = None
+
+    def add(self, entries: Mapping[str, Any]) -> Optional[List[dict]]:
+        """合并一批条目；需要回传时返回当前折扣列表，否则返回 None。"""
+        self._entries.update(entries or {})
+        if not any(best_discount(details) > 0 for details in (entries or {}).values()):
+            return None
+
+        items = build_discounted_wishlist_items(self._entries, limit=self.limit)
+        now = self._clock()
+        if items == self._last_items:
+            return None
+        if self._last_emit is not None and now - self._last_emit < self.min_interval:
+            return None
+        self._last_items = items
+        self._last_emit = now
+        return items
+
+    def result(self) -> List[dict]:
+        return build_discounted_wishlist_items(self._entries, limit=self.limit)
+
+
+__all__ = [
+    "DiscountedWishlistStream",
+    "apply_app_info",
+    "best_discount",
+    "build_discounted_wishlist_items",
+    "wishlist_entries_from_prices",
+]
 
 
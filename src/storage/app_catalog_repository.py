@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import uuid
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+# 记录文件布局：header + N 条按 appid 升序的定长记录
+# record: appid(u32) name_offset(u32) name_length(u32) last_modified(u32)
+_MAGIC = b"SMCAT001"
+_HEADER = struct.Struct("<8sI")
+_RECORD = struct.Struct("<IIII")
+# 名称索引：N 个 u32（记录序号），按 casefold 后的名称排序
+_NAME_ENTRY = struct.Struct("<I")
+
+CatalogRecord = Tuple[int, str, int]  # (appid, name, last_modified)
+
+
+class AppCatalogRepository:
+    """
+    appid→name 目录（磁盘 + mmap）：
+    - `<prefix>.idx`：定长记录，按 appid 排序，二分查找
+    - `<prefix>.names`：UTF-8 名称 blob
+    - `<prefix>.nameidx`：按名称排序的记录序号，用于前缀搜索
+    - `<prefix>.meta.json`：同步水位（max last_modified / synced_at）
+
+    查询只读 mmap，常驻内存几乎为零；写入先落临时文件再替换，读写由锁串行化。
+    """
+
+    def __init__(self, path_prefix: str = "config/app_catalog") -> None:
+        self.path_prefix = path_prefix
+        self._lock = threading.RLock()
+        self._files: List[Any] = []
+        self._idx: Optional[mmap.mmap] = None
+        self._names: Optional[mmap.mmap] = None
+        self._name_idx: Optional[mmap.mmap] = None
+        self._count = 0
+        self._opened = False
+
+    # ---- paths ----
+
+    @property
+    def _idx_path(self) -> str:
+        return self.path_prefix + ".idx"
+
+    @property
+    def _names_path(self) -> str:
+        return self.path_prefix + ".names"
+
+    @property
+    def _name_idx_path(self) -> str:
+        return self.path_prefix + ".nameidx"
+
+    @property
+    def _meta_path(self) -> str:
+        return self.path_prefix + ".meta.json"
+
+    # ---- queries ----
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._ensure_open()
+            return self._count
+
+    def lookup(self, appid: Any) -> Optional[str]:
+        """按 appid 二分查找名称；不存在返回 None。"""
+        try:
+            target = int(appid)
+        except (TypeError, ValueError):
+            return None
+        with self._lock:
+            self._ensure_open()
+            pos = self._find(target)
+            if pos is None:
+                return None
+            return self._record(pos)[1]
+
+    def lookup_many(self, appids: Iterable[Any]) -> Dict[str, str]:
+        result: Dict[str, str] = {}
+        with self._lock:
+            self._ensure_open()
+            for appid in appids or []:
+                try:
+                    pos = self._find(int(appid))
+                except (TypeError, ValueError):
+                    continue
+                if pos is not None:
+                    result[str(appid)] = self._record(pos)[1]
+        return result
+
+    def search_prefix(self, prefix: str, limit: int = 20) -> List[Tuple[int, str]]:
+        """按名称前缀（忽略大小写）查找，返回 [(appid, name)]。"""
+        key = (prefix or "").casefold()
+        if not key:
+            return []
+        out: List[Tuple[int, str]] = []
+        with self._lock:
+            self._ensure_open()
+            if not self._count or self._name_idx is None:
+                return []
+            lo, hi = 0, self._count
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if self._name_at(mid).casefold() < key:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            i = lo
+            while i < self._count and len(out) < int(limit or 0):
+                appid, name, _ = self._record(self._name_entry(i))
+                if not name.casefold().startswith(key):
+                    break
+                out.append((appid, name))
+                i += 1
+        return out
+
+    def iter_records(self) -> Iterator[CatalogRecord]:
+        """按 appid 升序遍历全部记录（持锁期间逐条读取 mmap）。"""
+        with self._lock:
+            self._ensure_open()
+            for pos in range(self._count):
+                yield self._record(pos)
+
+    def load_meta(self) -> Dict[str, Any]:
+        if not os.path.exists(self._meta_path):
+            return {}
+        try:
+            with open(self._meta_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception:
+            logger.exception("Failed to load app catalog meta: %s", self._meta_path)
+            return {}
+
+    # ---- writes ----
+
+    def rebuild(self, records: Iterable[CatalogRecord]) -> int:
+        """
+        用给定记录（任意顺序，可为生成器）整体重建目录；返回记录数。
+        记录在锁外写入临时文件（生成器可能边拉网络边产出），只有最后的替换需要持锁。
+        """
+        tmp_paths, count = self._write_tmp(records)
+        with self._lock:
+            self._swap(tmp_paths)
+        return count
+
+    def merge(self, updates: Iterable[CatalogRecord]) -> int:
+        """将增量记录合并进现有目录（同 appid 以新记录为准）；返回合并后的记录数。"""
+        pending: Dict[int, CatalogRecord] = {}
+        for appid, name, last_modified in updates:
+            pending[int(appid)] = (int(appid), name or "", int(last_modified or 0))
+        with self._lock:
+            self._ensure_open()
+            # 旧记录在 _swap 释放 mmap 之前就已被完整消费，可直接流式串接
+            existing = (r for r in self.iter_records() if r[0] not in pending)
+            tmp_paths, count = self._write_tmp(itertools.chain(existing, pending.values()))
+            self._swap(tmp_paths)
+        return count
+
+    def save_meta(self, meta: Dict[str, Any]) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.path_prefix) or ".", exist_ok=True)
+            tmp_meta = self._meta_path + ".tmp"
+            with open(tmp_meta, "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False)
+            os.replace(tmp_meta, self._meta_path)
+        except Exception:
+            logger.exception("Failed to save app catalog meta: %s", self._meta_path)
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_maps()
+
+    # ---- internals ----
+
+    def _write_tmp(self, records: Iterable[CatalogRecord]) -> Tuple[Dict[str, str], int]:
+        os.makedirs(os.path.dirname(self.path_prefix) or ".", exist_ok=True)
+        suffix = f".{uuid.uuid4().hex}.tmp"
+        tmp_idx = self._idx_path + suffix
+        tmp_names = self._names_path + suffix
+        tmp_name_idx = self._name_idx_path + suffix
+        try:
+            count = self._write_files(records, tmp_idx, tmp_names, tmp_name_idx)
+        except BaseException:
+            for path in (tmp_idx, tmp_names, tmp_name_idx):
+                try:
+                    if os.path.exists(path):
+                        os.remove(path)
+                except OSError:
+                    logger.debug("Failed to remove catalog temp file: %s", path, exc_info=True)
+            raise
+        return {self._names_path: tmp_names, self._name_idx_path: tmp_name_idx, self._idx_path: tmp_idx}, count
+
+    def _write_files(self, records: Iterable[CatalogRecord], tmp_idx: str, tmp_names: str, tmp_name_idx: str) -> int:
+        # 名称边读边写入 blob，内存中只保留定长元组用于排序
+        rows: Dict[int, Tuple[int, int, int]] = {}
+        offset = 0
+        with open(tmp_names, "wb") as names_f:
+            for appid, name, last_modified in records:
+                data = (name or "").encode("utf-8")
+                names_f.write(data)
+                rows[int(appid)] = (offset, len(data), int(last_modified or 0) & 0xFFFFFFFF)
+                offset += len(data)
+
+        ordered = sorted(rows.items())
+        with open(tmp_idx, "wb") as idx_f:
+            idx_f.write(_HEADER.pack(_MAGIC, len(ordered)))
+            for appid, (name_offset, name_length, last_modified) in ordered:
+                idx_f.write(_RECORD.pack(appid, name_offset, name_length, last_modified))
+
+        with open(tmp_names, "rb") as names_f:
+            with mmap.mmap(names_f.fileno(), 0, access=mmap.ACCESS_READ) if offset else _EmptyBuffer() as blob:
+                name_order = sorted(
+                    range(len(ordered)),
+                    key=lambda i: bytes(blob[ordered[i][1][0] : ordered[i][1][0] + ordered[i][1][1]]).decode("utf-8", "replace").casefold(),
+                )
+        with open(tmp_name_idx, "wb") as name_idx_f:
+            for pos in name_order:
+                name_idx_f.write(_NAME_ENTRY.pack(pos))
+        return len(ordered)
+
+    def _swap(self, tmp_paths: Dict[str, str]) -> None:
+        # Windows 下被映射的文件无法替换：先释放 mmap；idx 最后替换，作为“提交点”
+        self._close_maps()
+        for final_path in (self._names_path, self._name_idx_path, self._idx_path):
+            os.replace(tmp_paths[final_path], final_path)
+        logger.info("App catalog written: %s", self._idx_path)
+
+    def _ensure_open(self) -> None:
+        if self._opened:
+            return
+        self._opened = True
+        self._count = 0
+        if not (os.path.exists(self._idx_path) and os.path.exists(self._names_path) and os.path.exists(self._name_idx_path)):
+            return
+        try:
+            self._idx = self._map(self._idx_path)
+            self._names = self._map(self._names_path)
+            self._name_idx = self._map(self._name_idx_path)
+            if self._idx is None or len(self._idx) < _HEADER.size:
+                raise ValueError("catalog index too small")
+            magic, count = _HEADER.unpack_from(self._idx, 0)
+            if magic != _MAGIC or len(self._idx) < _HEADER.size + count * _RECORD.size:
+                raise ValueError("catalog index corrupted")
+            self._count = count
+        except Exception:
+            logger.exception("Failed to open app catalog: %s", self._idx_path)
+            self._close_maps()
+            self._opened = True
+
+    def _map(self, path: str) -> Optional[mmap.mmap]:
+        f = open(path, "rb")
+        self._files.append(f)
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _close_maps(self) -> None:
+        for m in (self._idx, self._names, self._name_idx):
+            if m is not None:
+                try:
+                    m.close()
+                except Exception:
+                    logger.debug("Failed to close catalog mmap", exc_info=True)
+        for f in self._files:
+            try:
+                f.close()
+            except Exception:
+                logger.debug("Failed to close catalog file", exc_info=True)
+        self._files = []
+        self._idx = self._names = self._name_idx = None
+        self._count = 0
+        self._opened = False
+
+    def _find(self, appid: int) -> Optional[int]:
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            mid_appid = _RECORD.unpack_from(self._idx, _HEADER.size + mid * _RECORD.size)[0]
+            if mid_appid < appid:
+                lo = mid + 1
+            elif mid_appid > appid:
+                hi = mid
+            else:
+                return mid
+        return None
+
+    def _record(self, pos: int) -> CatalogRecord:
+        appid, name_offset, name_length, last_modified = _RECORD.unpack_from(self._idx, _HEADER.size + pos * _RECORD.size)
+        name = ""
+        if name_length and self._names is not None:
+            name = bytes(self._names[name_offset : name_offset + name_length]).decode("utf-8", "replace")
+        return appid, name, last_modified
+
+    def _name_entry(self, i: int) -> int:
+        return _NAME_ENTRY.unpack_from(self._name_idx, i * _NAME_ENTRY.size)[0]
+
+    def _name_at(self, i: int) -> str:
+        return self._record(self._name_entry(i))[1]
+
+
+class _EmptyBuffer(bytes):
+    """空 blob 无法 mmap：提供同样的上下文管理接口。"""
+
+    def __enter__(self) -> "_EmptyBuffer":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+__all__ = ["AppCatalogRepository", "CatalogRecord"]
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import uuid
+from typing import Any, Dict
+
+
+logger = logging.getLogger(__name__)
+
+
+class AppMetadataRepository:
+    """
+    应用元数据缓存持久化（JSON）：{appid: {name, short_description, ..., fetched_at}}。
+    仅负责读写，不承载 TTL 等业务规则；写入采用唯一临时文件 + 替换，避免半写入。
+    可被多个线程同时调用：写入与替换在锁内串行进行。
+    """
+
+    def __init__(self, data_file: str = "config/app_metadata.json") -> None:
+        self.data_file = data_file
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self.data_file):
+            return {}
+        try:
+            with open(self.data_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                return {str(k): v for k, v in data.items() if isinstance(v, dict)}
+            return {}
+        except Exception:
+            logger.exception("Failed to load app metadata cache: %s", self.data_file)
+            return {}
+
+    def save(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        tmp_path = f"{self.data_file}.{uuid.uuid4().hex}.tmp"
+        with self._lock:
+            try:
+                os.makedirs(os.path.dirname(self.data_file) or ".", exist_ok=True)
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(entries, f, ensure_ascii=False)
+                os.replace(tmp_path, self.data_file)
+            except Exception:
+                logger.exception("Failed to save app metadata cache: %s", self.data_file)
+                try:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                except OSError:
+                    logger.debug("Failed to remove app metadata temp file: %s", tmp_path, exc_info=True)
+
+
+__all__ = ["AppMetadataRepository"]
@@ -17,7 +17,25 @@ class ConfigManager:
             "timer_reminder_presets": [],
             "llm_api_key": "",
             "llm_base_url": "",
-            "llm_model": ""
+            "llm_model": "",
+            # 覆盖 Steam 各端点族限速参数，如 {"store_appdetails": {"rate": 0.6, "burst": 10}}
+            "steam_rate_limits": {},
+            # 成就拉取的并发请求数（1 表示逐个串行）
+            "steam_achievement_concurrency": 4,
+            # Steam 后台任务实现："thread"（固定大小线程池）或 "asyncio"（单事件循环线程）
+            "steam_task_backend": "thread",
+            # "thread" 实现的线程池大小（同时执行的任务数，其余排队）
+            "steam_task_pool_size": 4,
+            # 应用级后台执行器各通道的并发上限，如 {"network": 4, "llm": 2, "disk": 1, "cpu": 2}
+            "background_lanes": {},
+            # 各类数据的有效期（秒），如 {"summary": 1800, "games": 7200, "wishlist": 21600, "news": 10800, "epic": 21600}
+            "refresh_ttls": {},
+            # 后台检查数据是否过期的间隔（秒，最小 60）
+            "refresh_check_interval_seconds": 900,
+            # game_data.json 的保存去抖窗口（毫秒）：窗口内的多次保存合并为一次后台写盘
+            "game_data_save_debounce_ms": 1500,
+            # Steam 缓存存储："json"（单个 game_data.json）或 "sqlite"（按表增量写入，首次启动自动导入 JSON）
+            "steam_storage_backend": "json"
         }
         self.load_config()
 
@@ -0,0 +1,390 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.storage.steam_repository import SteamRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS documents (section TEXT PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS accounts (steam_id TEXT PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS owned_games (
+    steam_id TEXT NOT NULL,
+    appid TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT,
+    playtime_forever INTEGER,
+    playtime_2weeks INTEGER,
+    rtime_last_played INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (steam_id, appid)
+);
+CREATE INDEX IF NOT EXISTS idx_owned_games_playtime ON owned_games (playtime_forever DESC);
+CREATE INDEX IF NOT EXISTS idx_owned_games_last_played ON owned_games (rtime_last_played DESC);
+CREATE TABLE IF NOT EXISTS prices (
+    appid TEXT PRIMARY KEY,
+    success INTEGER,
+    final INTEGER,
+    discount_percent INTEGER,
+    fetched_at REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_prices_discount ON prices (discount_percent);
+CREATE TABLE IF NOT EXISTS achievements (appid TEXT PRIMARY KEY, total INTEGER, unlocked INTEGER, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS wishlist (position INTEGER PRIMARY KEY, appid TEXT, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS free_games (position INTEGER PRIMARY KEY, title TEXT, data TEXT NOT NULL);
+"""
+
+_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "accounts": ("steam_id", "data"),
+    "owned_games": (
+        "steam_id",
+        "appid",
+        "position",
+        "name",
+        "playtime_forever",
+        "playtime_2weeks",
+        "rtime_last_played",
+        "data",
+    ),
+    "prices": ("appid", "success", "final", "discount_percent", "fetched_at", "data"),
+    "achievements": ("appid", "total", "unlocked", "data"),
+    "wishlist": ("position", "appid", "data"),
+    "free_games": ("position", "title", "data"),
+}
+
+# 拆成独立表的 cache 顶层键；其余键整体存为 documents 中的一行 JSON
+TABLE_SECTIONS = ("games_accounts", "prices", "achievements", "wishlist", "free_game")
+
+# 写计划中的一步：(操作, 目标, 参数)
+_Op = Tuple[str, str, Any]
+
+
+class SqliteSteamRepository:
+    """
+    Steam 缓存仓库的 SQLite 实现（标准库 sqlite3，WAL 模式）：
+    - 账号/游戏库/价格/成就/愿望单/Epic 免费游戏拆为独立表，其余键存为 documents 中的 JSON
+    - save_changes 按变更集只写变化的行（更新 50 条价格即 50 行写入），save_data 为全量同步
+    - 首次打开空库时从旧的 game_data.json 导入一次（原文件保留）
+    - 游戏库按游玩时长/最近游玩建有索引，可直接用 SQL 查询
+    写入在单个事务内完成；连接由内部锁保护，可在后台线程写入。
+    """
+
+    # 快照是增量：延迟写时必须按顺序逐个写出
+    snapshots_are_complete = False
+
+    def __init__(self, db_file: str = "config/game_data.sqlite3", json_file: Optional[str] = "config/game_data.json") -> None:
+        self.db_file = db_file
+        self.json_file = json_file
+        self._on_error: Optional[Callable[[str], Any]] = None
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def set_error_handler(self, fn: Callable[[str], Any]) -> None:
+        self._on_error = fn
+
+    # ---- SteamRepositoryPort ----
+
+    def load_data(self) -> dict:
+        """加载缓存；库为空且存在旧 JSON 时先导入。"""
+        try:
+            if self._meta("initialized") is None and self.json_file and os.path.exists(self.json_file):
+                self.import_json(self.json_file)
+            cache = self._load()
+            logger.info("Loaded local game data from %s", self.db_file)
+            return cache
+        except Exception as e:
+            self._report(f"Failed to load local game data: {e}")
+            return {}
+
+    def save_data(self, data: dict) -> None:
+        """全量同步：各表与 cache 完全一致（多余的行/文档被删除）。"""
+        self.write_snapshot(self.snapshot(data))
+
+    def save_changes(self, data: dict, changes: Optional[Dict[str, Any]] = None) -> None:
+        """按变更集增量写入；changes 为 None 时全量同步。"""
+        self.write_snapshot(self.snapshot(data, changes))
+
+    def snapshot(self, data: dict, changes: Optional[Dict[str, Any]] = None) -> List[_Op]:
+        """
+        在主线程上把需要写入的行序列化为写计划（缓存只在主线程修改，计划即一致快照）；
+        随后由 write_snapshot 在任意线程执行。
+        """
+        data = data if isinstance(data, dict) else {}
+        if changes is None:
+            sections: Iterable[str] = set(data) | set(TABLE_SECTIONS)
+            ops: List[_Op] = [("prune_documents", "", [k for k in data if k not in TABLE_SECTIONS])]
+            return ops + [op for section in sorted(sections) for op in _section_ops(section, data, None)]
+        ops = []
+        for section, rows in changes.items():
+            ops.extend(_section_ops(section, data, rows))
+        return ops
+
+    def write_snapshot(self, plan: List[_Op]) -> bool:
+        """在一个事务中执行写计划；返回是否成功。"""
+        if not plan:
+            return True
+        try:
+            with self._lock:
+                conn = self._connection()
+                with conn:
+                    for op in plan:
+                        _apply(conn, op)
+                    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('initialized', ?)", (str(time.time()),))
+            logger.debug("Saved %s game data op(s) to %s", len(plan), self.db_file)
+            return True
+        except Exception as e:
+            self._report(f"Failed to save local game data: {e}")
+            return False
+
+    # ---- 导入与查询 ----
+
+    def import_json(self, json_file: str) -> bool:
+        """从旧版 game_data.json 一次性导入（全量同步）；原文件保留作为备份。"""
+        data = SteamRepository(json_file).load_data()
+        if not data:
+            return False
+        if not self.write_snapshot(self.snapshot(data)):
+            return False
+        self._set_meta("imported_from", os.path.abspath(json_file))
+        logger.info("Imported game data from %s into %s", json_file, self.db_file)
+        return True
+
+    def top_games_by_playtime(self, limit: int = 10, steam_id: Optional[str] = None) -> List[dict]:
+        """按总游玩时长降序返回游戏条目（走 playtime 索引）；steam_id 为空时跨全部账号。"""
+        sql = "SELECT data FROM owned_games"
+        params: List[Any] = []
+        if steam_id:
+            sql += " WHERE steam_id = ?"
+            params.append(str(steam_id))
+        sql += " ORDER BY playtime_forever DESC LIMIT ?"
+        params.append(max(0, int(limit)))
+        with self._lock:
+            rows = self._connection().execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ---- internals ----
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_file) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.db_file, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def _load(self) -> dict:
+        with self._lock:
+            conn = self._connection()
+            cache: Dict[str, Any] = {
+                section: json.loads(text) for section, text in conn.execute("SELECT section, data FROM documents")
+            }
+            present = {row[0][len("section:") :] for row in conn.execute("SELECT key FROM meta WHERE key LIKE 'section:%'")}
+
+            if "games_accounts" in present:
+                accounts: Dict[str, Any] = {}
+                for sid, text in conn.execute("SELECT steam_id, data FROM accounts"):
+                    entry = json.loads(text)
+                    if isinstance(entry.get("games"), dict):
+                        entry["games"]["all_games"] = []
+                    accounts[sid] = entry
+                for sid, text in conn.execute("SELECT steam_id, data FROM owned_games ORDER BY steam_id, position"):
+                    games = accounts.get(sid, {}).get("games")
+                    if isinstance(games, dict):
+                        games["all_games"].append(json.loads(text))
+                cache["games_accounts"] = accounts
+            for section, table in (("prices", "prices"), ("achievements", "achievements")):
+                if section in present:
+                    cache[section] = {appid: json.loads(text) for appid, text in conn.execute(f"SELECT appid, data FROM {table}")}
+            if "wishlist" in present:
+                cache["wishlist"] = [json.loads(text) for (text,) in conn.execute("SELECT data FROM wishlist ORDER BY position")]
+            if "free_game" in present and isinstance(cache.get("free_game"), dict):
+                cache["free_game"]["items"] = [
+                    json.loads(text) for (text,) in conn.execute("SELECT data FROM free_games ORDER BY position")
+                ]
+        return cache
+
+    def _report(self, msg: str) -> None:
+        logger.exception("%s", msg)
+        if callable(self._on_error):
+            try:
+                self._on_error(msg)
+            except Exception:
+                logger.exception("SqliteSteamRepository error handler failed")
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _section_ops(section: str, data: Dict[str, Any], rows: Optional[Dict[str, Any]]) -> List[_Op]:
+    """把 cache 的一个顶层键转换为写计划；rows 为 None 时整段重写，否则只写 rows 中的键。"""
+    value = data.get(section)
+    if section not in TABLE_SECTIONS:
+        return [("document", section, None if value is None else _dumps(value))]
+
+    present = value is not None
+    ops: List[_Op] = [("meta", f"section:{section}", "1" if present else None)]
+
+    if section in ("prices", "achievements"):
+        value = value if isinstance(value, dict) else {}
+        build = _price_row if section == "prices" else _achievement_row
+        if rows is None:
+            return ops + [("replace", section, [build(k, v) for k, v in value.items()])]
+        keys = [str(k) for k in rows]
+        return ops + [
+            ("delete_keys", section, ("appid", [k for k in keys if k not in value])),
+            ("upsert", section, [build(k, value[k]) for k in keys if k in value]),
+        ]
+
+    if section == "games_accounts":
+        value = value if isinstance(value, dict) else {}
+        sids = list(value) if rows is None else [str(k) for k in rows]
+        account_rows, game_rows = [], []
+        for sid in sids:
+            if sid in value:
+                account, games = _split_account(sid, value[sid])
+                account_rows.append(account)
+                game_rows.extend(games)
+        if rows is None:
+            return ops + [("replace", "accounts", account_rows), ("replace", "owned_games", game_rows)]
+        return ops + [
+            ("delete_keys", "accounts", ("steam_id", sids)),
+            ("delete_keys", "owned_games", ("steam_id", sids)),
+            ("upsert", "accounts", account_rows),
+            ("upsert", "owned_games", game_rows),
+        ]
+
+    if section == "wishlist":
+        items = value if isinstance(value, list) else []
+        return ops + [
+            ("replace", "wishlist", [(i, _str_or_none(_get(item, "appid")), _dumps(item)) for i, item in enumerate(items)])
+        ]
+
+    # free_game：{"updated_at", "items": [...]}，条目入表，其余字段存为文档
+    payload = value if isinstance(value, dict) else {}
+    items = payload.get("items") if isinstance(payload.get("items"), list) else []
+    meta = None if not present else _dumps({k: v for k, v in payload.items() if k != "items"})
+    return ops + [
+        ("document", "free_game", meta),
+        ("replace", "free_games", [(i, _str_or_none(_get(item, "title")), _dumps(item)) for i, item in enumerate(items)]),
+    ]
+
+
+def _get(item: Any, key: str) -> Any:
+    return item.get(key) if isinstance(item, dict) else None
+
+
+def _str_or_none(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _price_row(appid: Any, entry: Any) -> tuple:
+    data = _get(entry, "data")
+    overview = data.get("price_overview") if isinstance(data, dict) else None
+    return (
+        str(appid),
+        1 if _get(entry, "success") else 0,
+        _int(_get(overview, "final")),
+        _int(_get(overview, "discount_percent")),
+        _get(entry, "fetched_at"),
+        _dumps(entry),
+    )
+
+
+def _achievement_row(appid: Any, entry: Any) -> tuple:
+    return (str(appid), _int(_get(entry, "total")), _int(_get(entry, "unlocked")), _dumps(entry))
+
+
+def _split_account(sid: str, entry: Any) -> Tuple[tuple, List[tuple]]:
+    """账号行保存除 games.all_games 以外的全部字段；all_games 拆为 owned_games 行（保留顺序）。"""
+    entry = dict(entry) if isinstance(entry, dict) else {}
+    games = entry.get("games")
+    all_games: List[Any] = []
+    if isinstance(games, dict):
+        games = dict(games)
+        all_games = games.pop("all_games", None) or []
+        entry["games"] = games
+    game_rows = [
+        (
+            sid,
+            str(_get(game, "appid")),
+            position,
+            _get(game, "name"),
+            _int(_get(game, "playtime_forever")),
+            _int(_get(game, "playtime_2weeks")),
+            _int(_get(game, "rtime_last_played")),
+            _dumps(game),
+        )
+        for position, game in enumerate(all_games)
+        if _get(game, "appid") is not None
+    ]
+    return (sid, _dumps(entry)), game_rows
+
+
+def _apply(conn: sqlite3.Connection, op: _Op) -> None:
+    kind, target, arg = op
+    if kind == "document":
+        if arg is None:
+            conn.execute("DELETE FROM documents WHERE section = ?", (target,))
+        else:
+            conn.execute("INSERT OR REPLACE INTO documents (section, data) VALUES (?, ?)", (target, arg))
+    elif kind == "prune_documents":
+        keep = set(arg) | {"free_game"}
+        stale = [row[0] for row in conn.execute("SELECT section FROM documents") if row[0] not in keep]
+        conn.executemany("DELETE FROM documents WHERE section = ?", [(section,) for section in stale])
+    elif kind == "meta":
+        if arg is None:
+            conn.execute("DELETE FROM meta WHERE key = ?", (target,))
+        else:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (target, arg))
+    elif kind in ("replace", "upsert"):
+        if kind == "replace":
+            conn.execute(f"DELETE FROM {target}")
+        columns = _COLUMNS[target]
+        placeholders = ", ".join("?" for _ in columns)
+        conn.executemany(f"INSERT OR REPLACE INTO {target} ({', '.join(columns)}) VALUES ({placeholders})", arg)
+    elif kind == "delete_keys":
+        column, keys = arg
+        conn.executemany(f"DELETE FROM {target} WHERE {column} = ?", [(key,) for key in keys])
+    else:
+        raise ValueError(f"Unknown write op: {kind}")
+
+
+__all__ = ["SqliteSteamRepository", "TABLE_SECTIONS"]
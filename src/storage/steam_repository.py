@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import os
 import logging
+import uuid
 from typing import Any, Callable, Optional
 
 
@@ -10,7 +11,10 @@ logger = logging.getLogger(__name__)
 
 
 class SteamRepository:
-    """Steam 数据持久化层（纯 Python）"""
+    """Steam 数据持久化层（纯 Python）：整个缓存为一个 JSON 文档，任何变更都整体重写。"""
+
+    # 每个快照都是完整文档：延迟写时只需写出最新的一份
+    snapshots_are_complete = True
 
     def __init__(self, data_file: str = "config/game_data.json") -> None:
         self.data_file = data_file
@@ -38,14 +42,44 @@ class SteamRepository:
         return cache
 
     def save_data(self, data):
-        """保存缓存数据到本地"""
+        """保存缓存数据到本地（原子替换）"""
+        self.write_snapshot(self.serialize(data))
+
+    def save_changes(self, data, changes=None) -> None:
+        """JSON 文档无法局部更新：忽略变更集，整体保存。"""
+        self.save_data(data)
+
+    def snapshot(self, data, changes=None) -> str:
+        """延迟写接口：在主线程上取得一致快照，随后由 write_snapshot 在后台写出。"""
+        return self.serialize(data)
+
+    @staticmethod
+    def serialize(data) -> str:
+        """序列化为紧凑 JSON（无缩进时走 C 编码器，可在主线程上快速得到一致快照）。"""
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+    def write_snapshot(self, text: str) -> bool:
+        """
+        把已序列化的快照写入临时文件、fsync 后原子替换，崩溃/断电不会留下半截文件。
+        可在后台线程调用；返回是否写入成功。
+        """
+        tmp_path = f"{self.data_file}.{uuid.uuid4().hex}.tmp"
         try:
             # 确保目录存在
-            os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.makedirs(os.path.dirname(self.data_file) or ".", exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.data_file)
             logger.info("Saved game data to %s", self.data_file)
+            return True
         except Exception as e:
+            try:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            except OSError:
+                logger.debug("Failed to remove game data temp file: %s", tmp_path, exc_info=True)
             msg = f"Failed to save local game data: {e}"
             logger.exception("%s", msg)
             if callable(self._on_error):
@@ -53,3 +87,7 @@ class SteamRepository:
                     self._on_error(msg)
                 except Exception:
                     logger.exception("SteamRepository error handler failed")
+            return False
+
+
+__all__ = ["SteamRepository"]
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MANIFEST_TTL_SECONDS = 7 * 24 * 3600
+
+
+class WebApiManifestRepository:
+    """
+    Steam WebAPI 接口清单（GetSupportedAPIList）缓存：
+    - 磁盘 JSON + 进程内内存副本，线程安全
+    - 按 TTL 过期；API Key 变化（按哈希比对，不落盘明文 Key）即失效
+    - `get_or_fetch` 在锁外下载：同一 API Key 同一时刻只有一个线程真正下载清单，
+      其余线程等待其完成后直接读缓存；下载期间 load/save 不被阻塞
+    """
+
+    def __init__(
+        self,
+        data_file: str = "config/webapi_manifest.json",
+        *,
+        ttl_seconds: float = DEFAULT_MANIFEST_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.data_file = data_file
+        self.ttl_seconds = float(ttl_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._memory: Optional[Dict[str, Any]] = None
+        # key 哈希 -> 正在进行的下载（完成时 set）；受 _lock 保护
+        self._fetching: Dict[str, threading.Event] = {}
+
+    def load(self, api_key: str) -> Optional[Dict[str, Any]]:
+        """返回与 api_key 匹配且未过期的清单副本；否则返回 None。"""
+        with self._lock:
+            return self._load_locked(api_key)
+
+    def save(self, api_key: str, manifest: Dict[str, Any]) -> None:
+        with self._lock:
+            self._save_locked(api_key, manifest)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._memory = None
+            try:
+                if os.path.exists(self.data_file):
+                    os.remove(self.data_file)
+            except Exception:
+                logger.exception("Failed to remove WebAPI manifest cache: %s", self.data_file)
+
+    def get_or_fetch(self, api_key: str, fetch: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        命中缓存直接返回副本；未命中则调用 fetch() 下载并持久化。
+        并发调用只有一个线程执行 fetch；下载失败（未得到有效清单）时，等待中的线程之一接着重试。
+        注意：WebAPI.load_interfaces 会原地修改清单，因此每次都返回深拷贝。
+        """
+        key_hash = _hash_key(api_key)
+        while True:
+            with self._lock:
+                cached = self._load_locked(api_key)
+                if cached is not None:
+                    return cached
+                pending = self._fetching.get(key_hash)
+                if pending is None:
+                    done = self._fetching[key_hash] = threading.Event()
+                    break
+            pending.wait()
+
+        try:
+            manifest = fetch()
+            if isinstance(manifest, dict) and manifest.get("apilist"):
+                self.save(api_key, manifest)
+        finally:
+            with self._lock:
+                self._fetching.pop(key_hash, None)
+            done.set()
+        return copy.deepcopy(manifest)
+
+    # ---- internals ----
+
+    def _load_locked(self, api_key: str) -> Optional[Dict[str, Any]]:
+        entry = self._memory
+        if entry is None:
+            entry = self._read_file()
+            self._memory = entry
+        if not self._is_valid(entry, api_key):
+            return None
+        return copy.deepcopy(entry["manifest"])
+
+    def _save_locked(self, api_key: str, manifest: Dict[str, Any]) -> None:
+        entry = {
+            "key_hash": _hash_key(api_key),
+            "fetched_at": self._clock(),
+            "manifest": copy.deepcopy(manifest),
+        }
+        self._memory = entry
+        try:
+            os.makedirs(os.path.dirname(self.data_file) or ".", exist_ok=True)
+            tmp_path = self.data_file + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, self.data_file)
+            logger.info("Saved WebAPI manifest cache to %s", self.data_file)
+        except Exception:
+            logger.exception("Failed to save WebAPI manifest cache: %s", self.data_file)
+
+    def _read_file(self) -> Optional[Dict[str, Any]]:
+        if not os.path.exists(self.data_file):
+            return None
+        try:
+            with open(self.data_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else None
+        except Exception:
+            logger.exception("Failed to load WebAPI manifest cache: %s", self.data_file)
+            return None
+
+    def _is_valid(self, entry: Optional[Dict[str, Any]], api_key: str) -> bool:
+        if not isinstance(entry, dict) or not isinstance(entry.get("manifest"), dict):
+            return False
+        if entry.get("key_hash") != _hash_key(api_key):
+            return False
+        try:
+            fetched_at = float(entry.get("fetched_at") or 0)
+        except (TypeError, ValueError):
+            return False
+        return (self._clock() - fetched_at) < self.ttl_seconds
+
+
+def _hash_key(api_key: str) -> str:
+    return hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()
+
+
+_shared_repo: Optional[WebApiManifestRepository] = None
+_shared_lock = threading.Lock()
+
+
+def get_webapi_manifest_repository() -> WebApiManifestRepository:
+    """获取进程级共享的接口清单缓存（懒加载）。"""
+    global _shared_repo
+    with _shared_lock:
+        if _shared_repo is None:
+            _shared_repo = WebApiManifestRepository()
+        return _shared_repo
+
+
+__all__ = ["WebApiManifestRepository", "get_webapi_manifest_repository", "DEFAULT_MANIFEST_TTL_SECONDS"]
@@ -16,6 +16,9 @@ class AchievementWindowBinder:
         ctx.steam_manager.on_achievements_data.connect(update_window_data)
 
         view.request_fetch_achievements.connect(ctx.steam_manager.fetch_achievements)
+        ctx.steam_manager.on_task_progress.connect(view.on_task_progress)
+        # 窗口关闭后不再继续批量拉取成就（已拉到的 partial 结果保留在缓存中）
+        view.window_closed.connect(lambda: ctx.steam_manager.cancel_tasks(["achievements"], "window_closed"))
 
         update_window_data()
 
@@ -16,6 +16,15 @@ class AllGamesWindowBinder:
         ctx.steam_manager.on_store_prices.connect(update_window_data)
 
         view.request_fetch_prices.connect(ctx.steam_manager.fetch_store_prices)
+        ctx.steam_manager.on_task_progress.connect(view.on_task_progress)
+
+        def refresh_prices(appids: list) -> None:
+            count = ctx.steam_manager.refresh_store_prices(appids)
+            view.on_price_refresh_planned(count, len(appids))
+
+        view.request_refresh_prices.connect(refresh_prices)
+        # 窗口关闭后停止价格刷新
+        view.window_closed.connect(lambda: ctx.steam_manager.cancel_tasks(["store_prices"], "window_closed"))
 
         update_window_data()
 
@@ -17,12 +17,14 @@ class InfoWindowBinder:
 
         ctx.steam_manager.on_wishlist_data.connect(update_window_data)
         view.request_refresh.connect(ctx.steam_manager.fetch_wishlist)
+        # 窗口关闭后停止愿望单查询；再次打开可点“刷新数据”重试
+        view.window_closed.connect(lambda: ctx.steam_manager.cancel_tasks(["wishlist"], "window_closed"))
 
+        # 先用缓存秒开，数据过期（或从未获取）时才重新查询
         cache = getattr(ctx.steam_manager, "cache", None) or {}
         if "wishlist" in cache:
             update_window_data(cache["wishlist"])
-        else:
-            ctx.steam_manager.fetch_wishlist()
+        ctx.steam_manager.refresh_stale(["wishlist"])
 
         news_manager = getattr(ctx, "news_manager", None)
         if news_manager is not None:
@@ -71,9 +73,9 @@ class InfoWindowBinder:
                 except Exception:
                     logger.exception("InfoWindowBinder failed to render cached epic data")
 
-            # 每次打开 InfoWindow 都刷新一次（缓存仅用于秒开占位展示）。
+            # 缓存未过期时不再请求；过期或没有缓存时刷新
             try:
-                epic_manager.fetch_free_games()
+                epic_manager.refresh_if_stale()
             except Exception:
                 logger.exception("InfoWindowBinder failed to fetch epic free games")
 
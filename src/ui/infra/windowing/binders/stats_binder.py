@@ -22,6 +22,11 @@ class StatsWindowBinder:
         ctx.steam_manager.on_player_summary.connect(update_window_data)
         ctx.steam_manager.on_games_stats.connect(update_window_data)
 
+        on_circuit_state = getattr(ctx.steam_manager, "on_circuit_state", None)
+        if on_circuit_state is not None:
+            on_circuit_state.connect(view.update_network_status)
+            view.update_network_status(ctx.steam_manager.get_circuit_states())
+
         view.request_refresh.connect(ctx.steam_manager.fetch_player_summary)
         view.request_refresh.connect(ctx.steam_manager.fetch_games_stats)
 
@@ -27,7 +27,9 @@ class AchievementWindow(BaseGameListWindow):
 
     def on_data_updated(self, **kwargs):
         self.current_achievements = kwargs.get("achievements", {})
-        # 数据更新时恢复按钮状态
+
+    def on_progress_finished(self, task_type):
+        # 批次全部返回后恢复按钮状态（数据会分批到达，不能在第一批到达时就恢复）
         self._restore_refetch_button()
 
     def on_tabs_refresh_start(self):
@@ -102,9 +104,9 @@ class AchievementWindow(BaseGameListWindow):
             item_percent.setText(percent_str)
             table.setItem(row, 4, item_percent)
 
-        stats_label = tab_info["stats_label"]
-        stats_label.setText(
-            f"共 {len(games)} 款游戏 | 已统计 {games_with_achievements} 款 | 总解锁成就: {unlocked_achievements}/{total_achievements}"
+        self.set_stats_text(
+            tab_info,
+            f"共 {len(games)} 款游戏 | 已统计 {games_with_achievements} 款 | 总解锁成就: {unlocked_achievements}/{total_achievements}",
         )
 
     def _fetch_achievements_impl(self, force_refetch=False, show_button_feedback=False):
@@ -144,23 +146,17 @@ class AchievementWindow(BaseGameListWindow):
                 QMessageBox.information(self, "提示", "当前列表成就数据已获取。")
                 return
 
-        total = len(to_fetch_all)
-        limit = 50
-        batches = (total + limit - 1) // limit
-
-        # 更新UI状态
+        # 更新UI状态：进度随后台回传的 partial 结果更新
         operation_text = "重新获取" if force_refetch else "获取"
-        tab_info["stats_label"].setText(f"将分 {batches} 批{operation_text}成就（每批≤{limit}），共 {total} 款，请稍候…")
+        self.begin_progress(tab_info, "achievements", f"{operation_text}成就", len(to_fetch_all))
 
         # 按钮状态管理（仅在强制刷新时）
         if show_button_feedback and force_refetch:
             self.refetch_all_btn.setEnabled(False)
             self.refetch_all_btn.setText("重新获取中...")
 
-        # 分批发送请求
-        for i in range(0, total, limit):
-            chunk = to_fetch_all[i : i + limit]
-            self.request_fetch_achievements.emit(chunk)
+        # 只提交一个任务：后台按并发度拉取，完成的条目攒批回传
+        self.request_fetch_achievements.emit(to_fetch_all)
 
         # 超时恢复（仅在强制刷新时）
         if show_button_feedback and force_refetch:
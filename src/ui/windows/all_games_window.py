@@ -6,6 +6,7 @@ from src.ui.windows.base_game_list_window import BaseGameListWindow
 
 class AllGamesWindow(BaseGameListWindow):
     request_fetch_prices = pyqtSignal(list)
+    request_refresh_prices = pyqtSignal(list)  # 当前标签页全部 appid，由上层筛出过期部分
 
     def __init__(self, parent=None):
         super().__init__("所有游戏统计", parent)
@@ -15,6 +16,11 @@ class AllGamesWindow(BaseGameListWindow):
         self.calc_price_btn = QPushButton("获取当前标签页未获取的游戏价格")
         self.calc_price_btn.clicked.connect(self.calculate_prices)
         self.toolbar_layout.addWidget(self.calc_price_btn)
+
+        self.refresh_price_btn = QPushButton("刷新过期价格")
+        self.refresh_price_btn.setToolTip("仅重新获取当前标签页中缺失或已过期的价格（打折价格过期更快）")
+        self.refresh_price_btn.clicked.connect(self.refresh_prices)
+        self.toolbar_layout.addWidget(self.refresh_price_btn)
         self.toolbar_layout.addStretch()
 
         self.update_data([])
@@ -24,10 +30,12 @@ class AllGamesWindow(BaseGameListWindow):
 
     def on_tabs_refresh_start(self):
         self.calc_price_btn.setEnabled(True)
+        self.refresh_price_btn.setEnabled(True)
 
     def show_empty_state(self):
         super().show_empty_state()
         self.calc_price_btn.setEnabled(False)
+        self.refresh_price_btn.setEnabled(False)
 
     def setup_table(self, table):
         table.setColumnCount(4)
@@ -86,9 +94,9 @@ class AllGamesWindow(BaseGameListWindow):
                 item_price.setData(Qt.ItemDataRole.UserRole, price_val)
             table.setItem(row, 3, item_price)
 
-        stats_label = tab_info["stats_label"]
-        stats_label.setText(
-            f"共 {len(games)} 款游戏 | 总时长: {int(total_playtime/60)} 小时 | 已统计 {price_count} 款游戏价值: ¥{total_price:.2f}"
+        self.set_stats_text(
+            tab_info,
+            f"共 {len(games)} 款游戏 | 总时长: {int(total_playtime/60)} 小时 | 已统计 {price_count} 款游戏价值: ¥{total_price:.2f}",
         )
 
     def calculate_prices(self):
@@ -104,25 +112,41 @@ class AllGamesWindow(BaseGameListWindow):
             return
 
         prices = self.current_prices
-        to_fetch_all = []
-        limit = 50
-        for game in games:
-            appid = game.get("appid")
-            if str(appid) not in prices:
-                to_fetch_all.append(appid)
+        to_fetch_all = [game.get("appid") for game in games if str(game.get("appid")) not in prices]
 
         if to_fetch_all:
-            total = len(to_fetch_all)
-            batches = (total + limit - 1) // limit
-            tab_info["stats_label"].setText(f"将分 {batches} 批获取价格（每批≤{limit}），共 {total} 款，请稍候…")
-
-            # 单次点击：自动分批把所有 appid 发送出去（每批≤50）
-            for i in range(0, total, limit):
-                chunk = to_fetch_all[i : i + limit]
-                self.request_fetch_prices.emit(chunk)
+            # 单次点击只提交一个任务：后台分块请求，每完成一块回传价格与进度
+            self.begin_progress(tab_info, "store_prices", "获取价格", len(to_fetch_all))
+            self.request_fetch_prices.emit(to_fetch_all)
         else:
             tab_info["stats_label"].setText("所有游戏价格已获取或已达到本标签页的限制。")
 
+    def refresh_prices(self):
+        tab_info = self._current_tab_info()
+        if tab_info is None:
+            return
+        data = tab_info["entry"].get("data") or {}
+        appids = [game.get("appid") for game in data.get("all_games", []) if game.get("appid")]
+        if not appids:
+            tab_info["stats_label"].setText("当前标签页没有可统计的游戏。")
+            return
+        self.request_refresh_prices.emit(appids)
+
+    def on_price_refresh_planned(self, stale_count, total):
+        tab_info = self._current_tab_info()
+        if tab_info is None:
+            return
+        if stale_count:
+            self.begin_progress(tab_info, "store_prices", f"刷新 {total} 款中缺失或过期的价格", stale_count)
+        else:
+            tab_info["stats_label"].setText("当前标签页的价格均在有效期内，无需刷新。")
+
+    def _current_tab_info(self):
+        index = self.tabs.currentIndex()
+        if index < 0 or index >= len(self.dataset_tabs):
+            return None
+        return self.dataset_tabs[index]
+
 
 __all__ = ["AllGamesWindow"]
 
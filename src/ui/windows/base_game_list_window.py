@@ -1,4 +1,4 @@
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtWidgets import (
     QDialog,
     QHBoxLayout,
@@ -18,6 +18,9 @@ class BaseGameListWindow(QDialog):
     游戏列表窗口基类：提供基于 Tab 的多账号游戏列表展示功能。
     """
 
+    # 窗口关闭（含 Esc/取消）：Binder 据此取消该窗口触发的在途请求
+    window_closed = pyqtSignal()
+
     def __init__(self, title="游戏列表", parent=None):
         super().__init__(parent)
         self.setWindowTitle(title)
@@ -25,6 +28,8 @@ class BaseGameListWindow(QDialog):
 
         self.dataset_tabs = []
         self.current_datasets = []
+        # 进行中的长任务进度：{"type", "label"(所属标签页), "verb", "text"}；无任务时为 None
+        self._progress = None
 
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
@@ -36,6 +41,60 @@ class BaseGameListWindow(QDialog):
         self.toolbar_layout = QHBoxLayout()
         self.layout.addLayout(self.toolbar_layout)
 
+    def done(self, result):
+        """QDialog 的关闭/accept/reject 都经由 done。"""
+        super().done(result)
+        # 关闭后在途任务会被取消，进度不再更新
+        self._progress = None
+        self.window_closed.emit()
+
+    def set_stats_text(self, tab_info, text):
+        """设置标签页统计文字；该标签页有进行中的任务时在末尾附上进度。"""
+        tab_info["stats_text"] = text
+        progress = self._progress
+        if progress is not None and progress["label"] == tab_info["entry"].get("label"):
+            text = f"{text} | {progress['text']}"
+        tab_info["stats_label"].setText(text)
+
+    def begin_progress(self, tab_info, task_type, verb, total):
+        """记录当前标签页发起的长任务；之后由 on_task_progress 按任务类型更新进度。"""
+        self._progress = {
+            "type": task_type,
+            "label": tab_info["entry"].get("label"),
+            "verb": verb,
+            "text": f"正在{verb}：0/{total}",
+        }
+        self.set_stats_text(tab_info, tab_info.get("stats_text", ""))
+
+    def on_task_progress(self, progress):
+        """
+        接收任务进度 {"type", "done", "total", "eta", "resumed"?, ...}：
+        更新发起任务的标签页；全部完成时移除进度并调用 on_progress_finished。
+        """
+        state = self._progress
+        if state is None or progress.get("type") != state["type"]:
+            return
+        done = progress.get("done", 0)
+        total = progress.get("total", 0)
+        finished = done >= total
+        if finished:
+            self._progress = None
+        else:
+            resumed = progress.get("resumed") or 0
+            # 从断点续传的作业：进度包含上次已完成的条目，如“已续传 1,240/3,000”
+            prefix = f"已续传 {resumed:,} 条，" if resumed else ""
+            state["text"] = f"{prefix}正在{state['verb']}：{done:,}/{total:,}{_format_eta(progress.get('eta'))}"
+
+        for tab_info in self.dataset_tabs:
+            if tab_info["entry"].get("label") == state["label"]:
+                self.set_stats_text(tab_info, tab_info.get("stats_text", ""))
+        if finished:
+            self.on_progress_finished(state["type"])
+
+    def on_progress_finished(self, task_type):
+        """长任务全部完成的钩子"""
+        pass
+
     def update_data(self, datasets, **kwargs):
         """更新数据并刷新显示"""
         self.current_datasets = datasets
@@ -105,6 +164,15 @@ class BaseGameListWindow(QDialog):
         raise NotImplementedError
 
 
+def _format_eta(seconds):
+    if seconds is None:
+        return ""
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"，预计剩余 {seconds} 秒"
+    return f"，预计剩余 {(seconds + 59) // 60} 分钟"
+
+
 __all__ = ["BaseGameListWindow"]
 
 
@@ -204,6 +204,7 @@ class EpicSectionHeaderWidget(QWidget):
 class InfoWindow(QWidget):
     request_refresh = pyqtSignal()
     request_news_refresh = pyqtSignal(bool)
+    window_closed = pyqtSignal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -228,6 +229,13 @@ class InfoWindow(QWidget):
         self.update_data([])
         self.update_epic_free_games_data([])
 
+    def closeEvent(self, event):
+        # 关闭后愿望单请求会被取消：复位刷新按钮，下次打开可直接重试
+        self.refresh_btn.setEnabled(True)
+        self.refresh_btn.setText("刷新数据")
+        self.window_closed.emit()
+        super().closeEvent(event)
+
     def _build_discount_tab(self) -> QWidget:
         tab = QWidget()
         layout = QVBoxLayout()
@@ -25,6 +25,12 @@ class StatsWindow(QWidget):
 
         layout = QVBoxLayout()
 
+        self.lbl_network = QLabel("")
+        self.lbl_network.setWordWrap(True)
+        self.lbl_network.setStyleSheet("color: #c0392b;")
+        self.lbl_network.hide()
+        layout.addWidget(self.lbl_network)
+
         self.tabs = QTabWidget()
         layout.addWidget(self.tabs)
 
@@ -53,6 +59,20 @@ class StatsWindow(QWidget):
         QTimer.singleShot(3000, lambda: self.btn_refresh.setEnabled(True))
         QTimer.singleShot(3000, lambda: self.btn_refresh.setText("刷新数据"))
 
+    def update_network_status(self, states):
+        """
+        显示 Steam 各 host 的熔断状态
+        @param states: {host: "closed" | "open" | "half_open"}
+        """
+        labels = {"open": "暂不可用", "half_open": "恢复探测中"}
+        degraded = [f"{host}（{labels[state]}）" for host, state in sorted((states or {}).items()) if state in labels]
+        if degraded:
+            self.lbl_network.setText("Steam 服务连接异常：" + "、".join(degraded) + "，数据可能不是最新。")
+            self.lbl_network.show()
+        else:
+            self.lbl_network.clear()
+            self.lbl_network.hide()
+
     def update_data(self, datasets, fallback_summary, config):
         """
         更新 UI 数据
@@ -0,0 +1,72 @@
+import os
+import sys
+import tempfile
+import unittest
+
+# Ensure repo root is in path so `import src.*` works
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from src.feature_core.services.steam.app_catalog_service import SteamAppCatalogService
+from src.storage.app_catalog_repository import AppCatalogRepository
+
+
+class TestAppCatalog(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.catalog = AppCatalogRepository(os.path.join(self._tmp.name, "app_catalog"))
+        self.service = SteamAppCatalogService(self.catalog)
+        self.since_calls = []
+
+    def tearDown(self) -> None:
+        self.catalog.close()
+        self._tmp.cleanup()
+
+    def _pages(self, if_modified_since=None):
+        self.since_calls.append(if_modified_since)
+        if if_modified_since is None:
+            yield [{"appid": 730, "name": "Counter-Strike 2", "last_modified": 100}]
+            yield [{"appid": 10, "name": "Counter-Strike", "last_modified": 50}, {"appid": 570, "name": "Dota 2", "last_modified": 80}]
+        else:
+            yield [{"appid": 570, "name": "Dota 2 (Updated)", "last_modified": 200}]
+
+    def test_full_then_incremental_sync(self):
+        self.assertTrue(self.service.needs_sync())
+
+        first = self.service.sync(self._pages)
+        self.assertEqual(first["mode"], "full")
+        self.assertEqual(len(self.catalog), 3)
+        self.assertEqual(self.catalog.lookup(730), "Counter-Strike 2")
+        self.assertIsNone(self.catalog.lookup(999))
+        self.assertFalse(self.service.needs_sync())
+
+        second = self.service.sync(self._pages)
+        self.assertEqual(second["mode"], "incremental")
+        self.assertEqual(self.since_calls, [None, 100])
+        self.assertEqual(self.service.resolve_names([570, 10, 1]), {"570": "Dota 2 (Updated)", "10": "Counter-Strike"})
+
+    def test_prefix_search_is_case_insensitive(self):
+        self.service.sync(self._pages)
+        names = [name for _, name in self.catalog.search_prefix("counter")]
+        self.assertEqual(names, ["Counter-Strike", "Counter-Strike 2"])
+
+    def test_failed_sync_keeps_previous_catalog(self):
+        self.service.sync(self._pages)
+
+        def broken(if_modified_since=None):
+            yield [{"appid": 1, "name": "x", "last_modified": 1}]
+            raise RuntimeError("network down")
+
+        self.catalog.save_meta({})  # 强制走全量分支
+        with self.assertRaises(RuntimeError):
+            self.service.sync(broken)
+        self.assertEqual(len(self.catalog), 3)
+        self.assertEqual(
+            sorted(os.listdir(self._tmp.name)),
+            ["app_catalog.idx", "app_catalog.meta.json", "app_catalog.nameidx", "app_catalog.names"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
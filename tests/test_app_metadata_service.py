@@ -0,0 +1,99 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+# Ensure repo root is in path so `import src.*` works
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from src.feature_core.services.steam.app_metadata_service import SteamAppMetadataService
+from src.storage.app_metadata_repository import AppMetadataRepository
+
+
+class _MemoryStore:
+    def __init__(self):
+        self.saves = []
+
+    def load(self):
+        return {}
+
+    def save(self, entries):
+        self.saves.append(dict(entries))
+
+
+class TestSteamAppMetadataService(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = [1000.0]
+        self.store = _MemoryStore()
+        self.fetched = []
+        self.service = SteamAppMetadataService(
+            self.store, ttl_seconds=100, missing_ttl_seconds=10, save_interval_seconds=5, clock=lambda: self.now[0]
+        )
+
+    def _fetch(self, appids):
+        self.fetched.append(list(appids))
+        return {aid: ({"name": f"App-{aid}"} if aid != "404" else None) for aid in appids}
+
+    def test_get_many_only_fetches_misses(self):
+        self.assertEqual(self.service.get_many([1, 2], self._fetch)["1"]["name"], "App-1")
+        result = self.service.get_many([1, 2, 3, 3], self._fetch)
+        self.assertEqual(self.fetched, [["1", "2"], ["3"]])
+        self.assertEqual(sorted(result), ["1", "2", "3"])
+
+    def test_entries_expire_after_ttl(self):
+        self.service.get_many([1], self._fetch)
+        self.now[0] += 99
+        self.assertEqual(self.service.missing([1]), [])
+        self.now[0] += 1
+        self.assertEqual(self.service.missing([1]), ["1"])
+        self.assertIsNone(self.service.get(1))
+
+    def test_missing_entries_are_negatively_cached(self):
+        self.assertEqual(self.service.get_many([404], self._fetch), {})
+        self.assertEqual(self.service.get_many([404], self._fetch), {})
+        self.assertEqual(self.fetched, [["404"]])
+
+        # 负缓存的有效期更短，到期后重新尝试
+        self.now[0] += 10
+        self.service.get_many([404], self._fetch)
+        self.assertEqual(self.fetched, [["404"], ["404"]])
+
+    def test_failed_fetch_is_not_cached(self):
+        self.service.get_many([1], lambda ids: {})
+        self.assertEqual(self.service.missing([1]), ["1"])
+
+    def test_saves_are_throttled_and_flushed(self):
+        self.service.get_many([1], self._fetch)
+        self.service.get_many([2], self._fetch)
+        self.assertEqual([sorted(s) for s in self.store.saves], [["1"]])
+
+        self.service.flush()
+        self.assertEqual(sorted(self.store.saves[-1]), ["1", "2"])
+        self.service.flush()
+        self.assertEqual(len(self.store.saves), 2)
+
+
+class TestAppMetadataRepository(unittest.TestCase):
+    def test_concurrent_saves_leave_valid_json(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "app_metadata.json")
+            repo = AppMetadataRepository(path)
+            entries = {str(i): {"name": "x" * 200, "fetched_at": 1.0} for i in range(500)}
+
+            threads = [threading.Thread(target=repo.save, args=(dict(entries),)) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(json.load(f), entries)
+            self.assertEqual(os.listdir(tmp), ["app_metadata.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import asyncio
+import gzip
+import os
+import sys
+import unittest
+
+import requests
+
+# Ensure repo root is in path so `import src.*` works
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from src.feature_core.adapters.http.async_http import AsyncHttpClient
+from src.feature_core.adapters.http.resilience import CircuitBreakerRegistry, ResilientCaller
+
+
+async def _serve(reader, writer):
+    # 极简 keep-alive 服务端：/gzip 返回压缩 JSON，/chunked 分块返回，/redirect/N 跳转 N 次，其余回显路径
+    while True:
+        request_line = await reader.readline()
+        if not request_line:
+            break
+        while (await reader.readline()) not in (b"\r\n", b""):
+            pass
+        path = request_line.split(b" ")[1].decode()
+        if path.startswith("/gzip"):
+            body = gzip.compress(b'{"ok": true}')
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Encoding: gzip\r\nContent-Length: %d\r\n\r\n" % len(body) + body)
+        elif path.startswith("/redirect/"):
+            hops = int(path.split("?")[0].split("/")[2])
+            location = f"/redirect/{hops - 1}" if hops > 1 else "/landed?from=redirect"
+            writer.write(b"HTTP/1.1 302 Found\r\nLocation: %s\r\nContent-Length: 0\r\n\r\n" % location.encode())
+        elif path.startswith("/chunked"):
+            writer.write(b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n5\r\nhello\r\n6\r\n world\r\n0\r\n\r\n")
+        else:
+            body = path.encode()
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n" % len(body) + body)
+        await writer.drain()
+    writer.close()
+
+
+class TestAsyncHttpClient(unittest.TestCase):
+    def test_keep_alive_chunked_and_gzip(self):
+        async def scenario():
+            server = await asyncio.start_server(_serve, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            client = AsyncHttpClient(max_connections_per_host=2)
+            try:
+                base = f"http://127.0.0.1:{port}"
+                plain = await client.get(f"{base}/echo", params={"a": 1, "flag": True})
+                chunked = await client.get(f"{base}/chunked")
+                packed = await client.get(f"{base}/gzip")
+                many = await asyncio.gather(*(client.get(f"{base}/n{i}") for i in range(10)))
+                return plain, chunked, packed, many, client.stats()
+            finally:
+                await client.close()
+                server.close()
+                await server.wait_closed()
+
+        plain, chunked, packed, many, stats = asyncio.run(scenario())
+        self.assertEqual(plain.text, "/echo?a=1&flag=true")
+        self.assertEqual(chunked.text, "hello world")
+        self.assertEqual(packed.json(), {"ok": True})
+        self.assertEqual([r.text for r in many], [f"/n{i}" for i in range(10)])
+        # 13 个请求最多只建立 2 条连接（每 host 上限）
+        self.assertEqual(stats["requests"], 13)
+        self.assertLessEqual(stats["new_connections"], 2)
+
+    def test_redirects_are_followed_up_to_a_limit(self):
+        async def scenario():
+            server = await asyncio.start_server(_serve, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            client = AsyncHttpClient(max_redirects=3)
+            try:
+                base = f"http://127.0.0.1:{port}"
+                followed = await client.get(f"{base}/redirect/3", params={"a": 1})
+                try:
+                    await client.get(f"{base}/redirect/4")
+                except requests.exceptions.TooManyRedirects as e:
+                    return followed, e
+                return followed, None
+            finally:
+                await client.close()
+                server.close()
+                await server.wait_closed()
+
+        followed, error = asyncio.run(scenario())
+        self.assertEqual(followed.status_code, 200)
+        self.assertEqual(followed.text, "/landed?from=redirect")
+        self.assertTrue(followed.url.endswith("/landed?from=redirect"))
+        self.assertIsInstance(error, requests.exceptions.TooManyRedirects)
+
+    def test_connection_refused_is_retried_as_connection_error(self):
+        async def scenario():
+            server = await asyncio.start_server(_serve, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            server.close()
+            await server.wait_closed()
+
+            attempts = []
+            caller = ResilientCaller(CircuitBreakerRegistry(failure_threshold=10))
+            client = AsyncHttpClient()
+            url = f"http://127.0.0.1:{port}/x"
+
+            async def send():
+                attempts.append(1)
+                return await client.get(url, timeout=2)
+
+            try:
+                await caller.acall("GET", url, send)
+            except requests.exceptions.ConnectionError as e:
+                return len(attempts), e
+            finally:
+                await client.close()
+            return len(attempts), None
+
+        attempts, error = asyncio.run(scenario())
+        self.assertIsInstance(error, requests.exceptions.ConnectionError)
+        self.assertEqual(attempts, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+# Ensure repo root is in path so `import src.*` works
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from src.feature_core.app.background_executor import BackgroundExecutor
+
+
+class TestBackgroundExecutor(unittest.TestCase):
+    def test_lane_limit_bounds_concurrency_and_reports_stats(self):
+        executor = BackgroundExecutor({"llm": 2})
+        release = threading.Event()
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def job(i):
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            release.wait(2.0)
+            with lock:
+                state["running"] -= 1
+            return i
+
+        futures = [executor.submit("llm", job, i) for i in range(5)]
+        deadline = time.monotonic() + 2.0
+        while executor.stats()["llm"]["active"] < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        stats = executor.stats()["llm"]
+        self.assertEqual((stats["active"], stats["queued"], stats["threads"]), (2, 3, 2))
+
+        release.set()
+        self.assertEqual([f.result(timeout=2.0) for f in futures], [0, 1, 2, 3, 4])
+        self.assertEqual(state["peak"], 2)
+        executor.shutdown()
+        self.assertEqual(executor.stats()["llm"]["completed"], 5)
+
+    def test_failures_are_recorded_on_future(self):
+        executor = BackgroundExecutor()
+        future = executor.submit("cpu", lambda: 1 / 0, name="boom")
+        with self.assertRaises(ZeroDivisionError):
+            future.result(timeout=2.0)
+        executor.shutdown()
+        self.assertEqual(executor.stats()["cpu"]["failed"], 1)
+
+    def test_shutdown_cancels_queued_and_rejects_new_tasks(self):
+        executor = BackgroundExecutor({"disk": 1})
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocker():
+            started.set()
+            release.wait(2.0)
+
+        running = executor.submit("disk", blocker)
+        queued = executor.submit("disk", lambda: None)
+        self.assertTrue(started.wait(2.0))
+
+        threading.Timer(0.05, release.set).start()
+        executor.shutdown(timeout=2.0)
+
+        self.assertTrue(running.done())
+        self.assertTrue(queued.cancelled())
+        self.assertIsNone(executor.submit("disk", lambda: None))
+        self.assertEqual(executor.stats()["disk"]["cancelled"], 1)
+        with self.assertRaises(KeyError):
+            BackgroundExecutor().submit("gpu", lambda: None)
+
+
+if __name__ == "__main__":
+    unittest.main()
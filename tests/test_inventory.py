@@ -0,0 +1,93 @@
+import os
+import sys
+import unittest
+
+# Ensure repo root is in path so `import src.*` works
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from src.feature_core.adapters.http.rate_limiter import RateLimiterRegistry
+from src.feature_core.adapters.http.resilience import CircuitBreakerRegistry
+from src.feature_core.adapters.http.steam_client import SteamClient
+from src.feature_core.services.steam.inventory_service import InventoryTally, SteamInventoryService
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.status_code = 200
+        self.headers = {}
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        pass
+
+
+class FakePool:
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(dict(kwargs.get("params") or {}))
+        return FakeResponse(self.pages.pop(0))
+
+
+PAGES = [
+    {
+        "assets": [
+            {"assetid": "1", "classid": "10", "instanceid": "0", "amount": "1"},
+            {"assetid": "2", "classid": "11", "instanceid": "0", "amount": "3"},
+        ],
+        "descriptions": [
+            {"classid": "10", "instanceid": "0", "type": "隐秘 步枪"},
+            {"classid": "11", "instanceid": "0", "type": "普通级 涂鸦"},
+        ],
+        "more_items": 1,
+        "last_assetid": "2",
+        "total_inventory_count": 3,
+    },
+    {
+        "assets": [{"assetid": "3", "classid": "10", "instanceid": "0", "amount": "1"}],
+        "descriptions": [{"classid": "10", "instanceid": "0", "type": "隐秘 步枪"}],
+        "total_inventory_count": 3,
+    },
+]
+
+
+class TestInventoryPagination(unittest.TestCase):
+    def test_follows_last_assetid_and_tallies_by_type(self):
+        pool = FakePool(PAGES)
+        client = SteamClient(
+            "key",
+            session_pool=pool,
+            rate_limiter=RateLimiterRegistry({"community": {"rate": 100, "burst": 100}}),
+            circuit_breakers=CircuitBreakerRegistry(),
+        )
+        tally = InventoryTally()
+        for page in client.iter_inventory_pages("7656", 730, 2):
+            tally.add_page(page)
+
+        self.assertEqual([c.get("start_assetid") for c in pool.calls], [None, "2"])
+        summary = tally.summary(730, 2)
+        self.assertEqual(summary["total_assets"], 3)
+        self.assertEqual(summary["total_items"], 5)
+        self.assertEqual(summary["pages"], 2)
+        self.assertEqual(summary["by_type"], {"普通级 涂鸦": 3, "隐秘 步枪": 2})
+
+    def test_cached_summary_expires(self):
+        now = [1000.0]
+        service = SteamInventoryService(ttl_seconds=60, clock=lambda: now[0])
+        cache = {}
+        service.apply_inventory(cache, "7656", {"appid": "730", "contextid": "2", "total_items": 5})
+        record = service.get_cached(cache, "7656", 730, 2)
+        self.assertTrue(service.is_fresh(record))
+        now[0] += 61
+        self.assertFalse(service.is_fresh(record))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import json
+import os
+import sys
+import unittest
+
+# Ensure repo root is in path so `import src.*` works
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from src.feature_core.services.steam.job_journal import JobJournal
+
+
+class TestJobJournal(unittest.TestCase):
+    def test_restart_resumes_and_skips_completed_appids(self):
+        state = {}
+        journal = JobJournal(state)
+        job = journal.begin("achievements", "A", [1, 2, 3, 3, 4])
+        self.assertEqual((job["job_id"], job["pending"], job["total"]), ("achievements:A", [1, 2, 3, 4], 4))
+
+        self.assertEqual(journal.record(job["job_id"], ["1", "3", "99"]), 2)
+
+        # 状态随缓存以 JSON 落盘；重启后续传只剩未完成的 appid
+        restored = JobJournal(json.loads(json.dumps(state)))
+        [unfinished] = restored.unfinished()
+        self.assertEqual((unfinished["done"], unfinished["total"]), (2, 4))
+        resumed = restored.resume("achievements:A")
+        self.assertEqual((resumed["pending"], resumed["resumed"]), ([2, 4], 2))
+
+        restored.finish("achievements:A")
+        self.assertEqual(restored.unfinished(), [])
+
+    def test_begin_carries_over_only_requested_done_appids(self):
+        journal = JobJournal()
+        job_id = journal.begin("store_prices", "A", [1, 2, 3])["job_id"]
+        journal.record(job_id, [1, 2])
+
+        job = journal.begin("store_prices", "A", [2, 3, 5])
+        self.assertEqual((job["pending"], job["resumed"], job["total"]), ([3, 5], 1, 3))
+        self.assertEqual(journal.begin("store_prices", "B", [1])["resumed"], 0)
+
+    def test_extend_adds_only_new_appids_and_keeps_pending_work(self):
+        journal = JobJournal()
+        job_id = journal.begin("store_prices", "A", [1, 2, 3])["job_id"]
+        journal.record(job_id, [1])
+
+        self.assertEqual(journal.extend(job_id, [2, 4, 4, 5]), [4, 5])
+        self.assertEqual(journal.extend(job_id, [1, 5]), [])
+        self.assertEqual(journal.pending(job_id), [2, 3, 4, 5])
+        self.assertEqual(journal.extend("store_prices:B", [1]), [])
+
+    def test_resume_gives_up_after_limit(self):
+        journal = JobJournal(max_resumes=2)
+        job_id = journal.begin("achievements", "A", [1])["job_id"]
+        self.assertIsNotNone(journal.resume(job_id))
+        self.assertIsNotNone(journal.resume(job_id))
+        self.assertIsNone(journal.resume(job_id))
+        self.assertIsNone(journal.get(job_id))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import json
+import os
+import sys
+import unittest
+
+# Ensure repo root is in path so `import src.*` works
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from src.feature_core.services.steam.games_payload_service import build_games_payload
+from src.feature_core.services.steam.payload_projection import (
+    project_cache,
+    project_owned_games,
+    project_store_prices,
+)
+
+
+RAW_GAME = {
+    "appid": 730,
+    "name": "Counter-Strike 2",
+    "playtime_forever": 1200,
+    "playtime_2weeks": 60,
+    "rtime_last_played": 1700000000,
+    "img_icon_url": "8dbc71957312bbd3baea65848b545be9eae2a355",
+    "has_community_visible_stats": True,
+    "playtime_windows_forever": 1200,
+    "playtime_mac_forever": 0,
+    "playtime_linux_forever": 0,
+    "playtime_deck_forever": 0,
+    "content_descriptorids": [2, 5],
+}
+
+
+class TestPayloadProjection(unittest.TestCase):
+    def test_owned_games_keep_only_read_fields(self):
+        slim = project_owned_games({"game_count": 1, "games": [RAW_GAME]})
+        self.assertEqual(
+            slim["games"][0],
+            {"appid": 730, "name": "Counter-Strike 2", "playtime_forever": 1200, "playtime_2weeks": 60, "rtime_last_played": 1700000000},
+        )
+        self.assertEqual(slim["game_count"], 1)
+        self.assertIn("img_icon_url", RAW_GAME)  # 入参未被修改
+
+    def test_store_prices_keep_price_overview_subset(self):
+        raw = {
+            "730": {
+                "success": True,
+                "data": {
+                    "price_overview": {
+                        "currency": "CNY",
+                        "initial": 4800,
+                        "final": 2400,
+                        "discount_percent": 50,
+                        "initial_formatted": "¥ 48.00",
+                        "final_formatted": "¥ 24.00",
+                    }
+                },
+            },
+            "1": {"success": False},
+        }
+        slim = project_store_prices(raw)
+        self.assertEqual(
+            slim["730"]["data"]["price_overview"],
+            {"final": 2400, "discount_percent": 50, "final_formatted": "¥ 24.00"},
+        )
+        self.assertEqual(slim["1"], {"success": False})
+
+    def test_project_cache_shrinks_legacy_cache(self):
+        payload = build_games_payload([dict(RAW_GAME)], 1)
+        cache = {
+            "summary": {"steamid": "1", "personaname": "a", "avatarfull": "https://x", "profileurl": "https://y", "steam_level": 5},
+            "games": payload,
+            "games_accounts": {"1": {"games": payload, "summary": None}},
+        }
+        before = len(json.dumps(cache))
+        self.assertTrue(project_cache(cache))
+        self.assertLess(len(json.dumps(cache)), before)
+        self.assertEqual(cache["summary"], {"steamid": "1", "personaname": "a", "steam_level": 5})
+        self.assertNotIn("img_icon_url", cache["games_accounts"]["1"]["games"]["recent_game"])
+        self.assertFalse(project_cache(cache))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import sys
+import unittest
+
+# Ensure repo root is in path so `import src.*` works
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from src.feature_core.adapters.http.rate_limiter import RateLimiterRegistry, TokenBucket, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_paced(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, burst=3, clock=clock)
+
+        for _ in range(3):
+            self.assertEqual(bucket.try_acquire(), 0.0)
+        self.assertAlmostEqual(bucket.try_acquire(), 0.5)
+
+        waited = bucket.acquire(sleep=clock.sleep)
+        self.assertAlmostEqual(waited, 0.5)
+
+    def test_throttle_blocks_and_halves_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=4.0, burst=4, clock=clock)
+
+        bucket.throttle(retry_after=10)
+        self.assertAlmostEqual(bucket.try_acquire(), 10.0)
+        self.assertAlmostEqual(bucket.rate, 2.0)
+
+        clock.now += 10
+        # 冷却结束后令牌从 0 开始按降低后的速率补充
+        self.assertAlmostEqual(bucket.try_acquire(), 0.5)
+
+        for _ in range(100):
+            bucket.on_success()
+        self.assertAlmostEqual(bucket.rate, 4.0)
+
+
+class TestRateLimiterRegistry(unittest.TestCase):
+    def test_families_are_independent_and_configurable(self):
+        registry = RateLimiterRegistry({"store_appdetails": {"rate": 1, "burst": 1}})
+        store = registry.bucket("store_appdetails")
+        webapi = registry.bucket("webapi")
+        self.assertIsNot(store, webapi)
+        self.assertAlmostEqual(store.rate, 1.0)
+
+        registry.configure({"store_appdetails": {"rate": 3}})
+        self.assertAlmostEqual(registry.bucket("store_appdetails").rate, 3.0)
+
+    def test_observe_429_uses_retry_after(self):
+        registry = RateLimiterRegistry({"community": {"rate": 1, "burst": 5, "penalty": 60}})
+        registry.observe("community", FakeResponse(429, {"Retry-After": "7"}))
+        delay = registry.bucket("community").try_acquire()
+        self.assertGreater(delay, 6.0)
+        self.assertLessEqual(delay, 7.0)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after({"Retry-After": "12"}), 12.0)
+        self.assertIsNone(parse_retry_after({}))
+        self.assertIsNone(parse_retry_after({"Retry-After": "soon"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import sys
+import unittest
+
+# Ensure repo root is in path so `import src.*` works
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from src.feature_core.services.refresh_scheduler import RefreshScheduler
+
+
+class TestRefreshScheduler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = [1000.0]
+        self.state = {}
+        self.scheduler = RefreshScheduler(self.state, ttls={"summary": 60, "games": 100}, clock=lambda: self.now[0])
+
+    def test_stale_until_marked_then_expires_after_ttl(self):
+        self.assertTrue(self.scheduler.is_stale("summary"))
+        self.scheduler.mark_success("summary")
+        self.assertFalse(self.scheduler.is_stale("summary"))
+
+        self.now[0] += 59
+        self.assertFalse(self.scheduler.is_stale("summary"))
+        self.now[0] += 1
+        self.assertTrue(self.scheduler.is_stale("summary"))
+
+    def test_per_key_records_and_state_survives_restart(self):
+        self.scheduler.mark_success("games", "A")
+        self.assertEqual(self.scheduler.stale_keys("games", ["A", "B"]), ["B"])
+
+        # 状态 dict 随缓存落盘：用同一份状态重建后依然有效
+        restored = RefreshScheduler(dict(self.state), ttls={"games": 100}, clock=lambda: self.now[0] + 10)
+        self.assertFalse(restored.is_stale("games", "A"))
+
+        self.scheduler.mark_success("games", "B")
+        self.scheduler.invalidate("games")
+        self.assertEqual(self.scheduler.stale_keys("games", ["A", "B"]), ["A", "B"])
+
+    def test_unknown_kind_bad_timestamp_and_invalid_ttl(self):
+        self.state["epic"] = "not-a-number"
+        self.assertTrue(self.scheduler.is_stale("epic"))
+        self.scheduler.mark_success("custom")
+        self.assertTrue(self.scheduler.is_stale("custom"))
+
+        self.scheduler.configure({"custom": "oops", "news": "30"})
+        self.assertEqual(self.scheduler.ttl("news"), 30.0)
+        self.assertTrue(self.scheduler.is_stale("custom"))
+
+
+if __name__ == "__main__":
+    unittest.main()
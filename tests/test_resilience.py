@@ -0,0 +1,87 @@
+import os
+import sys
+import unittest
+
+import requests
+
+# Ensure repo root is in path so `import src.*` works
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from src.feature_core.adapters.http.resilience import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    ResilientCaller,
+    RetryPolicy,
+)
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_open_half_open_closed_cycle(self):
+        now = [0.0]
+        changes = []
+        breaker = CircuitBreaker(
+            "store.steampowered.com",
+            failure_threshold=2,
+            reset_timeout=10,
+            clock=lambda: now[0],
+            on_change=lambda host, state: changes.append(state),
+        )
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CIRCUIT_CLOSED)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CIRCUIT_OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request()
+
+        now[0] = 11
+        breaker.before_request()  # 探测请求放行
+        self.assertEqual(breaker.state, CIRCUIT_HALF_OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request()  # 探测期间其余请求仍被拒绝
+
+        breaker.record_success()
+        self.assertEqual(breaker.state, CIRCUIT_CLOSED)
+        self.assertEqual(changes, [CIRCUIT_OPEN, CIRCUIT_HALF_OPEN, CIRCUIT_CLOSED])
+
+
+class TestResilientCaller(unittest.TestCase):
+    def setUp(self):
+        self.sleeps = []
+        self.caller = ResilientCaller(CircuitBreakerRegistry(failure_threshold=10), sleep=self.sleeps.append)
+
+    def test_idempotent_retries_5xx_then_succeeds(self):
+        responses = [FakeResponse(503), FakeResponse(502), FakeResponse(200)]
+        resp = self.caller.call("GET", "https://store.steampowered.com/api/appdetails", lambda: responses.pop(0))
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(self.sleeps), 2)
+
+    def test_non_idempotent_does_not_retry_read_timeout(self):
+        calls = []
+
+        def send():
+            calls.append(1)
+            raise requests.exceptions.ReadTimeout("slow")
+
+        with self.assertRaises(requests.exceptions.ReadTimeout):
+            self.caller.call("POST", "https://api.steampowered.com/x", send)
+        self.assertEqual(len(calls), 1)
+
+    def test_backoff_is_capped(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=4.0)
+        self.assertEqual(policy.delay_for(10, rng=lambda lo, hi: hi), 4.0)
+        self.assertEqual(policy.delay_for(2, rng=lambda lo, hi: hi), 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
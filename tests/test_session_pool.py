@@ -0,0 +1,98 @@
+import os
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Ensure repo root is in path so `import src.*` works
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from src.feature_core.adapters.http.base_urls import BaseUrlOverrides
+from src.feature_core.adapters.http.session_pool import SessionPool
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = self.path.encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestSessionPool(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.port = self.server.server_address[1]
+        self.pool = SessionPool(max_sessions_per_host=2, base_urls=BaseUrlOverrides({}))
+
+    def tearDown(self) -> None:
+        self.pool.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _url(self, host, path):
+        return f"http://{host}:{self.port}{path}"
+
+    def test_sequential_requests_reuse_one_connection_per_host(self):
+        for i in range(5):
+            self.assertEqual(self.pool.get(self._url("127.0.0.1", f"/a{i}"), timeout=5).text, f"/a{i}")
+        self.pool.get(self._url("localhost", "/b"), timeout=5)
+
+        stats = self.pool.stats()
+        a = stats[f"127.0.0.1:{self.port}"]
+        self.assertEqual((a["requests"], a["new_connections"], a["reused_connections"]), (5, 1, 4))
+        self.assertEqual(a["sessions_created"], 1)
+        # 不同 host 各自计数、各建各的连接
+        b = stats[f"localhost:{self.port}"]
+        self.assertEqual((b["requests"], b["new_connections"], b["reused_connections"]), (1, 1, 0))
+
+    def test_released_session_is_handed_out_again(self):
+        url = self._url("127.0.0.1", "/")
+        with self.pool.session_for(url) as first:
+            pass
+        with self.pool.session_for(url) as second:
+            self.assertIs(first, second)
+
+    def test_sessions_per_host_are_capped_and_waiters_block(self):
+        url = self._url("127.0.0.1", "/")
+        holding = threading.Barrier(3)
+        release = threading.Event()
+        acquired = []
+
+        def borrow():
+            with self.pool.session_for(url) as session:
+                acquired.append(session)
+                if len(acquired) <= 2:
+                    holding.wait()
+                    release.wait()
+
+        threads = [threading.Thread(target=borrow) for _ in range(3)]
+        for thread in threads[:2]:
+            thread.start()
+        holding.wait()
+        threads[2].start()
+        time.sleep(0.05)
+        # 第 3 个借用方在上限处等待，直到有 Session 归还
+        self.assertEqual(len(acquired), 2)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        stats = self.pool.stats()[f"127.0.0.1:{self.port}"]
+        self.assertEqual((stats["sessions_created"], stats["waits"]), (2, 1))
+        self.assertIn(acquired[2], acquired[:2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+
+# Ensure repo root is in path so `import src.*` works
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from src.feature_core.adapters.http.single_flight import AsyncSingleFlight, SingleFlight, request_key
+from src.feature_core.services.steam.task_cancellation import CancellationToken, TaskCancelled, bind_token, checkpoint
+
+
+class TestSingleFlight(unittest.TestCase):
+    def _run_concurrently(self, flight, key, fn, n=5):
+        results, errors = [], []
+        barrier = threading.Barrier(n)
+
+        def call():
+            barrier.wait()
+            try:
+                results.append(flight.do(key, fn))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(n)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return results, errors
+
+    def test_concurrent_identical_calls_share_one_execution(self):
+        flight = SingleFlight()
+        executed = []
+
+        def fetch():
+            executed.append(1)
+            time.sleep(0.1)
+            return {"ok": True}
+
+        key = request_key("get", "https://api.example/x", {"b": 2, "a": 1})
+        results, errors = self._run_concurrently(flight, key, fetch)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(executed), 1)
+        self.assertEqual(results, [{"ok": True}] * 5)
+        stats = flight.stats()
+        self.assertEqual((stats["calls"], stats["executed"], stats["shared"]), (5, 1, 4))
+        self.assertEqual(stats["shared_by_endpoint"], {"https://api.example/x": 4})
+
+        # 已完成的调用不缓存
+        flight.do(key, fetch)
+        self.assertEqual(len(executed), 2)
+
+    def test_errors_propagate_to_all_waiters(self):
+        flight = SingleFlight()
+
+        def fail():
+            time.sleep(0.1)
+            raise ConnectionError("boom")
+
+        results, errors = self._run_concurrently(flight, "k", fail, n=3)
+        self.assertEqual(results, [])
+        self.assertEqual(len(errors), 3)
+        self.assertTrue(all(isinstance(e, ConnectionError) for e in errors))
+
+    def test_followers_retry_when_leader_is_cancelled(self):
+        flight = SingleFlight()
+        leader_token, follower_token = CancellationToken(), CancellationToken()
+        started = threading.Event()
+        executed = []
+        outcome = {}
+
+        def fetch():
+            executed.append(1)
+            started.set()
+            time.sleep(0.1)
+            checkpoint()
+            return "ok"
+
+        def run(name, token):
+            with bind_token(token):
+                try:
+                    outcome[name] = flight.do("k", fetch)
+                except TaskCancelled as e:
+                    outcome[name] = e
+
+        leader = threading.Thread(target=run, args=("leader", leader_token))
+        leader.start()
+        started.wait()
+        followers = [threading.Thread(target=run, args=(f"f{i}", follower_token if i == 0 else None)) for i in range(3)]
+        for t in followers:
+            t.start()
+        time.sleep(0.02)
+        leader_token.cancel("closed")
+        follower_token.cancel("closed")
+        for t in [leader, *followers]:
+            t.join()
+
+        self.assertIsInstance(outcome.pop("leader"), TaskCancelled)
+        self.assertIsInstance(outcome.pop("f0"), TaskCancelled)
+        # 未取消的跟随方由其中一个接任发起方重新执行，另一个共享结果
+        self.assertEqual(outcome, {"f1": "ok", "f2": "ok"})
+        self.assertEqual(len(executed), 2)
+        self.assertEqual(flight.stats()["executed"], 2)
+
+    def test_request_key_ignores_param_order(self):
+        self.assertEqual(request_key("GET", "u", {"a": 1, "b": [1, 2]}), request_key("get", "u", {"b": [1, 2], "a": 1}))
+        self.assertNotEqual(request_key("GET", "u", {"a": 1}), request_key("GET", "u", {"a": 2}))
+
+    def test_async_single_flight(self):
+        flight = AsyncSingleFlight()
+        executed = []
+
+        async def fetch():
+            executed.append(1)
+            await asyncio.sleep(0.05)
+            return 42
+
+        async def main():
+            return await asyncio.gather(*(flight.do("k", fetch) for _ in range(4)))
+
+        self.assertEqual(asyncio.run(main()), [42] * 4)
+        self.assertEqual(len(executed), 1)
+        self.assertEqual(flight.stats()["shared"], 3)
+
+    def test_async_followers_retry_when_leader_is_cancelled(self):
+        flight = AsyncSingleFlight()
+        executed = []
+
+        async def fetch():
+            executed.append(1)
+            await asyncio.sleep(0.05)
+            return 42
+
+        async def main():
+            leader = asyncio.ensure_future(flight.do("k", fetch))
+            await asyncio.sleep(0)
+            followers = [asyncio.ensure_future(flight.do("k", fetch)) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await leader
+            return await asyncio.gather(*followers)
+
+        self.assertEqual(asyncio.run(main()), [42, 42])
+        self.assertEqual(len(executed), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Ensure repo root is in path so `import src.*` works
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from src.storage.sqlite_steam_repository import SqliteSteamRepository
+
+
+def _game(appid, minutes):
+    return {"appid": appid, "name": f"Game-{appid}", "playtime_forever": minutes, "playtime_2weeks": 0, "rtime_last_played": appid}
+
+
+def _price(final, discount=0):
+    return {"success": True, "data": {"price_overview": {"final": final, "discount_percent": discount}}, "fetched_at": 1.0}
+
+
+def _legacy_cache():
+    return {
+        "summary": {"personaname": "p"},
+        "games_accounts": {
+            "A": {"games": {"count": 2, "all_games": [_game(10, 5), _game(20, 50)]}, "summary": {"personaname": "p"}},
+            "B": {"games": {"count": 1, "all_games": [_game(30, 500)]}, "summary": None},
+        },
+        "games": {"count": 3, "all_games": [_game(10, 5), _game(20, 50), _game(30, 500)]},
+        "prices": {str(i): _price(100 + i) for i in range(100)},
+        "achievements": {"10": {"total": 5, "unlocked": 1}},
+        "wishlist": [{"appid": 40, "name": "W"}],
+        "free_game": {"updated_at": "2026-01-01T00:00:00", "items": [{"title": "Free", "url": "u"}]},
+        "refresh_state": {"summary": 1.0},
+    }
+
+
+class TestSqliteSteamRepository(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.json_file = os.path.join(self.tmp.name, "game_data.json")
+        self.db_file = os.path.join(self.tmp.name, "game_data.sqlite3")
+        with open(self.json_file, "w", encoding="utf-8") as f:
+            json.dump(_legacy_cache(), f)
+        self.repo = SqliteSteamRepository(self.db_file, self.json_file)
+
+    def tearDown(self) -> None:
+        self.repo.close()
+        self.tmp.cleanup()
+
+    def test_first_load_imports_json_losslessly(self):
+        self.assertEqual(self.repo.load_data(), _legacy_cache())
+        self.assertTrue(os.path.exists(self.json_file))
+
+        # 再次打开不会重复导入：以库中数据为准
+        with open(self.json_file, "w", encoding="utf-8") as f:
+            json.dump({"summary": {"personaname": "changed"}}, f)
+        reopened = SqliteSteamRepository(self.db_file, self.json_file)
+        self.assertEqual(reopened.load_data()["summary"], {"personaname": "p"})
+        reopened.close()
+
+    def test_price_changes_write_only_changed_rows(self):
+        cache = self.repo.load_data()
+        delta = {str(i): _price(1, 90) for i in range(50)}
+        cache["prices"].update(delta)
+
+        conn = self.repo._connection()
+        before = conn.total_changes
+        self.repo.save_changes(cache, {"prices": delta})
+        # 50 行价格 + 段标记 + initialized 标记
+        self.assertEqual(conn.total_changes - before, 52)
+        self.assertEqual(self.repo.load_data(), cache)
+
+        cache["wishlist"] = []
+        del cache["achievements"]
+        self.repo.save_changes(cache, {"wishlist": None, "achievements": None})
+        self.assertEqual(self.repo.load_data(), cache)
+
+    def test_games_by_playtime_uses_index(self):
+        self.repo.load_data()
+        top = self.repo.top_games_by_playtime(limit=2)
+        self.assertEqual([g["appid"] for g in top], [30, 20])
+        self.assertEqual([g["appid"] for g in self.repo.top_games_by_playtime(steam_id="A")], [20, 10])
+
+        plan = self.repo._connection().execute(
+            "EXPLAIN QUERY PLAN SELECT data FROM owned_games ORDER BY playtime_forever DESC LIMIT 2"
+        ).fetchall()
+        self.assertIn("idx_owned_games_playtime", " ".join(str(row) for row in plan))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+# Ensure repo root is in path so `import src.*` works
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from src.feature_core.adapters.http.cassette import Cassette, Interaction
+from src.feature_core.adapters.http.free_game_client import EpicFreeGamesClient
+from src.feature_core.adapters.http.rate_limiter import RateLimiterRegistry
+from src.feature_core.adapters.http.resilience import CircuitBreakerRegistry
+from src.feature_core.adapters.http.session_pool import SessionPool
+from src.feature_core.adapters.http.stand_in_server import MODE_RECORD, StandInServer
+from src.feature_core.adapters.http.steam_client import SteamClient
+
+
+PRICE_BODY = {"730": {"success": True, "data": {"price_overview": {"final": 0, "discount_percent": 0, "final_formatted": "免费"}}}}
+EPIC_BODY = {"data": {"Catalog": {"searchStore": {"elements": []}}}}
+
+
+def _cassette(path=None):
+    return Cassette(
+        path,
+        [
+            Interaction(
+                "GET",
+                "store.steampowered.com",
+                "/api/appdetails",
+                [("appids", "730"), ("filters", "price_overview"), ("cc", "cn"), ("l", "schinese")],
+                200,
+                {"Content-Type": "application/json"},
+                json.dumps(PRICE_BODY).encode("utf-8"),
+            ),
+            Interaction(
+                "GET",
+                "store-site-backend-static-ipv4.ak.epicgames.com",
+                "/freeGamesPromotions",
+                [("locale", "zh-CN"), ("country", "CN"), ("allowCountries", "CN")],
+                200,
+                {"Content-Type": "application/json"},
+                json.dumps(EPIC_BODY).encode("utf-8"),
+            ),
+        ],
+    )
+
+
+def _steam_client(overrides):
+    return SteamClient(
+        "secret-key",
+        session_pool=SessionPool(base_urls=overrides),
+        rate_limiter=RateLimiterRegistry({"store_appdetails": {"rate": 100, "burst": 100}}),
+        circuit_breakers=CircuitBreakerRegistry(failure_threshold=10),
+    )
+
+
+class TestStandInServer(unittest.TestCase):
+    def test_replay_serves_recorded_responses_with_latency(self):
+        with StandInServer(_cassette(), latency=0.05) as server:
+            client = _steam_client(server.overrides())
+            started = time.monotonic()
+            self.assertEqual(client.get_app_price([730]), PRICE_BODY)
+            self.assertGreaterEqual(time.monotonic() - started, 0.05)
+
+            epic = EpicFreeGamesClient(base_urls=server.overrides())
+            self.assertEqual(epic.fetch_promotions_raw(), EPIC_BODY)
+
+            self.assertFalse(client.get_app_price([999]))  # 未录制 -> 404
+            stats = server.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+
+    def test_injected_errors_are_retried_by_client(self):
+        with StandInServer(_cassette(), error_rate=1.0, error_status=503) as server:
+            client = _steam_client(server.overrides())
+            self.assertFalse(client.get_app_price([730]))
+            self.assertEqual(server.stats()["injected_errors"], 3)
+
+    def test_record_mode_captures_upstream_and_redacts_key(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "recorded.json")
+            with StandInServer(_cassette()) as upstream:
+                recorder = StandInServer(Cassette(path), mode=MODE_RECORD, upstream=upstream.overrides())
+                with recorder:
+                    pool = SessionPool(base_urls=recorder.overrides())
+                    params = {"appids": "730", "filters": "price_overview", "cc": "cn", "l": "schinese", "key": "secret-key"}
+                    response = pool.get("https://store.steampowered.com/api/appdetails", params=params, timeout=5)
+                    self.assertEqual(response.json(), PRICE_BODY)
+
+            replayed = Cassette.load(path)
+            self.assertEqual(len(replayed), 1)
+            with StandInServer(replayed) as server:
+                self.assertEqual(_steam_client(server.overrides()).get_app_price([730]), PRICE_BODY)
+            with open(path, encoding="utf-8") as f:
+                self.assertNotIn("secret-key", f.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import sys
+import unittest
+
+from PyQt6.QtCore import QCoreApplication, QObject, pyqtSignal
+
+# Ensure repo root is in path so `import src.*` works
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from src.feature_core.adapters.qt.steam_facade_qt import SteamFacadeQt
+
+app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+
+
+class _Config:
+    def __init__(self, values):
+        self._values = values
+
+    def get(self, key, default=None):
+        return self._values.get(key, default)
+
+
+class _Repository:
+    def set_error_handler(self, fn):
+        pass
+
+    def load_data(self):
+        return {}
+
+    def save_data(self, data):
+        pass
+
+    def save_changes(self, data, changes=None):
+        pass
+
+
+class _TaskService(QObject):
+    """记录提交与取消，不执行任务；结果由测试直接回传给 task_finished。"""
+
+    task_finished = pyqtSignal(dict)
+
+    def __init__(self):
+        super().__init__()
+        self.started = []
+        self.cancelled = []
+
+    def start_task(self, key, sid, task_type, extra_data=None, steam_id=None, priority=None, task_id=None):
+        self.started.append({"type": task_type, "extra_data": extra_data, "task_id": task_id, "steam_id": steam_id or sid})
+
+    def cancel_tasks(self, task_ids, reason="cancelled"):
+        self.cancelled.extend(task_ids)
+        return len(task_ids)
+
+
+def _prices(appids):
+    return {str(appid): {"success": True, "data": {"price_overview": {"final": 100, "discount_percent": 0}}} for appid in appids}
+
+
+class TestSteamFacadeJobs(unittest.TestCase):
+    def setUp(self) -> None:
+        self.service = _TaskService()
+        self.facade = SteamFacadeQt(
+            _Config({"steam_api_key": "key", "steam_id": "A"}), repository=_Repository(), task_service=self.service
+        )
+        self.service.started.clear()
+
+    def _finish(self, task, appids):
+        self.service.task_finished.emit(
+            {"type": task["type"], "data": _prices(appids), "error": None, "steam_id": "A", "task_id": task["task_id"]}
+        )
+
+    def test_overlapping_price_requests_extend_the_running_job(self):
+        self.facade.fetch_store_prices([1, 2, 3])
+        self.facade.fetch_store_prices([2, 3, 4, 5])
+        self.facade.fetch_store_prices([1, 5])
+
+        # 第二次请求只追加缺失的 appid，不取消在途任务；第三次已被覆盖，直接合并
+        self.assertEqual([t["extra_data"] for t in self.service.started], [[1, 2, 3], [4, 5]])
+        self.assertEqual(self.service.cancelled, [])
+        job = self.facade.job_journal.get("store_prices:A")
+        self.assertEqual(job["appids"], [1, 2, 3, 4, 5])
+
+        first, second = self.service.started
+        self._finish(second, [4, 5])
+        # 首个任务仍在途：作业保留，重启后可续传剩余条目
+        self.assertEqual(self.facade.job_journal.pending("store_prices:A"), [1, 2, 3])
+
+        self._finish(first, [1, 2, 3])
+        self.assertIsNone(self.facade.job_journal.get("store_prices:A"))
+        self.assertEqual(sorted(self.facade.cache["prices"]), ["1", "2", "3", "4", "5"])
+
+    def test_job_with_a_failed_task_is_kept_for_resume(self):
+        self.facade.fetch_achievements([1, 2])
+        self.facade.fetch_achievements([3])
+        first, second = self.service.started
+
+        self.service.task_finished.emit(
+            {"type": "achievements", "data": None, "error": "boom", "steam_id": "A", "task_id": first["task_id"]}
+        )
+        self.service.task_finished.emit(
+            {"type": "achievements", "data": {"3": {"total": 1, "unlocked": 1}}, "error": None, "steam_id": "A", "task_id": second["task_id"]}
+        )
+        self.assertEqual(self.facade.job_journal.pending("achievements:A"), [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
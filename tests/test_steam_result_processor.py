@@ -14,9 +14,12 @@ from src.feature_core.services.steam.price_service import SteamPriceService
 from src.feature_core.services.steam.wishlist_service import SteamWishlistService
 from src.feature_core.services.steam.achievement_service import SteamAchievementService
 from src.feature_core.services.steam.steam_result_processor import (
+    EmitAchievements,
     EmitError,
     EmitGamesStats,
     EmitPlayerSummary,
+    EmitProgress,
+    EmitStorePrices,
     SaveStep,
     SteamResultProcessor,
 )
@@ -129,11 +132,98 @@ class TestSteamResultProcessor(unittest.TestCase):
         # and the last step is actually EmitError
         self.assertIsInstance(o2.steps[-1], EmitError)
 
+    def test_batched_profiles_and_games_finalize_once(self):
+        self.aggregator.begin(["A", "B"], "A", batched_profiles=True)
+
+        profiles = {"type": "profiles", "steam_id": "A", "data": {"summaries": {"A": {"personaname": "p"}}}}
+        self.assertEqual(self.processor.process(profiles).steps, [])
+        self.assertEqual(self.processor.process({"type": "games", "steam_id": "A", "data": _game_payload(1)}).steps, [])
+
+        o3 = self.processor.process({"type": "games", "steam_id": "B", "data": _game_payload(2)})
+        self.assertEqual([type(s) for s in o3.steps], [EmitPlayerSummary, EmitGamesStats, SaveStep])
+        self.assertEqual(o3.steps[0].payload.get("personaname"), "p")
+        self.assertEqual(len(self.cache["games"]["all_games"]), 2)
+
+    def test_superseded_round_results_are_merged_or_dropped(self):
+        g1 = self.aggregator.begin(["A", "B"], "A", batched_profiles=True)
+        self.processor.process({"type": "games", "steam_id": "A", "data": _game_payload(1), "generation": g1})
+
+        # 新一轮开始：B 的迟到结果并入，重复的 A 结果与上一轮的 profiles 被丢弃
+        g2 = self.aggregator.begin(["A", "B"], "A", batched_profiles=True)
+        self.processor.process({"type": "games", "steam_id": "B", "data": _game_payload(2), "generation": g1})
+        stale_profiles = {"type": "profiles", "data": {"summaries": {"A": {"personaname": "old"}}}, "generation": g1}
+        self.assertEqual(self.processor.process(stale_profiles).steps, [])
+        self.assertEqual(self.aggregator.pending_keys(), {"A", "__profiles__"})
+
+        self.processor.process({"type": "games", "steam_id": "A", "data": _game_payload(1), "generation": g2})
+        self.assertEqual(self.processor.process({"type": "games", "steam_id": "A", "data": _game_payload(3)}).steps, [])
+        done = self.processor.process({"type": "profiles", "data": {"summaries": {"A": {"personaname": "new"}}}, "generation": g2})
+        self.assertEqual(done.steps[0].payload.get("personaname"), "new")
+        self.assertEqual(self.aggregator.stats, {"merged_late": 1, "dropped": 2})
+
     def test_data_none_produces_no_steps(self):
         result = {"type": "summary", "data": None}
         outcome = self.processor.process(result)
         self.assertEqual(outcome.steps, [])
 
+    def test_store_prices_are_stamped_and_planned_by_ttl(self):
+        now = [1000.0]
+        price_service = SteamPriceService(sale_ttl_seconds=10, regular_ttl_seconds=100, clock=lambda: now[0])
+        processor = SteamResultProcessor(
+            cache=self.cache,
+            games_aggregator=self.aggregator,
+            get_primary_id=lambda: self.primary_id,
+            games_aggregation_service=SteamGamesAggregationService(),
+            profile_service=SteamProfileService(),
+            price_service=price_service,
+            wishlist_service=SteamWishlistService(),
+            achievement_service=SteamAchievementService(),
+        )
+        sale = {"success": True, "data": {"price_overview": {"final": 100, "discount_percent": 50}}}
+        regular = {"success": True, "data": {"price_overview": {"final": 200, "discount_percent": 0}}}
+        processor.process({"type": "store_prices", "data": {"1": sale, "2": regular}})
+        self.assertEqual(self.cache["prices"]["1"]["fetched_at"], 1000.0)
+
+        self.assertEqual(price_service.plan_refresh(self.cache, [1, 2, 3]), [3])
+        now[0] += 50
+        self.assertEqual(price_service.plan_refresh(self.cache, [1, 2, 3, 3]), [1, 3])
+        now[0] += 100
+        self.assertEqual(price_service.plan_refresh(self.cache, [1, 2]), [1, 2])
+
+    def test_partial_achievements_emit_without_save(self):
+        partial = {"type": "achievements", "data": {"10": {"total": 5, "unlocked": 1}}, "partial": True}
+        o1 = self.processor.process(partial)
+        self.assertEqual([type(s) for s in o1.steps], [EmitAchievements])
+        self.assertEqual(self.cache["achievements"]["10"]["unlocked"], 1)
+
+        final = {"type": "achievements", "data": {"10": {"total": 5, "unlocked": 1}, "20": {"total": 0, "unlocked": 0}}}
+        o2 = self.processor.process(final)
+        self.assertEqual([type(s) for s in o2.steps], [EmitAchievements, SaveStep])
+        self.assertIn("20", self.cache["achievements"])
+
+    def test_progress_is_emitted_after_partial_data(self):
+        progress = {"done": 20, "total": 60, "elapsed": 2.0, "eta": 4.0}
+        partial = {"type": "store_prices", "data": {"1": {"success": True}}, "partial": True, "task_id": 5, "progress": progress}
+        o1 = self.processor.process(partial)
+        self.assertEqual([type(s) for s in o1.steps], [EmitStorePrices, EmitProgress])
+        self.assertEqual(o1.steps[1].payload, {"type": "store_prices", "task_id": 5, **progress})
+
+        # 最终结果只带尚未回传的剩余条目，缓存中保留之前各批的数据
+        final = {"type": "store_prices", "data": {"2": {"success": True}}, "progress": {**progress, "done": 60, "eta": 0.0}}
+        o2 = self.processor.process(final)
+        self.assertEqual([type(s) for s in o2.steps], [EmitStorePrices, EmitProgress, SaveStep])
+        self.assertEqual(sorted(self.cache["prices"]), ["1", "2"])
+
+    def test_save_step_carries_changes_accumulated_since_last_save(self):
+        self.processor.process({"type": "store_prices", "data": {"1": {"success": True}}, "partial": True})
+        self.processor.process({"type": "store_prices", "data": {"2": {"success": True}}, "partial": True})
+        final = self.processor.process({"type": "store_prices", "data": {"3": {"success": True}}})
+        self.assertEqual(sorted(final.steps[-1].changes["prices"]), ["1", "2", "3"])
+
+        summary = self.processor.process({"type": "summary", "data": {"personaname": "p"}})
+        self.assertEqual(summary.steps[-1].changes, {"summary": None})
+        self.assertEqual(self.processor.take_changes(), {})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,214 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from PyQt6.QtCore import QCoreApplication
+
+# Ensure repo root is in path so `import src.*` works
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from src.feature_core.adapters.qt import steam_task_service_async_qt, steam_task_service_qt
+from src.feature_core.adapters.qt.steam_task_service_async_qt import SteamTaskServiceAsyncQt
+from src.feature_core.adapters.qt.steam_task_service_qt import SteamTaskServiceQt
+from src.feature_core.adapters.qt.steam_worker_qt import SteamTask
+
+app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+
+
+class _SlowTask:
+    """替代 SteamTask：记录同时运行的任务数。"""
+
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def __init__(self, client, steam_id, task_type, extra_data=None, max_in_flight=1, app_catalog=None, emit=None, task_id=None, cancel_token=None, executor=None):
+        self.steam_id = steam_id
+        self.task_type = task_type
+        self.emit = emit
+        self.task_id = task_id
+
+    def run(self):
+        with _SlowTask.lock:
+            _SlowTask.running += 1
+            _SlowTask.peak = max(_SlowTask.peak, _SlowTask.running)
+        time.sleep(0.05)
+        with _SlowTask.lock:
+            _SlowTask.running -= 1
+        self.emit({"type": self.task_type, "data": {}, "error": None, "steam_id": self.steam_id, "task_id": self.task_id})
+
+
+class _AchievementClient:
+    """只实现成就请求：记录同时在途的请求数。"""
+
+    api_key = "key"
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def get_player_achievements(self, steam_id, appid):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight -= 1
+        return {"achievements": [{"achieved": 1}]}
+
+
+class _SlowAsyncAchievementClient:
+    """替代 AsyncSteamClient：每个成就请求耗时 50ms，记录已发起的请求。"""
+
+    calls = []
+
+    def __init__(self, api_key, http, **kwargs):
+        pass
+
+    async def get_player_achievements(self, steam_id, appid):
+        _SlowAsyncAchievementClient.calls.append(appid)
+        await asyncio.sleep(0.05)
+        return {"achievements": []}
+
+
+class TestSteamTaskPool(unittest.TestCase):
+    def _wait_for(self, predicate, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not predicate() and time.monotonic() < deadline:
+            QCoreApplication.processEvents()
+            time.sleep(0.01)
+
+    @patch.object(steam_task_service_qt, "SteamTask", _SlowTask)
+    def test_pool_bounds_concurrency_and_delivers_on_main_thread(self):
+        service = SteamTaskServiceQt(pool_size=2)
+        received = []
+        service.task_finished.connect(lambda result: received.append((result["steam_id"], threading.current_thread())))
+
+        for i in range(8):
+            service.start_task("key", str(i), "summary")
+        self._wait_for(lambda: len(received) == 8)
+        service.shutdown()
+
+        self.assertEqual(len(received), 8)
+        self.assertTrue(all(thread is threading.main_thread() for _, thread in received))
+        self.assertLessEqual(_SlowTask.peak, 2)
+        stats = service.pool_stats()
+        self.assertEqual((stats["submitted"], stats["completed"], stats["running"]), (8, 8, 0))
+        self.assertGreaterEqual(stats["max_queued"], 6)
+        self.assertGreater(stats["wait_max"], 0.0)
+
+    @patch.object(steam_task_service_qt, "SteamTask", _SlowTask)
+    def test_shutdown_drops_queued_tasks_and_rejects_new_ones(self):
+        service = SteamTaskServiceQt(pool_size=1)
+        for i in range(5):
+            service.start_task("key", str(i), "summary")
+        service.shutdown(timeout=2.0)
+        service.start_task("key", "late", "summary")
+
+        stats = service.pool_stats()
+        self.assertEqual(stats["running"], 0)
+        self.assertLess(stats["completed"], 5)
+        self.assertEqual(stats["submitted"], 5)
+
+    @patch.object(steam_task_service_qt, "SteamTask", _SlowTask)
+    def test_cancelled_queued_tasks_are_skipped_with_one_marker(self):
+        service = SteamTaskServiceQt(pool_size=1)
+        received = []
+        service.task_finished.connect(received.append)
+
+        for i in range(4):
+            service.start_task("key", str(i), "summary", task_id=i)
+        self.assertEqual(service.cancel_tasks([2, 3, 99]), 2)
+        self.assertEqual(service.cancel_tasks([2]), 0)
+        self._wait_for(lambda: len(received) == 4)
+        service.shutdown()
+
+        by_id = {r["task_id"]: r for r in received}
+        self.assertEqual(sorted(by_id), [0, 1, 2, 3])
+        self.assertTrue(by_id[3].get("cancelled"))
+        self.assertEqual(by_id[3]["reason"], "cancelled")
+        self.assertNotIn("cancelled", by_id[0])
+        self.assertEqual(service.pool_stats()["cancelled_queued"], 2)
+
+
+    def test_async_backend_reports_the_same_pool_stats(self):
+        service = SteamTaskServiceAsyncQt(max_concurrent_tasks=2)
+        received = []
+        service.task_finished.connect(received.append)
+
+        for i in range(3):
+            service.start_task("", str(i), "summary", task_id=i)
+        self._wait_for(lambda: len(received) == 3)
+        stats = service.pool_stats()
+        service.shutdown()
+
+        thread_service = SteamTaskServiceQt(pool_size=1)
+        self.assertEqual(set(stats), set(thread_service.pool_stats()))
+        thread_service.shutdown()
+        self.assertEqual((stats["submitted"], stats["completed"], stats["running"], stats["pool_size"]), (3, 3, 0, 2))
+        self.assertEqual(received[0]["error"], "Missing API Key or Steam ID")
+
+
+    def test_async_start_task_after_shutdown_does_not_restart_the_loop(self):
+        service = SteamTaskServiceAsyncQt()
+        service.start_task("", "1", "summary")
+        service.shutdown()
+        service.start_task("", "2", "summary")
+
+        self.assertIsNone(service._loop)
+        self.assertFalse(any(t.name == "steam-asyncio" and t.is_alive() for t in threading.enumerate()))
+        self.assertEqual(service.pool_stats()["submitted"], 1)
+
+
+    def test_achievement_fanout_shares_one_bounded_executor(self):
+        client = _AchievementClient()
+        results = []
+        with ThreadPoolExecutor(max_workers=2) as shared:
+            tasks = [
+                SteamTask(client, "1", "achievements", list(range(12)), max_in_flight=4, emit=results.append, executor=shared)
+                for _ in range(3)
+            ]
+            threads = [threading.Thread(target=task.run) for task in tasks]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # 3 个任务 × max_in_flight=4，但同时在途的请求不超过共享线程池的大小
+        self.assertLessEqual(client.peak, 2)
+        finals = [r for r in results if not r.get("partial")]
+        self.assertEqual(len(finals), 3)
+        self.assertTrue(all(r["error"] is None for r in finals))
+
+
+    @patch.object(steam_task_service_async_qt, "AsyncSteamClient", _SlowAsyncAchievementClient)
+    def test_async_cancel_stops_pending_achievement_fetches(self):
+        _SlowAsyncAchievementClient.calls = []
+        service = SteamTaskServiceAsyncQt(achievement_concurrency=2)
+        received = []
+        service.task_finished.connect(received.append)
+
+        service.start_task("key", "1", "achievements", list(range(20)), task_id=1)
+        self._wait_for(lambda: len(_SlowAsyncAchievementClient.calls) >= 2)
+        self.assertEqual(service.cancel_tasks([1]), 1)
+        self._wait_for(lambda: any(r.get("cancelled") for r in received))
+        issued = len(_SlowAsyncAchievementClient.calls)
+        time.sleep(0.3)
+        service.shutdown()
+
+        # 取消后不再发起新的请求
+        self.assertEqual(len(_SlowAsyncAchievementClient.calls), issued)
+        self.assertLess(issued, 20)
+        self.assertTrue(received[-1]["cancelled"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import requests
+
+# Ensure repo root is in path so `import src.*` works
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from src.feature_core.adapters.http import resilience
+from src.feature_core.adapters.http.rate_limiter import RateLimiterRegistry
+from src.feature_core.adapters.http.single_flight import SingleFlight
+from src.feature_core.adapters.http.steam_client import SteamClient
+from src.feature_core.adapters.qt.steam_worker_qt import SteamTask
+from src.feature_core.services.steam.task_cancellation import (
+    CancellationToken,
+    TaskCancelled,
+    bind_token,
+    cancellable_sleep,
+    checkpoint,
+    propagate_token,
+)
+
+
+class _PriceClient:
+    """每次价格请求前走检查点（与 SteamClient._http_get 一致），第二块请求时触发取消。"""
+
+    api_key = "key"
+
+    def __init__(self, token):
+        self.token = token
+        self.calls = 0
+
+    def get_app_price(self, chunk):
+        checkpoint()
+        self.calls += 1
+        if self.calls == 2:
+            self.token.cancel("window_closed")
+        return {str(a): {"success": True, "data": {}} for a in chunk}
+
+
+class _FailingPool:
+    """每次请求都建连失败，触发重试退避。"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        raise requests.exceptions.ConnectionError("refused")
+
+
+class TestTaskCancellation(unittest.TestCase):
+    def test_checkpoint_follows_bound_token_across_threads(self):
+        token = CancellationToken()
+        checkpoint()  # 未绑定令牌：无操作
+        with bind_token(token):
+            checkpoint()
+            self.assertTrue(token.cancel("quit"))
+            self.assertFalse(token.cancel("again"))
+            with self.assertRaises(TaskCancelled):
+                cancellable_sleep(30)  # 已取消：立即返回并抛出
+
+            errors = []
+
+            def worker():
+                try:
+                    checkpoint()
+                except TaskCancelled as e:
+                    errors.append(str(e))
+
+            thread = threading.Thread(target=propagate_token(worker))
+            thread.start()
+            thread.join()
+        self.assertEqual(errors, ["quit"])
+        checkpoint()  # 退出 bind_token 后恢复
+
+    def test_steam_task_stops_between_chunks_and_emits_single_final_marker(self):
+        token = CancellationToken()
+        client = _PriceClient(token)
+        emitted = []
+        task = SteamTask(client, "1", "store_prices", list(range(100)), emit=emitted.append, task_id=7, cancel_token=token)
+        task.run()
+
+        self.assertEqual(client.calls, 2)  # 5 块中只发出了 2 块
+        # 取消前完成的第一块照常回传；取消后不再有 partial，只有一条 cancelled 最终结果
+        self.assertEqual([r.get("partial", False) for r in emitted], [True, False])
+        self.assertEqual(emitted[0]["progress"]["done"], 20)
+        final = emitted[-1]
+        self.assertTrue(final["cancelled"])
+        self.assertEqual((final["task_id"], final["reason"], final["data"]), (7, "window_closed", None))
+
+
+    @patch.object(resilience.RetryPolicy, "delay_for", lambda self, attempt, rng=None: 5.0)
+    def test_retry_backoff_is_interrupted_by_cancellation(self):
+        pool = _FailingPool()
+        client = SteamClient(
+            "key",
+            session_pool=pool,
+            rate_limiter=RateLimiterRegistry(),
+            circuit_breakers=resilience.CircuitBreakerRegistry(failure_threshold=10),
+            single_flight=SingleFlight(),
+        )
+        token = CancellationToken()
+        threading.Timer(0.1, token.cancel, args=("shutdown",)).start()
+
+        started = time.monotonic()
+        with bind_token(token), self.assertRaises(TaskCancelled):
+            client._http_get("store", "https://store.steampowered.com/api/appdetails", timeout=5)
+        # 退避 5 秒期间被取消：立即返回，不再发起下一次尝试
+        self.assertLess(time.monotonic() - started, 2.0)
+        self.assertEqual(pool.calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
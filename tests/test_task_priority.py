@@ -0,0 +1,64 @@
+import os
+import sys
+import unittest
+
+# Ensure repo root is in path so `import src.*` works
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from src.feature_core.services.steam.task_priority import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_VISIBLE,
+    PriorityTaskQueue,
+    normalize_priority,
+)
+
+
+class TestPriorityTaskQueue(unittest.TestCase):
+    def setUp(self):
+        self.now = [0.0]
+        self.queue = PriorityTaskQueue(aging_seconds=10.0, clock=lambda: self.now[0])
+
+    def _drain(self):
+        items = []
+        while True:
+            entry = self.queue.get_nowait()
+            if entry is None:
+                return items
+            items.append(entry[0])
+
+    def test_higher_class_first_then_fifo(self):
+        for i in range(3):
+            self.queue.put(f"price-{i}", PRIORITY_VISIBLE)
+        self.queue.put("startup", PRIORITY_BACKGROUND)
+        self.queue.put("click", PRIORITY_INTERACTIVE)
+        self.assertEqual(self._drain(), ["click", "price-0", "price-1", "price-2", "startup"])
+
+    def test_aging_prevents_starvation(self):
+        self.queue.put("startup", PRIORITY_BACKGROUND)
+        self.now[0] = 25.0  # 等待 25s：有效优先级 2 - 2.5 < 0
+        self.queue.put("click", PRIORITY_INTERACTIVE)
+        self.queue.put("price", PRIORITY_VISIBLE)
+        self.assertEqual(self._drain(), ["startup", "click", "price"])
+
+        stats = self.queue.stats()
+        self.assertEqual(stats["background"]["dequeued"], 1)
+        self.assertEqual(stats["background"]["wait_max"], 25.0)
+        self.assertEqual(stats["interactive"]["wait_avg"], 0.0)
+
+    def test_close_discards_and_rejects(self):
+        self.queue.put("a", PRIORITY_VISIBLE)
+        self.assertEqual(self.queue.close(), ["a"])
+        self.assertFalse(self.queue.put("b"))
+        self.assertIsNone(self.queue.get(timeout=0.01))
+
+    def test_normalize_priority(self):
+        self.assertEqual(normalize_priority("interactive"), PRIORITY_INTERACTIVE)
+        self.assertEqual(normalize_priority(7), PRIORITY_BACKGROUND)
+        self.assertEqual(normalize_priority(None), PRIORITY_BACKGROUND)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import os
+import sys
+import unittest
+
+# Ensure repo root is in path so `import src.*` works
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from src.feature_core.services.steam.task_progress import ProgressTracker
+
+
+class TestProgressTracker(unittest.TestCase):
+    def test_reports_every_k_items_or_interval_with_eta(self):
+        now = [0.0]
+        tracker = ProgressTracker(10, every=4, min_interval=5.0, clock=lambda: now[0])
+
+        now[0] = 1.0
+        self.assertIsNone(tracker.advance(3))
+        now[0] = 2.0
+        first = tracker.advance()  # 满 4 条
+        self.assertEqual((first["done"], first["total"], first["eta"]), (4, 10, 3.0))
+
+        now[0] = 8.0
+        self.assertEqual(tracker.advance()["done"], 5)  # 间隔超过 5 秒
+        self.assertIsNone(tracker.advance())
+        last = tracker.advance(20)  # 全部完成总会回传，done 不超过 total
+        self.assertEqual((last["done"], last["eta"]), (10, 0.0))
+
+    def test_unknown_eta_before_first_item(self):
+        self.assertIsNone(ProgressTracker(3).snapshot()["eta"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import sys
+import unittest
+
+# Ensure repo root is in path so `import src.*` works
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from src.feature_core.services.steam.task_results import (
+    PRICE_CHUNK,
+    STREAM_FLUSH_COUNT,
+    StreamBatcher,
+    cancelled_result,
+    fill_unknown_names,
+    new_result,
+    partial_result,
+    price_chunks,
+)
+
+
+class _Catalog:
+    def resolve_names(self, appids):
+        return {appid: f"Cat-{appid}" for appid in appids if appid != "3"}
+
+
+class TestTaskResults(unittest.TestCase):
+    def test_batcher_streams_partials_and_returns_remainder(self):
+        emitted = []
+        total = STREAM_FLUSH_COUNT + 3
+        batcher = StreamBatcher(total, lambda data, progress: emitted.append((dict(data), progress)))
+        for appid in range(total):
+            batcher.add_achievement(appid, None)
+
+        remainder, progress = batcher.finish()
+        streamed = sum(len(data) for data, _ in emitted) + len(remainder)
+        self.assertEqual(streamed, total)
+        self.assertEqual(emitted[-1][1]["done"], total)
+        self.assertEqual(progress["done"], total)
+
+    def test_result_shapes(self):
+        base = new_result("store_prices", "1", task_id=7)
+        partial = partial_result({**base, "progress": {"done": 1}}, {"1": {}}, None)
+        self.assertTrue(partial["partial"])
+        self.assertNotIn("progress", partial)
+        self.assertEqual(partial["task_id"], 7)
+
+        cancelled = cancelled_result({**base, "data": {"x": 1}}, "closed")
+        self.assertEqual((cancelled["data"], cancelled["cancelled"], cancelled["reason"]), (None, True, "closed"))
+
+        self.assertEqual([len(c) for c in price_chunks(list(range(PRICE_CHUNK + 1)))], [PRICE_CHUNK, 1])
+
+    def test_fill_unknown_names_only_touches_unknown_entries(self):
+        data = {"1": {"name": "Unknown"}, "2": {"name": "Known"}, "3": {"name": ""}}
+        fill_unknown_names(_Catalog(), data)
+        self.assertEqual([data[k]["name"] for k in ("1", "2", "3")], ["Cat-1", "Known", ""])
+        fill_unknown_names(None, data)
+
+
+if __name__ == "__main__":
+    unittest.main()
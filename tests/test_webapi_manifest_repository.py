@@ -0,0 +1,92 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+# Ensure repo root is in path so `import src.*` works
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from src.storage.webapi_manifest_repository import DEFAULT_MANIFEST_TTL_SECONDS, WebApiManifestRepository
+
+
+def _manifest(tag="v1"):
+    return {"apilist": {"interfaces": [{"name": "ISteamUser", "tag": tag}]}}
+
+
+class TestWebApiManifestRepository(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "webapi_manifest.json")
+        self.now = [1000.0]
+        self.repo = WebApiManifestRepository(self.path, clock=lambda: self.now[0])
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_manifest_expires_after_seven_days(self):
+        self.repo.save("key", _manifest())
+        self.now[0] += DEFAULT_MANIFEST_TTL_SECONDS - 1
+        self.assertEqual(self.repo.load("key"), _manifest())
+
+        # 重新打开（只读磁盘）时同样按 fetched_at 判断
+        reopened = WebApiManifestRepository(self.path, clock=lambda: self.now[0])
+        self.assertEqual(reopened.load("key"), _manifest())
+
+        self.now[0] += 1
+        self.assertIsNone(self.repo.load("key"))
+
+    def test_changed_api_key_invalidates_cache(self):
+        self.repo.save("old-key", _manifest())
+        self.assertIsNone(self.repo.load("new-key"))
+        with open(self.path, encoding="utf-8") as f:
+            self.assertNotIn("old-key", f.read())
+
+        fetched = []
+        manifest = self.repo.get_or_fetch("new-key", lambda: fetched.append(1) or _manifest("v2"))
+        self.assertEqual(manifest, _manifest("v2"))
+        self.assertEqual(len(fetched), 1)
+        self.assertIsNone(self.repo.load("old-key"))
+
+    def test_concurrent_get_or_fetch_downloads_once_outside_the_lock(self):
+        started = threading.Event()
+        release = threading.Event()
+        fetched = []
+
+        def fetch():
+            fetched.append(1)
+            started.set()
+            release.wait(5)
+            return _manifest()
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.repo.get_or_fetch("key", fetch))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        started.wait(5)
+
+        # 下载进行中：读写缓存不被阻塞
+        begin = time.monotonic()
+        self.assertIsNone(self.repo.load("other-key"))
+        self.assertLess(time.monotonic() - begin, 1.0)
+
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(fetched), 1)
+        self.assertEqual(results, [_manifest()] * 4)
+        # 每个调用方拿到独立副本（load_interfaces 会原地修改）
+        results[0]["apilist"]["interfaces"].clear()
+        self.assertEqual(self.repo.load("key"), _manifest())
+
+    def test_failed_download_is_retried_by_next_caller(self):
+        self.assertEqual(self.repo.get_or_fetch("key", lambda: {}), {})
+        self.assertIsNone(self.repo.load("key"))
+        self.assertEqual(self.repo.get_or_fetch("key", _manifest), _manifest())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import os
+import sys
+import unittest
+
+# Ensure repo root is in path so `import src.*` works
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from src.feature_core.adapters.http.steam_client import WISHLIST_PRICE_CHUNK, SteamClient
+from src.feature_core.services.steam.wishlist_discount_service import DiscountedWishlistStream
+
+
+def _price(discount):
+    return {"success": True, "data": {"price_overview": {"discount_percent": discount, "final_formatted": f"-{discount}%"}}}
+
+
+class _FakeWishlistClient(SteamClient):
+    """只替换网络调用，保留 iter_wishlist 的流水线逻辑。"""
+
+    def __init__(self, discounts):
+        super().__init__("key")
+        self.discounts = discounts
+        self.name_lookups = []
+        self.name_batches = 0
+
+    def _ensure_api(self):
+        pass
+
+    def get_wishlist_app(self, steam_id):
+        return list(self.discounts)
+
+    def get_game_followed(self, steam_id):
+        return []
+
+    def get_app_price(self, app_ids):
+        return {str(a): _price(self.discounts[a]) for a in app_ids}
+
+    def get_apps_info(self, app_ids):
+        self.name_lookups.extend(app_ids)
+        self.name_batches += 1
+        return {str(a): {"name": f"Game-{a}", "capsule": f"c{a}"} for a in app_ids}
+
+
+class TestWishlistPipeline(unittest.TestCase):
+    def test_only_discounted_items_resolve_names(self):
+        discounts = {appid: (50 if appid % 30 == 0 else 0) for appid in range(1, 121)}
+        client = _FakeWishlistClient(discounts)
+
+        merged = {}
+        for entries in client.iter_wishlist("1", max_in_flight=4):
+            merged.update(entries)
+
+        self.assertEqual(len(merged), 120)
+        self.assertEqual(sorted(client.name_lookups, key=int), ["30", "60", "90", "120"])
+        self.assertEqual(merged["30"]["name"], "Game-30")
+        self.assertEqual(merged["1"]["name"], "Unknown")
+
+        full = _FakeWishlistClient({1: 0, 2: 10}).get_wishlist("1")
+        self.assertEqual(full["1"]["name"], "Game-1")
+
+    def test_names_are_resolved_once_per_price_chunk(self):
+        client = _FakeWishlistClient({appid: 10 for appid in range(1, 121)})
+        merged = {}
+        for entries in client.iter_wishlist("1", max_in_flight=4):
+            merged.update(entries)
+
+        self.assertEqual(len(client.name_lookups), 120)
+        self.assertEqual(client.name_batches, -(-120 // WISHLIST_PRICE_CHUNK))
+        self.assertEqual(merged["77"]["name"], "Game-77")
+
+    def test_stream_emits_on_change_with_min_interval(self):
+        now = [0.0]
+        stream = DiscountedWishlistStream(limit=2, min_interval=1.0, clock=lambda: now[0])
+        entry = lambda d: {"subs": [{"discount_pct": d, "price": ""}], "name": "n", "capsule": ""}
+
+        self.assertIsNone(stream.add({"1": entry(0)}))
+        self.assertEqual([i["appid"] for i in stream.add({"2": entry(20)})], ["2"])
+        self.assertIsNone(stream.add({"3": entry(30)}))  # 间隔不足
+        now[0] = 2.0
+        self.assertEqual([i["appid"] for i in stream.add({"4": entry(40)})], ["4", "3"])
+        self.assertIsNone(stream.add({"5": entry(5)}))  # 前 2 项未变化
+        self.assertEqual([i["appid"] for i in stream.result()], ["4", "3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+from PyQt6.QtCore import QCoreApplication
+
+# Ensure repo root is in path so `import src.*` works
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
+
+from src.feature_core.adapters.qt.write_behind_repository_qt import WriteBehindRepositoryQt
+from src.feature_core.app.background_executor import BackgroundExecutor
+from src.storage.steam_repository import SteamRepository
+
+app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+
+
+class _FlakyIncrementalRepository:
+    """增量快照仓库：首次 snapshot 抛错，记录每次收到的变更集。"""
+
+    snapshots_are_complete = False
+
+    def __init__(self):
+        self.changes = []
+        self.written = []
+
+    def snapshot(self, data, changes=None):
+        self.changes.append(changes)
+        if len(self.changes) == 1:
+            raise RuntimeError("boom")
+        return dict(data)
+
+    def write_snapshot(self, snapshot):
+        self.written.append(snapshot)
+        return True
+
+
+class TestWriteBehindRepository(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "config", "game_data.json")
+        self.executor = BackgroundExecutor()
+        self.repo = WriteBehindRepositoryQt(SteamRepository(self.path), executor=self.executor, debounce_ms=20)
+
+    def tearDown(self) -> None:
+        self.executor.shutdown()
+        self.tmp.cleanup()
+
+    def _wait_for(self, predicate, timeout=3.0):
+        deadline = time.monotonic() + timeout
+        while not predicate() and time.monotonic() < deadline:
+            QCoreApplication.processEvents()
+            time.sleep(0.005)
+
+    def test_saves_within_debounce_window_coalesce_into_one_atomic_write(self):
+        cache = {"prices": {}}
+        for i in range(40):
+            cache["prices"][str(i)] = {"final": i}
+            self.repo.save_data(cache)
+        self.assertFalse(os.path.exists(self.path))
+
+        self._wait_for(lambda: self.repo.stats()["written"] == 1)
+        self.assertEqual(self.repo.stats(), {"requested": 40, "written": 1, "skipped": 0})
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(len(json.load(f)["prices"]), 40)
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["game_data.json"])
+
+    def test_flush_writes_pending_snapshot_synchronously(self):
+        cache = {"summary": {"personaname": "p"}}
+        self.repo.save_data(cache)
+        self.repo.flush()
+        cache["summary"]["personaname"] = "changed-after-flush"
+
+        self.assertEqual(self.repo.load_data(), {"summary": {"personaname": "p"}})
+        self.repo.flush()
+        self.assertEqual(self.repo.stats()["written"], 1)
+
+    def test_failed_snapshot_keeps_changes_and_falls_back_to_full_save(self):
+        inner = _FlakyIncrementalRepository()
+        repo = WriteBehindRepositoryQt(inner, executor=self.executor, debounce_ms=20)
+        cache = {"prices": {"1": {"final": 1}}}
+        repo.save_changes(cache, {"prices": {"1": cache["prices"]["1"]}})
+        repo.flush()
+        self.assertEqual(inner.written, [])
+
+        cache["prices"]["2"] = {"final": 2}
+        repo.save_changes(cache, {"prices": {"2": cache["prices"]["2"]}})
+        repo.flush()
+        # 失败那次的变更没有丢：第二次快照改为全量
+        self.assertEqual(inner.changes[1], None)
+        self.assertEqual(inner.written, [{"prices": {"1": {"final": 1}, "2": {"final": 2}}}])
+
+
+if __name__ == "__main__":
+    unittest.main()